@@ -0,0 +1,134 @@
+"""
+Benchmark of asynchronous summarization.
+========================================
+
+The script generates synthetic PDF-articles and a tiny random-weight seq2seq
+model locally and compares `ArticleSummarizer.summarize_many`, which prepares
+all articles of a batch before generating, with `asummarize_many`, which
+extracts and tokenizes the next articles while the current batch is generated.
+It also measures the largest delay of an event loop timer while each of them
+is running, which shows how long the loop is blocked.
+
+Usage:
+    python -m benchmarks.bench_async --num-articles=32 --batch-size=4 --executor=thread
+
+Arguments:
+    --num-articles (int, optional): Number of articles to summarize.
+    --batch-size (int, optional): Number of articles per `generate` call.
+    --max-pending (int, optional): Maximum number of articles prepared in advance.
+    --executor (str, optional): Executor preparing articles ("default", "thread" or "process").
+    --num-workers (int, optional): Number of workers of the executor.
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from deep_compend import ArticleSummarizer, SummaryGenerationConfig
+
+from .fixtures import make_synthetic_pdfs, make_tiny_seq2seq
+
+# Interval of the event loop timer in seconds
+TICK_INTERVAL = 0.005
+
+# Defining Arguments parser
+parser = argparse.ArgumentParser(description="Asynchronous API benchmark.")
+parser.add_argument("--num-articles", type=int, default=32)
+parser.add_argument("--batch-size", type=int, default=4)
+parser.add_argument("--max-pending", type=int, default=8)
+parser.add_argument(
+    "--executor",
+    type=str,
+    choices=["default", "thread", "process"],
+    default="thread",
+)
+parser.add_argument("--num-workers", type=int, default=2)
+
+
+async def measure_loop_lag(run) -> tuple[float, float]:
+    """Runs a coroutine while measuring the delays of an event loop timer.
+
+    Args:
+        run (Callable[[], Awaitable]): Function creating the measured coroutine.
+
+    Returns:
+        tuple[float, float]: Elapsed time and the largest timer delay in seconds.
+    """
+    max_lag = 0.0
+
+    async def tick():
+        nonlocal max_lag
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(TICK_INTERVAL)
+            max_lag = max(max_lag, time.perf_counter() - start - TICK_INTERVAL)
+
+    ticker = asyncio.create_task(tick())
+    # Letting the timer start before the measured coroutine
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await run()
+    elapsed = time.perf_counter() - start
+    ticker.cancel()
+
+    return elapsed, max_lag
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    executor = None
+    if args.executor == "thread":
+        executor = ThreadPoolExecutor(max_workers=args.num_workers)
+    elif args.executor == "process":
+        executor = ProcessPoolExecutor(max_workers=args.num_workers)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_paths = make_synthetic_pdfs(
+            str(Path(tmp_dir) / "articles"), count=args.num_articles
+        )
+        summarizer = ArticleSummarizer(
+            model_path=make_tiny_seq2seq(str(Path(tmp_dir) / "model"))
+        )
+        config = SummaryGenerationConfig(
+            min_length=20, max_length=60, num_beams=2
+        )
+
+        async def run_blocking():
+            """Calls the synchronous method from a coroutine."""
+            summarizer.summarize_many(
+                pdf_paths, config=config, batch_size=args.batch_size
+            )
+
+        async def run_async():
+            """Calls the asynchronous method."""
+            await summarizer.asummarize_many(
+                pdf_paths,
+                config=config,
+                batch_size=args.batch_size,
+                max_pending=args.max_pending,
+                executor=executor,
+            )
+
+        # Warming up the model
+        summarizer.summarize_many(pdf_paths[: args.batch_size], config=config)
+        timings = {}
+        for name, run in [
+            ("summarize_many", run_blocking),
+            ("asummarize_many", run_async),
+        ]:
+            timings[name] = asyncio.run(measure_loop_lag(run))
+
+    if executor is not None:
+        executor.shutdown()
+
+    for name, (elapsed, max_lag) in timings.items():
+        print(
+            f"{name}: {args.num_articles / elapsed:.2f} articles/sec, "
+            f"max event loop delay {max_lag * 1000:.1f} ms"
+        )
+    speedup = timings["summarize_many"][0] / timings["asummarize_many"][0]
+    print(f"Speedup: {speedup:.2f}x")
@@ -0,0 +1,108 @@
+"""
+Benchmark of summarizing a folder with the CLI.
+===============================================
+
+The script generates synthetic PDF-articles and a tiny random-weight seq2seq
+model locally and compares the time of summarizing all articles of a folder by:
+
+* a separate `deep-compend summarize` process per article (interpreter startup,
+  imports and model loading for every article);
+* a single `deep-compend summarize-batch` process loading the model once.
+
+Usage:
+    python -m benchmarks.bench_batch_cli --num-articles=16 --batch-size=8 --prepare-workers=2
+
+Arguments:
+    --num-articles (int, optional): Number of articles in the folder.
+    --batch-size (int, optional): Maximum number of articles per `generate` call.
+    --prepare-workers (int, optional): Number of processes extracting and cleaning articles.
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .fixtures import make_synthetic_pdfs, make_tiny_seq2seq
+
+# Generation settings shared by both modes
+GENERATION_ARGS = [
+    "--min-output-tokens",
+    "20",
+    "--max-output-tokens",
+    "60",
+    "--num-beams",
+    "2",
+]
+
+# Running the CLI in a new interpreter
+CLI_TEMPLATE = (
+    "import sys; sys.argv = ['deep-compend', *{args!r}]; "
+    "from deep_compend.cli.cli import main; sys.exit(main())"
+)
+
+# Defining Arguments parser
+parser = argparse.ArgumentParser(description="Batch CLI benchmark.")
+parser.add_argument("--num-articles", type=int, default=16)
+parser.add_argument("--batch-size", type=int, default=8)
+parser.add_argument("--prepare-workers", type=int, default=2)
+
+
+def run_cli(args: list[str]) -> float:
+    """Runs `deep-compend` in a new interpreter.
+
+    Args:
+        args (list[str]): Arguments of the command.
+
+    Returns:
+        float: Elapsed time in seconds.
+    """
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", CLI_TEMPLATE.format(args=args)],
+        capture_output=True,
+        check=True,
+    )
+
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = make_tiny_seq2seq(str(Path(tmp_dir) / "model"))
+        articles_dir = str(Path(tmp_dir) / "articles")
+        pdf_paths = make_synthetic_pdfs(articles_dir, count=args.num_articles)
+        common_args = ["--model-path", model_path, "--no-cache"]
+
+        timings = {
+            "summarize per article": sum(
+                run_cli(
+                    ["summarize", pdf_path, *common_args, *GENERATION_ARGS]
+                )
+                for pdf_path in pdf_paths
+            ),
+            "summarize-batch": run_cli(
+                [
+                    "summarize-batch",
+                    articles_dir,
+                    *common_args,
+                    *GENERATION_ARGS,
+                    "--batch-size",
+                    str(args.batch_size),
+                    "--prepare-workers",
+                    str(args.prepare_workers),
+                ]
+            ),
+        }
+
+    for name, elapsed in timings.items():
+        print(
+            f"{name}: {elapsed:.2f} s, "
+            f"{args.num_articles / elapsed:.2f} articles/sec"
+        )
+    speedup = timings["summarize per article"] / timings["summarize-batch"]
+    print(f"Speedup: {speedup:.2f}x")
@@ -0,0 +1,70 @@
+"""
+Benchmark of batched summarization against the one-at-a-time loop.
+===================================================================
+
+The script generates synthetic PDF-articles and a tiny random-weight
+seq2seq model locally and compares the throughput of calling
+`ArticleSummarizer.summarize` in a loop with `ArticleSummarizer.summarize_many`.
+
+Usage:
+    python -m benchmarks.bench_batched_summarization --num-articles=32 --batch-size=8
+
+Arguments:
+    --num-articles (int, optional): Number of articles to summarize.
+    --batch-size (int, optional): Number of articles per `generate` call.
+    --num-beams (int, optional): Number of beams for beam search.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from deep_compend import ArticleSummarizer, SummaryGenerationConfig
+
+from .fixtures import make_synthetic_pdfs, make_tiny_seq2seq
+
+# Defining Arguments parser
+parser = argparse.ArgumentParser(
+    description="Batched summarization benchmark."
+)
+parser.add_argument("--num-articles", type=int, default=32)
+parser.add_argument("--batch-size", type=int, default=8)
+parser.add_argument("--num-beams", type=int, default=4)
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_paths = make_synthetic_pdfs(
+            str(Path(tmp_dir) / "articles"), count=args.num_articles
+        )
+        model_path = make_tiny_seq2seq(str(Path(tmp_dir) / "model"))
+        summarizer = ArticleSummarizer(model_path=model_path, run_on="cpu")
+        config = SummaryGenerationConfig(
+            min_length=30, max_length=60, num_beams=args.num_beams
+        )
+
+        # Running the current one-at-a-time loop
+        start = time.perf_counter()
+        sequential = [
+            summarizer.summarize(p, config=config) for p in pdf_paths
+        ]
+        sequential_time = time.perf_counter() - start
+
+        # Running the batched generation
+        start = time.perf_counter()
+        results = summarizer.summarize_many(
+            pdf_paths, config=config, batch_size=args.batch_size
+        )
+        batched_time = time.perf_counter() - start
+
+    assert len(results) == len(sequential)
+    print(f"Articles: {args.num_articles}, batch size: {args.batch_size}")
+    print(
+        f"summarize loop: {args.num_articles / sequential_time:.2f} articles/sec"
+    )
+    print(
+        f"summarize_many: {args.num_articles / batched_time:.2f} articles/sec"
+    )
+    print(f"Speedup: {sequential_time / batched_time:.2f}x")
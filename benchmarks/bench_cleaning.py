@@ -0,0 +1,81 @@
+"""
+Benchmark of text cleaning throughput.
+======================================
+
+The script generates a synthetic article text with citations and compares
+the throughput of applying the original cleaning rules one after another with
+`clean_text` and with `TextCleaner` fed page-sized chunks.
+
+Usage:
+    python -m benchmarks.bench_cleaning --num-paragraphs=2000 --repeats=5
+
+Arguments:
+    --num-paragraphs (int, optional): Number of paragraphs in the text.
+    --repeats (int, optional): Number of timed runs of each cleaner.
+    --chunk-size (int, optional): Number of characters in a chunk fed to `TextCleaner`.
+"""
+
+import argparse
+import random
+import re
+import time
+
+from deep_compend.text_preprocessing import TextCleaner, clean_text
+from deep_compend.text_preprocessing.cleaning import CLEANING_RULES
+
+from .fixtures import make_article_lines
+
+# Whitespace rules of the original implementation applied after the citation rules
+WHITESPACE_RULES = [(r"\s{2,}", " "), (r"\s+", " "), (r"\s+([.,!?])", r"\1")]
+
+# Defining Arguments parser
+parser = argparse.ArgumentParser(description="Text cleaning benchmark.")
+parser.add_argument("--num-paragraphs", type=int, default=2000)
+parser.add_argument("--repeats", type=int, default=5)
+parser.add_argument("--chunk-size", type=int, default=4000)
+
+
+def clean_sequentially(text: str) -> str:
+    """Cleans a text applying the cleaning rules one after another."""
+    for pattern, replacement in [*CLEANING_RULES, *WHITESPACE_RULES]:
+        text = re.sub(pattern, replacement, text)
+
+    return text.strip()
+
+
+def clean_in_chunks(text: str, chunk_size: int) -> str:
+    """Cleans a text fed to TextCleaner in chunks."""
+    cleaner = TextCleaner()
+    cleaned = [
+        cleaner.feed(text[i : i + chunk_size])
+        for i in range(0, len(text), chunk_size)
+    ]
+    cleaned.append(cleaner.finish())
+
+    return "".join(cleaned)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    text = "\n".join(
+        make_article_lines(
+            random.Random(0), num_paragraphs=args.num_paragraphs
+        )
+    )
+    size_mb = len(text.encode("utf-8")) / 1024**2
+
+    cleaners = {
+        "sequential rules": clean_sequentially,
+        "clean_text": clean_text,
+        "TextCleaner": lambda t: clean_in_chunks(t, args.chunk_size),
+    }
+    expected = clean_sequentially(text)
+    print(f"Text size: {size_mb:.2f} MB")
+    for name, cleaner in cleaners.items():
+        assert cleaner(text) == expected
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            cleaner(text)
+        elapsed = (time.perf_counter() - start) / args.repeats
+        print(f"{name}: {size_mb / elapsed:.2f} MB/s")
@@ -0,0 +1,76 @@
+"""
+Benchmark of import and CLI startup time.
+=========================================
+
+The script runs fresh Python interpreters importing the package and starting
+CLI subcommands, and reports the median wall-clock time of each command
+together with the heavy dependencies it has loaded. PyTorch, Transformers,
+PEFT, NLTK and SpaCy should only be loaded by commands that need them.
+
+Usage:
+    python -m benchmarks.bench_import_time --repeats=5
+
+Arguments:
+    --repeats (int, optional): Number of timed runs of each command.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# Modules that take most of the import time
+HEAVY_MODULES = ["torch", "transformers", "peft", "nltk", "spacy"]
+
+# Python code run by each command
+COMMANDS = {
+    "import deep_compend": "import deep_compend",
+    "deep-compend --help": "main(['--help'])",
+    "deep-compend extract-text --help": "main(['extract-text', '--help'])",
+    "deep-compend summarize --help": "main(['summarize', '--help'])",
+    "deep_compend.ArticleSummarizer": (
+        "import deep_compend; deep_compend.ArticleSummarizer"
+    ),
+}
+
+# Running a command and printing loaded heavy modules
+TEMPLATE = """
+import contextlib, io, sys
+
+def main(args):
+    from deep_compend.cli.cli import main as cli_main
+    sys.argv = ["deep-compend", *args]
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.suppress(SystemExit):
+        cli_main()
+
+{code}
+print("loaded:", ",".join(m for m in {heavy_modules!r} if m in sys.modules))
+"""
+
+# Defining Arguments parser
+parser = argparse.ArgumentParser(description="Import time benchmark.")
+parser.add_argument("--repeats", type=int, default=5)
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    for name, code in COMMANDS.items():
+        script = TEMPLATE.format(code=code, heavy_modules=HEAVY_MODULES)
+        timings = []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            output = subprocess.run(
+                [sys.executable, "-c", script],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            timings.append(time.perf_counter() - start)
+        # Taking the last line since libraries may print warnings
+        loaded = output.rstrip().splitlines()[-1].removeprefix("loaded:")
+        loaded = loaded.strip()
+        print(
+            f"{name}: {statistics.median(timings) * 1000:.0f} ms "
+            f"(heavy modules: {loaded or 'none'})"
+        )
@@ -0,0 +1,53 @@
+"""
+Benchmark of the batch summarization journal.
+=============================================
+
+The script measures the cost of recording a processed article in the journal
+of `summarize-batch` with and without syncing every line to disk, as well as
+the time of reopening a journal with all records, which a resumed run pays once.
+
+Usage:
+    python -m benchmarks.bench_journal --num-records=20000
+
+Arguments:
+    --num-records (int, optional): Number of recorded articles.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from deep_compend.cli.journal import BatchJournal
+
+# Defining Arguments parser
+parser = argparse.ArgumentParser(description="Batch journal benchmark.")
+parser.add_argument("--num-records", type=int, default=20000)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for sync in [False, True]:
+            journal_path = str(Path(tmp_dir) / f"journal-{sync}.jsonl")
+            with BatchJournal(journal_path, sync=sync) as journal:
+                start = time.perf_counter()
+                for i in range(args.num_records):
+                    key = BatchJournal.make_key(
+                        f"articles/{i}.pdf", {"num_beams": 4}
+                    )
+                    journal.record_done(key, f"articles/{i}.pdf")
+                elapsed = time.perf_counter() - start
+            print(
+                f"record (sync={sync}): "
+                f"{elapsed / args.num_records * 1e6:.1f} us per article"
+            )
+
+        start = time.perf_counter()
+        with BatchJournal(journal_path) as journal:
+            num_entries = len(journal.entries)
+        print(
+            f"reopen: {(time.perf_counter() - start) * 1000:.1f} ms "
+            f"for {num_entries} articles"
+        )
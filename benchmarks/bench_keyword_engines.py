@@ -0,0 +1,78 @@
+"""
+Benchmark of keyword extraction engines.
+========================================
+
+The script generates synthetic article texts, builds a corpus index of
+document frequencies for them and compares the throughput of
+`KeywordsExtractor.extract_many` with "spacy" and "tfidf" engines, as well as
+the time of loading the memory-mapped index.
+
+Usage:
+    python -m benchmarks.bench_keyword_engines --num-texts=100 --lm=en_core_web_sm
+
+Arguments:
+    --num-texts (int, optional): Number of texts to extract keywords from.
+    --num-paragraphs (int, optional): Number of paragraphs in each text.
+    --lm (str, optional): Name of or path to a SpaCy language model.
+"""
+
+import argparse
+import random
+import tempfile
+import time
+
+from deep_compend.extractors import CorpusIndex, KeywordsExtractor
+from deep_compend.text_preprocessing import clean_text
+
+from .fixtures import make_article_lines
+
+# Defining Arguments parser
+parser = argparse.ArgumentParser(description="Keyword engines benchmark.")
+parser.add_argument("--num-texts", type=int, default=100)
+parser.add_argument("--num-paragraphs", type=int, default=20)
+parser.add_argument("--lm", type=str, default="en_core_web_sm")
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    texts = [
+        clean_text(
+            " ".join(
+                make_article_lines(
+                    random.Random(i), num_paragraphs=args.num_paragraphs
+                )
+            )
+        )
+        for i in range(args.num_texts)
+    ]
+
+    with tempfile.TemporaryDirectory() as index_dir:
+        start = time.perf_counter()
+        index = CorpusIndex(index_dir)
+        index.add_many(texts)
+        index.save()
+        build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = CorpusIndex(index_dir)
+        load_time = time.perf_counter() - start
+
+        timings = {}
+        for engine in ("spacy", "tfidf"):
+            extractor = KeywordsExtractor(
+                lm=args.lm, engine=engine, idf_index=index
+            )
+            # Warming up the engine
+            extractor.extract(texts[0])
+            start = time.perf_counter()
+            extractor.extract_many(texts)
+            timings[engine] = time.perf_counter() - start
+
+    print(f"Texts: {args.num_texts}, model: {args.lm}")
+    print(
+        f"index build: {build_time * 1000:.1f} ms, "
+        f"load: {load_time * 1000:.1f} ms"
+    )
+    for engine, elapsed in timings.items():
+        print(f"{engine}: {args.num_texts / elapsed:.2f} texts/sec")
+    print(f"Speedup: {timings['spacy'] / timings['tfidf']:.2f}x")
@@ -0,0 +1,82 @@
+"""
+Benchmark of keyword extraction with a shared SpaCy pipeline.
+=============================================================
+
+The script generates synthetic article texts and compares the throughput of
+loading the full SpaCy language model on every call (previous behaviour of
+`KeywordsExtractor.extract`) with the extractor reusing a process-wide
+pipeline without parser and lemmatizer.
+
+Usage:
+    python -m benchmarks.bench_keywords --num-texts=20 --lm=en_core_web_sm
+
+Arguments:
+    --num-texts (int, optional): Number of texts to extract keywords from.
+    --num-paragraphs (int, optional): Number of paragraphs in each text.
+    --lm (str, optional): Name of or path to a SpaCy language model.
+"""
+
+import argparse
+import random
+import time
+from collections import Counter
+
+import spacy
+
+from deep_compend.extractors import KeywordsExtractor
+from deep_compend.text_preprocessing import clean_text
+
+from .fixtures import make_article_lines
+
+# Defining Arguments parser
+parser = argparse.ArgumentParser(description="Keyword extraction benchmark.")
+parser.add_argument("--num-texts", type=int, default=20)
+parser.add_argument("--num-paragraphs", type=int, default=20)
+parser.add_argument("--lm", type=str, default="en_core_web_sm")
+
+
+def extract_reloading(text: str, lm: str) -> list[str]:
+    """Extracts keywords loading the full language model on every call."""
+    doc = spacy.load(lm)(text)
+    candidates = [
+        token.text.lower()
+        for token in doc
+        if token.pos_ in {"NOUN", "PROPN"} and not token.is_stop
+    ]
+    candidates.extend([ent.text.lower() for ent in doc.ents])
+
+    return [
+        word
+        for word, _ in Counter(candidates).most_common(20)
+        if len(word) >= 3 and word.isalpha()
+    ]
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    texts = [
+        clean_text(
+            " ".join(
+                make_article_lines(
+                    random.Random(i), num_paragraphs=args.num_paragraphs
+                )
+            )
+        )
+        for i in range(args.num_texts)
+    ]
+
+    start = time.perf_counter()
+    reloaded = [extract_reloading(text, args.lm) for text in texts]
+    reloading_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    extractor = KeywordsExtractor(lm=args.lm)
+    shared = [extractor.extract(text) for text in texts]
+    shared_time = time.perf_counter() - start
+
+    assert shared == reloaded
+    print(f"Texts: {args.num_texts}, model: {args.lm}")
+    print(f"reloading model: {args.num_texts / reloading_time:.2f} texts/sec")
+    print(f"shared pipeline: {args.num_texts / shared_time:.2f} texts/sec")
+    print(f"Speedup: {reloading_time / shared_time:.2f}x")
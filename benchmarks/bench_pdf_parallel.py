@@ -0,0 +1,63 @@
+"""
+Benchmark of page extraction across worker processes.
+=====================================================
+
+The script generates a long synthetic PDF-article whose body spans the whole
+document and compares the time of `PDFExtractor.retrieve_processed_text`
+with page texts extracted in-process and by several worker processes.
+
+Usage:
+    python -m benchmarks.bench_pdf_parallel --num-pages=500 --num-workers 1 2 4
+
+Arguments:
+    --num-pages (int, optional): Approximate number of pages in the document.
+    --num-workers (list[int], optional): Numbers of worker processes to compare.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import fitz
+
+from deep_compend.extractors import PDFExtractor
+
+from .fixtures import make_synthetic_pdf
+
+# Approximate number of paragraphs fitting into a 60-line page
+PARAGRAPHS_PER_PAGE = 6
+
+# Defining Arguments parser
+parser = argparse.ArgumentParser(description="Parallel PDF benchmark.")
+parser.add_argument("--num-pages", type=int, default=500)
+parser.add_argument("--num-workers", type=int, nargs="+", default=[1, 2, 4])
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = make_synthetic_pdf(
+            str(Path(tmp_dir) / "book.pdf"),
+            num_paragraphs=args.num_pages * PARAGRAPHS_PER_PAGE,
+        )
+        with fitz.open(pdf_path) as doc:
+            print(f"Pages: {doc.page_count}, CPUs: {os.cpu_count()}")
+
+        texts, timings = [], {}
+        for num_workers in args.num_workers:
+            extractor = PDFExtractor(
+                pdf_path, num_workers=num_workers, parallel_threshold=1
+            )
+            start = time.perf_counter()
+            texts.append(extractor.retrieve_processed_text())
+            timings[num_workers] = time.perf_counter() - start
+
+    assert all(text == texts[0] for text in texts)
+    baseline = timings[args.num_workers[0]]
+    for num_workers, elapsed in timings.items():
+        print(
+            f"workers={num_workers}: {elapsed * 1000:.1f} ms "
+            f"(speedup {baseline / elapsed:.2f}x)"
+        )
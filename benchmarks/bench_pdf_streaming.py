@@ -0,0 +1,85 @@
+"""
+Benchmark of streaming page-wise PDF extraction against whole-document extraction.
+==================================================================================
+
+The script generates a thesis-like synthetic PDF with a short body followed
+by references and long appendices, and compares time and peak Python memory of
+extracting the whole document text before selecting the body with
+`PDFExtractor._stream_body_text` that stops reading pages at References.
+
+Usage:
+    python -m benchmarks.bench_pdf_streaming --num-pages=500 --body-paragraphs=100
+
+Arguments:
+    --num-pages (int, optional): Approximate number of pages in the document.
+    --body-paragraphs (int, optional): Number of paragraphs before References.
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import fitz
+
+from deep_compend.extractors import PDFExtractor
+
+from .fixtures import make_synthetic_pdf
+
+# Approximate number of paragraphs fitting into a 60-line page
+PARAGRAPHS_PER_PAGE = 6
+
+# Defining Arguments parser
+parser = argparse.ArgumentParser(description="PDF streaming benchmark.")
+parser.add_argument("--num-pages", type=int, default=500)
+parser.add_argument("--body-paragraphs", type=int, default=100)
+
+
+def measure(func):
+    """Runs a function and returns its result, time and peak Python memory."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, elapsed, peak
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = make_synthetic_pdf(
+            str(Path(tmp_dir) / "thesis.pdf"),
+            num_paragraphs=args.body_paragraphs,
+            num_appendix_paragraphs=args.num_pages * PARAGRAPHS_PER_PAGE,
+        )
+        with fitz.open(pdf_path) as doc:
+            num_pages = doc.page_count
+        extractor = PDFExtractor(pdf_path)
+
+        # Reading all pages before selecting the body
+        full_text, full_time, full_peak = measure(
+            lambda: extractor._extract_body_text(
+                extractor._extract_raw_text_from_pdf()
+            )
+        )
+        # Reading pages lazily until References
+        streamed_text, stream_time, stream_peak = measure(
+            extractor._stream_body_text
+        )
+
+    assert streamed_text == full_text
+    print(f"Pages: {num_pages}, body: {len(full_text) / 1024:.1f} KB")
+    print(
+        f"whole document: {full_time * 1000:.1f} ms, "
+        f"peak {full_peak / 1024**2:.2f} MB"
+    )
+    print(
+        f"streaming:      {stream_time * 1000:.1f} ms, "
+        f"peak {stream_peak / 1024**2:.2f} MB"
+    )
+    print(f"Speedup: {full_time / stream_time:.2f}x")
@@ -0,0 +1,79 @@
+"""
+Benchmark of report generation overlapping post-processing with generation.
+===========================================================================
+
+The script generates a synthetic PDF-article and a tiny random-weight seq2seq
+model locally and compares the wall-clock time of `ArticleSummarizer.summarize`
+followed by `generate_summary_report` with `summarize_with_report`, which
+counts words and sentences and extracts keywords while the model generates.
+
+Usage:
+    python -m benchmarks.bench_pipelined_report --num-paragraphs=60 --lm=en_core_web_sm
+
+Arguments:
+    --num-paragraphs (int, optional): Number of paragraphs in the article.
+    --repeats (int, optional): Number of timed runs of each mode.
+    --num-beams (int, optional): Number of beams for beam search.
+    --lm (str, optional): Name of or path to a SpaCy language model.
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from deep_compend import ArticleSummarizer, SummaryGenerationConfig
+from deep_compend.utils.timing import format_timings
+
+from .fixtures import make_synthetic_pdf, make_tiny_seq2seq
+
+# Defining Arguments parser
+parser = argparse.ArgumentParser(description="Pipelined report benchmark.")
+parser.add_argument("--num-paragraphs", type=int, default=60)
+parser.add_argument("--repeats", type=int, default=5)
+parser.add_argument("--num-beams", type=int, default=4)
+parser.add_argument("--lm", type=str, default="en_core_web_sm")
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = make_synthetic_pdf(
+            str(Path(tmp_dir) / "article.pdf"),
+            num_paragraphs=args.num_paragraphs,
+        )
+        summarizer = ArticleSummarizer(
+            model_path=make_tiny_seq2seq(str(Path(tmp_dir) / "model"))
+        )
+        config = SummaryGenerationConfig(
+            min_length=20, max_length=60, num_beams=args.num_beams
+        )
+        report_params = {"save_folder": tmp_dir, "lm": args.lm}
+
+        def run_sequentially():
+            """Generates a report after the summary has been generated."""
+            summarizer.summarize(pdf_path, config=config)
+            summarizer.generate_summary_report(**report_params)
+
+        def run_pipelined():
+            """Generates a report overlapping post-processing with generation."""
+            summarizer.summarize_with_report(
+                pdf_path, config=config, **report_params
+            )
+
+        timings = {}
+        for name, run in [
+            ("sequential", run_sequentially),
+            ("pipelined", run_pipelined),
+        ]:
+            # Warming up models and caches
+            run()
+            start = time.perf_counter()
+            for _ in range(args.repeats):
+                run()
+            timings[name] = (time.perf_counter() - start) / args.repeats
+
+    for name, elapsed in timings.items():
+        print(f"{name}: {elapsed * 1000:.1f} ms per report")
+    print(f"Stages: {format_timings(summarizer.stage_timings)}")
+    print(f"Speedup: {timings['sequential'] / timings['pipelined']:.2f}x")
@@ -0,0 +1,56 @@
+"""
+Benchmark of length-bucketed scheduling under different token budgets.
+======================================================================
+
+The script generates synthetic PDF-articles of very different lengths and a tiny
+random-weight seq2seq model locally and reports padding efficiency, tokens/sec
+and per-batch latency of `LengthBucketedScheduler` for each token budget.
+
+Usage:
+    python -m benchmarks.bench_scheduler --num-articles=32 --token-budgets 4096 16384
+
+Arguments:
+    --num-articles (int, optional): Number of articles to summarize.
+    --token-budgets (list[int], optional): Token budgets to compare.
+    --num-beams (int, optional): Number of beams for beam search.
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from deep_compend import ArticleSummarizer, SummaryGenerationConfig
+from deep_compend.core.scheduler import LengthBucketedScheduler
+
+from .fixtures import make_synthetic_pdfs, make_tiny_seq2seq
+
+# Defining Arguments parser
+parser = argparse.ArgumentParser(description="Scheduler benchmark.")
+parser.add_argument("--num-articles", type=int, default=32)
+parser.add_argument(
+    "--token-budgets", type=int, nargs="+", default=[4096, 16384, 65536]
+)
+parser.add_argument("--num-beams", type=int, default=4)
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_paths = make_synthetic_pdfs(
+            str(Path(tmp_dir) / "articles"),
+            count=args.num_articles,
+            min_paragraphs=1,
+            max_paragraphs=12,
+        )
+        model_path = make_tiny_seq2seq(str(Path(tmp_dir) / "model"))
+        summarizer = ArticleSummarizer(model_path=model_path, run_on="cpu")
+        config = SummaryGenerationConfig(
+            min_length=30, max_length=60, num_beams=args.num_beams
+        )
+
+        for token_budget in args.token_budgets:
+            scheduler = LengthBucketedScheduler(
+                summarizer=summarizer, token_budget=token_budget
+            )
+            scheduler.summarize(pdf_paths, config=config)
+            print(f"{scheduler.report}\n")
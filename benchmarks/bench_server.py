@@ -0,0 +1,185 @@
+"""
+Benchmark of per-request latency with and without the summarization server.
+===========================================================================
+
+The script generates synthetic PDF-articles and a tiny random-weight seq2seq
+model locally and measures the latency of summarizing an article by:
+
+* a separate `deep-compend summarize` process (interpreter startup, imports
+  and model loading on every request);
+* a separate `deep-compend summarize --server` thin client process;
+* a `SummarizationClient` request from an already running process;
+* concurrent client requests, which the server groups into shared batches.
+
+Usage:
+    python -m benchmarks.bench_server --repeats=5 --num-clients=8
+
+Arguments:
+    --repeats (int, optional): Number of timed requests in each sequential mode.
+    --num-clients (int, optional): Number of concurrent requests.
+    --num-paragraphs (int, optional): Maximum number of paragraphs in each article.
+    --max-wait-ms (float, optional): Maximum time a request waits for others to share a batch.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from deep_compend import ArticleSummarizer
+from deep_compend.cli.client import SummarizationClient
+from deep_compend.cli.server import SummarizationService, make_server
+
+from .fixtures import make_synthetic_pdfs, make_tiny_seq2seq
+
+# Generation settings shared by all modes
+GENERATION_CONFIG = {"min_length": 20, "max_length": 60, "num_beams": 2}
+
+# Running the CLI in a new interpreter
+CLI_TEMPLATE = (
+    "import sys; sys.argv = ['deep-compend', *{args!r}]; "
+    "from deep_compend.cli.cli import main; sys.exit(main())"
+)
+
+# Defining Arguments parser
+parser = argparse.ArgumentParser(description="Summarization server benchmark.")
+parser.add_argument("--repeats", type=int, default=5)
+parser.add_argument("--num-clients", type=int, default=8)
+parser.add_argument("--num-paragraphs", type=int, default=40)
+parser.add_argument("--max-wait-ms", type=float, default=10.0)
+
+
+def run_cli(args: list[str]) -> None:
+    """Runs `deep-compend` in a new interpreter."""
+    subprocess.run(
+        [sys.executable, "-c", CLI_TEMPLATE.format(args=args)],
+        capture_output=True,
+        check=True,
+    )
+
+
+def time_requests(run, items: list) -> list[float]:
+    """Measures the latency of sequential requests.
+
+    Args:
+        run (Callable[[Any], Any]): Function sending a single request.
+        items (list): Arguments of the requests.
+
+    Returns:
+        list[float]: Latency of each request in seconds.
+    """
+    latencies = []
+    for item in items:
+        start = time.perf_counter()
+        run(item)
+        latencies.append(time.perf_counter() - start)
+
+    return latencies
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = make_tiny_seq2seq(str(Path(tmp_dir) / "model"))
+        pdf_paths = make_synthetic_pdfs(
+            str(Path(tmp_dir) / "articles"),
+            count=max(args.repeats, args.num_clients),
+            min_paragraphs=args.num_paragraphs // 2,
+            max_paragraphs=args.num_paragraphs,
+        )
+        socket_path = str(Path(tmp_dir) / "server.sock")
+        address = f"unix:{socket_path}"
+        generation_args = [
+            "--min-output-tokens",
+            str(GENERATION_CONFIG["min_length"]),
+            "--max-output-tokens",
+            str(GENERATION_CONFIG["max_length"]),
+            "--num-beams",
+            str(GENERATION_CONFIG["num_beams"]),
+        ]
+
+        latencies = {}
+        latencies["cold CLI"] = time_requests(
+            lambda pdf_path: run_cli(
+                [
+                    "summarize",
+                    pdf_path,
+                    "--model-path",
+                    model_path,
+                    "--no-cache",
+                    *generation_args,
+                ]
+            ),
+            pdf_paths[: args.repeats],
+        )
+
+        service = SummarizationService(
+            summarizer=ArticleSummarizer(model_path=model_path),
+            max_batch_size=args.num_clients,
+            max_wait=args.max_wait_ms / 1000,
+        )
+        server = make_server(service=service, address=address)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        client = SummarizationClient(address=address)
+        try:
+            # Warming up the model
+            client.summarize(pdf_paths[0], config=GENERATION_CONFIG)
+
+            latencies["thin client CLI"] = time_requests(
+                lambda pdf_path: run_cli(
+                    ["summarize", pdf_path, "--server", address]
+                    + generation_args
+                ),
+                pdf_paths[: args.repeats],
+            )
+            latencies["client request"] = time_requests(
+                lambda pdf_path: client.summarize(
+                    pdf_path, config=GENERATION_CONFIG
+                ),
+                pdf_paths[: args.repeats],
+            )
+
+            requests_before = service.batcher.stats.requests
+            batches_before = service.batcher.stats.batches
+            with ThreadPoolExecutor(max_workers=args.num_clients) as executor:
+                start = time.perf_counter()
+                latencies["concurrent requests"] = list(
+                    executor.map(
+                        lambda pdf_path: time_requests(
+                            lambda p: client.summarize(
+                                p, config=GENERATION_CONFIG
+                            ),
+                            [pdf_path],
+                        )[0],
+                        pdf_paths[: args.num_clients],
+                    )
+                )
+                concurrent_time = time.perf_counter() - start
+            stats = service.batcher.stats
+            num_batches = stats.batches - batches_before
+            num_requests = stats.requests - requests_before
+        finally:
+            server.shutdown()
+            server.server_close()
+            service.close()
+
+    for name, values in latencies.items():
+        print(
+            f"{name}: median {statistics.median(values) * 1000:.1f} ms, "
+            f"max {max(values) * 1000:.1f} ms per request"
+        )
+    print(
+        f"Concurrent requests: {num_requests} in {num_batches} batches, "
+        f"{num_requests / concurrent_time:.2f} requests/sec"
+    )
+    cold, warm = (
+        statistics.median(latencies["cold CLI"]),
+        statistics.median(latencies["thin client CLI"]),
+    )
+    print(f"Speedup of thin client CLI: {cold / warm:.2f}x")
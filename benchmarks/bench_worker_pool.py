@@ -0,0 +1,118 @@
+"""
+Benchmark of summarization by a pool of worker processes.
+=========================================================
+
+The script generates synthetic PDF-articles locally and measures the throughput
+of `SummarizationWorkerPool` for several layouts of worker processes and PyTorch
+threads per worker, each worker being pinned to its own slice of CPU cores.
+Layouts are written as "<workers>x<threads>" (for instance, "1x16 2x8 4x4 8x2"
+on a machine with 16 cores); by default all layouts using every available core
+with a power of two of workers are measured. Time of loading the models is
+reported separately from the throughput.
+
+A tiny random-weight model is used unless `--model-path` is given; since it
+does little work per token, a real model shows the scaling of `generate` better.
+
+Usage:
+    python -m benchmarks.bench_worker_pool --num-articles=64 --layouts 1x8 2x4 4x2 8x1 --model-path=google-t5/t5-small
+
+Arguments:
+    --num-articles (int, optional): Number of articles to summarize.
+    --batch-size (int, optional): Maximum number of articles per `generate` call of a worker.
+    --layouts (list[str], optional): Layouts of workers and threads per worker to measure.
+    --model-path (str, optional): Path to the model (tiny random-weight model if not given).
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from deep_compend import SummaryGenerationConfig
+from deep_compend.core.worker_pool import (
+    SummarizationWorkerPool,
+    available_cores,
+)
+
+from .fixtures import make_synthetic_pdfs, make_tiny_seq2seq
+
+# Defining Arguments parser
+parser = argparse.ArgumentParser(description="Worker pool benchmark.")
+parser.add_argument("--num-articles", type=int, default=32)
+parser.add_argument("--batch-size", type=int, default=4)
+parser.add_argument("--layouts", type=str, nargs="+", default=None)
+parser.add_argument("--model-path", type=str, default=None)
+
+
+def default_layouts(num_cores: int) -> list[str]:
+    """Lists layouts using all cores with 1, 2, 4, ... workers.
+
+    Args:
+        num_cores (int): Number of available cores.
+
+    Returns:
+        list[str]: Layouts in the form "<workers>x<threads>".
+    """
+    layouts = []
+    num_workers = 1
+    while num_workers <= num_cores:
+        layouts.append(f"{num_workers}x{num_cores // num_workers}")
+        num_workers *= 2
+
+    return layouts
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    layouts = args.layouts or default_layouts(len(available_cores()))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_paths = make_synthetic_pdfs(
+            str(Path(tmp_dir) / "articles"), count=args.num_articles
+        )
+        model_path = args.model_path or make_tiny_seq2seq(
+            str(Path(tmp_dir) / "model")
+        )
+        config = SummaryGenerationConfig(
+            min_length=20, max_length=60, num_beams=2
+        )
+
+        throughputs = {}
+        for layout in layouts:
+            num_workers, threads_per_worker = map(int, layout.split("x"))
+            start = time.perf_counter()
+            with SummarizationWorkerPool(
+                model_path=model_path,
+                num_workers=num_workers,
+                threads_per_worker=threads_per_worker,
+                batch_size=args.batch_size,
+            ) as pool:
+                startup = time.perf_counter() - start
+                # Warming up the workers before measuring
+                pool.summarize_many(
+                    pdf_paths[:num_workers] * args.batch_size, config=config
+                )
+                start = time.perf_counter()
+                pool.summarize_many(pdf_paths, config=config)
+                elapsed = time.perf_counter() - start
+            throughputs[layout] = args.num_articles / elapsed
+            mapped_weights = [
+                worker.mapped_weights
+                for worker in pool.workers
+                if worker.mapped_weights is not None
+            ]
+            print(
+                f"{layout}: {throughputs[layout]:.2f} articles/sec, "
+                f"startup {startup:.2f} s, memory-mapped weights "
+                + (
+                    f"{min(mapped_weights):.0%}"
+                    if mapped_weights
+                    else "unknown"
+                )
+            )
+
+    best = max(throughputs, key=throughputs.get)
+    print(
+        f"Best layout: {best} "
+        f"({throughputs[best] / throughputs[layouts[0]]:.2f}x of {layouts[0]})"
+    )
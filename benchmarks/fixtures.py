@@ -0,0 +1,270 @@
+"""Synthetic inputs for benchmarks.
+
+Generates article-like PDFs and tiny random-weight seq2seq models locally,
+so that benchmarks can be run without downloading papers or models.
+"""
+
+import random
+import textwrap
+from pathlib import Path
+
+WORDS = [
+    "model",
+    "network",
+    "training",
+    "residual",
+    "learning",
+    "representation",
+    "gradient",
+    "optimization",
+    "convolutional",
+    "accuracy",
+    "dataset",
+    "benchmark",
+    "layer",
+    "depth",
+    "feature",
+    "classification",
+    "regularization",
+    "transformer",
+    "attention",
+    "performance",
+    "architecture",
+    "experiment",
+    "evaluation",
+    "baseline",
+    "parameter",
+    "inference",
+    "the",
+    "of",
+    "and",
+    "in",
+    "we",
+    "our",
+    "is",
+    "a",
+    "with",
+    "for",
+]
+
+AUTHORS = ["Smith", "Doe", "Zhang", "Kumar", "Garcia", "Müller", "Chen"]
+
+
+def make_sentence(rng: random.Random) -> str:
+    """Builds a random sentence with optional citations.
+
+    Args:
+        rng (random.Random): Random numbers generator.
+
+    Returns:
+        str: Generated sentence.
+    """
+    words = [rng.choice(WORDS) for _ in range(rng.randint(8, 22))]
+    sentence = " ".join(words).capitalize()
+    # Adding numeric and author-year citations to some sentences
+    if rng.random() < 0.3:
+        refs = ",".join(
+            str(rng.randint(1, 60)) for _ in range(rng.randint(1, 3))
+        )
+        sentence += f" [{refs}]"
+    if rng.random() < 0.2:
+        etal = " et al." if rng.random() < 0.5 else ""
+        sentence += (
+            f" ({rng.choice(AUTHORS)}{etal}, {rng.randint(1990, 2025)})"
+        )
+
+    return sentence + "."
+
+
+def make_paragraph_lines(rng: random.Random, width: int = 90) -> list[str]:
+    """Builds the wrapped lines of a paragraph with some words hyphenated.
+
+    Args:
+        rng (random.Random): Random numbers generator.
+        width (int, optional): Maximum line width. Defaults to 90.
+
+    Returns:
+        list[str]: Lines of the paragraph.
+    """
+    paragraph = " ".join(make_sentence(rng) for _ in range(6))
+    wrapped = textwrap.wrap(paragraph, width)
+    # Hyphenating the last word of some lines like in typeset papers
+    for j in range(len(wrapped) - 1):
+        head, _, last = wrapped[j].rpartition(" ")
+        if len(last) > 7 and head and rng.random() < 0.3:
+            cut = len(last) // 2
+            wrapped[j] = f"{head} {last[:cut]}-"
+            wrapped[j + 1] = f"{last[cut:]} {wrapped[j + 1]}"
+
+    return wrapped
+
+
+def make_article_lines(
+    rng: random.Random,
+    num_paragraphs: int,
+    width: int = 90,
+    num_appendix_paragraphs: int = 0,
+) -> list[str]:
+    """Builds the lines of an article with front matter, sections, references and appendices.
+
+    Args:
+        rng (random.Random): Random numbers generator.
+        num_paragraphs (int): Number of paragraphs in the article body.
+        width (int, optional): Maximum line width. Defaults to 90.
+        num_appendix_paragraphs (int, optional): Number of paragraphs in appendices after references. Defaults to 0.
+
+    Returns:
+        list[str]: Lines of the article text.
+    """
+    lines = ["A Synthetic Study of Deep Residual Models", ""]
+    lines += ["Abstract", *textwrap.wrap(make_sentence(rng), width), ""]
+    lines += ["1 Introduction"]
+    for i in range(num_paragraphs):
+        # Starting a new section every few paragraphs
+        if i and i % 8 == 0:
+            lines += ["", f"{i // 8 + 1} Method {i // 8}"]
+        lines += make_paragraph_lines(rng, width)
+    lines += ["", "References"]
+    for i in range(1, 41):
+        lines.append(
+            f"[{i}] {rng.choice(AUTHORS)} et al. {make_sentence(rng)} "
+            f"{rng.randint(1990, 2025)}."
+        )
+    for i in range(num_appendix_paragraphs):
+        # Starting a new appendix every few paragraphs like in theses
+        if i % 20 == 0:
+            lines += ["", f"Appendix {i // 20 + 1}"]
+        lines += make_paragraph_lines(rng, width)
+
+    return lines
+
+
+def make_synthetic_pdf(
+    path: str,
+    num_paragraphs: int = 40,
+    seed: int = 0,
+    lines_per_page: int = 60,
+    num_appendix_paragraphs: int = 0,
+) -> str:
+    """Writes a multi-page article-like PDF.
+
+    Args:
+        path (str): Path where to save the PDF.
+        num_paragraphs (int, optional): Number of paragraphs in the article body. Defaults to 40.
+        seed (int, optional): Seed for text generation. Defaults to 0.
+        lines_per_page (int, optional): Number of text lines per page. Defaults to 60.
+        num_appendix_paragraphs (int, optional): Number of paragraphs in appendices after references. Defaults to 0.
+
+    Returns:
+        str: Path to the saved PDF.
+    """
+    import fitz
+
+    rng = random.Random(seed)
+    lines = make_article_lines(
+        rng,
+        num_paragraphs=num_paragraphs,
+        num_appendix_paragraphs=num_appendix_paragraphs,
+    )
+
+    doc = fitz.open()
+    for start in range(0, len(lines), lines_per_page):
+        page = doc.new_page()
+        page.insert_text(
+            (50, 60),
+            "\n".join(lines[start : start + lines_per_page]),
+            fontsize=9,
+            lineheight=1.3,
+        )
+    doc.save(path)
+    doc.close()
+
+    return path
+
+
+def make_synthetic_pdfs(
+    folder: str, count: int, min_paragraphs: int = 2, max_paragraphs: int = 40
+) -> list[str]:
+    """Writes several synthetic PDFs of different lengths.
+
+    Args:
+        folder (str): Folder where to save the PDFs.
+        count (int): Number of PDFs to generate.
+        min_paragraphs (int, optional): Minimum number of body paragraphs. Defaults to 2.
+        max_paragraphs (int, optional): Maximum number of body paragraphs. Defaults to 40.
+
+    Returns:
+        list[str]: Paths to the saved PDFs.
+    """
+    Path(folder).mkdir(parents=True, exist_ok=True)
+    rng = random.Random(count)
+
+    return [
+        make_synthetic_pdf(
+            str(Path(folder) / f"article_{i}.pdf"),
+            num_paragraphs=rng.randint(min_paragraphs, max_paragraphs),
+            seed=i,
+        )
+        for i in range(count)
+    ]
+
+
+def make_tiny_seq2seq(save_dir: str, seed: int = 0) -> str:
+    """Builds and saves a tiny random-weight T5 model with a word-level tokenizer.
+
+    Args:
+        save_dir (str): Folder where to save the model and tokenizer.
+        seed (int, optional): Seed for weights initialization. Defaults to 0.
+
+    Returns:
+        str: Path to the saved model.
+    """
+    import torch
+    from tokenizers import Tokenizer, models, normalizers, pre_tokenizers
+    from transformers import (
+        PreTrainedTokenizerFast,
+        T5Config,
+        T5ForConditionalGeneration,
+    )
+
+    # Building a word-level vocabulary from the synthetic article words
+    special_tokens = ["<pad>", "</s>", "<unk>"]
+    extra = ["summarize", ":", ".", ",", "[", "]", "(", ")", "et", "al"]
+    words = sorted(
+        set(WORDS + [a.lower() for a in AUTHORS] + extra)
+        | {str(i) for i in range(100)}
+    )
+    vocab = {token: i for i, token in enumerate(special_tokens + words)}
+
+    backend = Tokenizer(models.WordLevel(vocab=vocab, unk_token="<unk>"))
+    backend.normalizer = normalizers.Lowercase()
+    backend.pre_tokenizer = pre_tokenizers.Sequence(
+        [pre_tokenizers.Whitespace(), pre_tokenizers.Digits()]
+    )
+    tokenizer = PreTrainedTokenizerFast(
+        tokenizer_object=backend,
+        pad_token="<pad>",
+        eos_token="</s>",
+        unk_token="<unk>",
+        model_max_length=512,
+    )
+    tokenizer.save_pretrained(save_dir)
+
+    torch.manual_seed(seed)
+    config = T5Config(
+        vocab_size=len(vocab),
+        d_model=64,
+        d_kv=16,
+        d_ff=128,
+        num_layers=2,
+        num_decoder_layers=2,
+        num_heads=4,
+        pad_token_id=0,
+        eos_token_id=1,
+        decoder_start_token_id=0,
+        n_positions=512,
+    )
+    model = T5ForConditionalGeneration(config)
+    model.save_pretrained(save_dir)
+
+    return save_dir
@@ -0,0 +1,231 @@
+"""
+Benchmark suite timing every processing stage.
+==============================================
+
+The script generates a synthetic PDF-article and a tiny random-weight seq2seq
+model locally and times `PDFExtractor`, `clean_text`, `prettify_summary`,
+`KeywordsExtractor`, `ArticleSummarizer.summarize` and report generation.
+Results are saved as JSON, and two saved runs can be compared to flag
+benchmarks that became slower.
+
+Usage:
+    python -m benchmarks.suite run --output=results.json
+    python -m benchmarks.suite compare baseline.json results.json --threshold=0.1
+
+Arguments of `run`:
+    --output (str, optional): Path where to save the results.
+    --benchmarks (list[str], optional): Names of benchmarks to run (all if not specified).
+    --repeats (int, optional): Number of timed runs of each benchmark.
+    --num-paragraphs (int, optional): Number of paragraphs in the article.
+    --num-beams (int, optional): Number of beams for beam search.
+    --lm (str, optional): Name of or path to a SpaCy language model.
+
+Arguments of `compare`:
+    baseline (str): Path to the results of the baseline run.
+    results (str): Path to the results of the compared run.
+    --threshold (float, optional): Relative slowdown of the median time flagged as a regression.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable
+
+from .fixtures import make_synthetic_pdf, make_tiny_seq2seq
+
+BENCHMARKS = (
+    "pdf_extractor",
+    "clean_text",
+    "prettify_summary",
+    "keywords_extractor",
+    "summarize",
+    "report",
+)
+
+# Defining Arguments parser
+parser = argparse.ArgumentParser(description="Benchmark suite.")
+subparsers = parser.add_subparsers(dest="command", required=True)
+run_parser = subparsers.add_parser("run", help="Run benchmarks.")
+run_parser.add_argument("--output", type=str, default="benchmark.json")
+run_parser.add_argument(
+    "--benchmarks", nargs="+", choices=BENCHMARKS, default=list(BENCHMARKS)
+)
+run_parser.add_argument("--repeats", type=int, default=5)
+run_parser.add_argument("--num-paragraphs", type=int, default=60)
+run_parser.add_argument("--num-beams", type=int, default=4)
+run_parser.add_argument("--lm", type=str, default="en_core_web_sm")
+compare_parser = subparsers.add_parser(
+    "compare", help="Compare results of two runs."
+)
+compare_parser.add_argument("baseline", type=str)
+compare_parser.add_argument("results", type=str)
+compare_parser.add_argument("--threshold", type=float, default=0.1)
+
+
+def package_version(name: str) -> str:
+    """Looks up the installed version of a package ("unknown" if not installed)."""
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def time_benchmark(run: Callable[[], Any], repeats: int) -> dict[str, Any]:
+    """Times a benchmark after a warm-up run.
+
+    Args:
+        run (Callable[[], Any]): Function running the benchmark once.
+        repeats (int): Number of timed runs.
+
+    Returns:
+        dict[str, Any]: Median and minimum seconds per run and number of runs.
+    """
+    # Warming up models and caches
+    run()
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "median": statistics.median(timings),
+        "min": min(timings),
+        "repeats": repeats,
+    }
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict[str, Any]:
+    """Runs the selected benchmarks on synthetic inputs.
+
+    Args:
+        args (argparse.Namespace): Arguments of `run` command.
+
+    Returns:
+        dict[str, Any]: Description of the environment and timings of benchmarks.
+    """
+    # Importing the library only for running benchmarks to keep comparisons fast
+    import torch
+    import transformers
+
+    from deep_compend import ArticleSummarizer, SummaryGenerationConfig
+    from deep_compend.extractors import KeywordsExtractor, PDFExtractor
+    from deep_compend.text_preprocessing import clean_text, prettify_summary
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = make_synthetic_pdf(
+            str(Path(tmp_dir) / "article.pdf"),
+            num_paragraphs=args.num_paragraphs,
+        )
+        raw_text = PDFExtractor(pdf_path)._extract_raw_text_from_pdf()
+        text = clean_text(raw_text)
+        summarizer = ArticleSummarizer(
+            model_path=make_tiny_seq2seq(str(Path(tmp_dir) / "model")),
+            run_on="cpu",
+        )
+        config = SummaryGenerationConfig(
+            min_length=20, max_length=60, num_beams=args.num_beams
+        )
+        summary = summarizer.summarize(pdf_path, config=config)
+
+        def generate_report():
+            """Generates a report without printing where it is saved."""
+            with contextlib.redirect_stdout(io.StringIO()):
+                summarizer.generate_summary_report(
+                    save_folder=tmp_dir, lm=args.lm
+                )
+
+        benchmarks = {
+            "pdf_extractor": lambda: PDFExtractor(
+                pdf_path
+            ).retrieve_processed_text(),
+            "clean_text": lambda: clean_text(raw_text),
+            "prettify_summary": lambda: prettify_summary(summary),
+            "keywords_extractor": lambda: KeywordsExtractor(
+                lm=args.lm
+            ).extract(text),
+            "summarize": lambda: summarizer.summarize(pdf_path, config=config),
+            "report": generate_report,
+        }
+        for name in args.benchmarks:
+            results[name] = time_benchmark(benchmarks[name], args.repeats)
+            print(f"{name}: {results[name]['median'] * 1000:.2f} ms")
+
+    return {
+        "environment": {
+            "deep_compend": package_version("deep-compend"),
+            "python": platform.python_version(),
+            "torch": torch.__version__,
+            "transformers": transformers.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "parameters": {
+            "repeats": args.repeats,
+            "num_paragraphs": args.num_paragraphs,
+            "num_beams": args.num_beams,
+            "lm": args.lm,
+        },
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: dict[str, Any], results: dict[str, Any], threshold: float
+) -> list[str]:
+    """Compares median timings of benchmarks present in both runs.
+
+    Args:
+        baseline (dict[str, Any]): Results of the baseline run.
+        results (dict[str, Any]): Results of the compared run.
+        threshold (float): Relative slowdown of the median time flagged as a regression.
+
+    Returns:
+        list[str]: Names of benchmarks that became slower than allowed by `threshold`.
+    """
+    regressions = []
+    for name, timing in results["results"].items():
+        if name not in baseline["results"]:
+            continue
+        base_median = baseline["results"][name]["median"]
+        ratio = timing["median"] / base_median
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name}: {base_median * 1000:.2f} ms -> "
+            f"{timing['median'] * 1000:.2f} ms ({ratio:.2f}x){flag}"
+        )
+
+    return regressions
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+
+    if args.command == "run":
+        output = run_benchmarks(args)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(output, f, indent=2)
+        print(f"Results saved to '{args.output}'")
+    else:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        with open(args.results, encoding="utf-8") as f:
+            results = json.load(f)
+        regressions = compare_results(baseline, results, args.threshold)
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}")
+            sys.exit(1)
+        print("No regressions found.")
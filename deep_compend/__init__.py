@@ -1,4 +1,30 @@
 # ruff: noqa: F401
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .core.configs import SummaryGenerationConfig
-from .core.summarizer import ArticleSummarizer
+
+if TYPE_CHECKING:
+    from .core.summarizer import ArticleSummarizer
+
+# Attributes imported on first access, so that importing the package does not load PyTorch and Transformers
+_LAZY_ATTRIBUTES = {"ArticleSummarizer": ".core.summarizer"}
+
+__all__ = ["ArticleSummarizer", "SummaryGenerationConfig"]
+
+
+def __getattr__(name: str) -> Any:
+    """Imports heavy attributes of the package on first access."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    """Lists attributes of the package including not yet imported ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,401 @@
+"""Summarization of many articles listed in directories, glob patterns or JSONL manifests."""
+
+import asyncio
+import glob
+import json
+import queue
+import threading
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from ..core.configs import SummaryGenerationConfig
+from ..extractors import CorpusIndex
+from ..utils.timing import StageTimer
+
+if TYPE_CHECKING:
+    from ..core.summarizer import ArticleSummarizer
+
+# Parameters identifying the model, which is loaded once for all articles of a run
+MODEL_PARAMETERS = frozenset(
+    {"model_path", "tokenizer_path", "lora_adapters_path"}
+)
+
+
+@dataclass
+class BatchJob:
+    """Article to be summarized by `summarize-batch` subcommand.
+
+    Attributes:
+        pdf_path (str): Path to an article to be summarized.
+        report_name (Optional[str]): Name of the summary report (name of the article with "txt" extension if None).
+        overrides (dict[str, Any]): CLI parameters overridden for this article (e.g. "num_beams").
+        config (dict[str, Any]): Effective CLI configuration of this article (set when the run starts).
+        key (Optional[str]): Key of this article in the journal of the run.
+    """
+
+    pdf_path: str
+    report_name: Optional[str] = None
+    overrides: dict[str, Any] = field(default_factory=dict)
+    config: dict[str, Any] = field(default_factory=dict)
+    key: Optional[str] = None
+
+
+@dataclass
+class BatchStatistics:
+    """Statistics of a batch summarization run.
+
+    Attributes:
+        articles (int): Number of summarized articles.
+        failed (int): Number of articles that could not be summarized or reported.
+        skipped (int): Number of articles finished by previous runs.
+        elapsed (float): Wall-clock time of the run in seconds.
+        output_tokens (int): Number of tokens in the generated summaries.
+    """
+
+    articles: int = 0
+    failed: int = 0
+    skipped: int = 0
+    elapsed: float = 0.0
+    output_tokens: int = 0
+
+    @property
+    def articles_per_second(self) -> float:
+        """Number of summarized articles per second of the run."""
+        return self.articles / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Number of generated tokens per second of the run."""
+        return self.output_tokens / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def format_batch_statistics(stats: BatchStatistics) -> str:
+    """Formats statistics of a batch summarization run for displaying.
+
+    Args:
+        stats (BatchStatistics): Statistics of the run.
+
+    Returns:
+        str: Numbers of articles, elapsed time and throughput.
+    """
+    return (
+        f"{stats.articles} articles summarized, {stats.failed} failed, "
+        f"{stats.skipped} skipped "
+        f"in {stats.elapsed:.2f} s ({stats.articles_per_second:.2f} articles/sec, "
+        f"{stats.tokens_per_second:.1f} generated tokens/sec)"
+    )
+
+
+def load_manifest(manifest_path: str) -> list[BatchJob]:
+    """Loads jobs from a JSONL manifest.
+
+    Each non-empty line is a JSON object with "pdf" (path relative to the manifest folder
+    or absolute), and optional "report_name" and "overrides" (dict of CLI parameters) fields.
+    Parameters of the model cannot be overridden.
+
+    Args:
+        manifest_path (str): Path to the manifest.
+
+    Raises:
+        ValueError: Exception raised if a line is not a valid job or overrides parameters of the model.
+
+    Returns:
+        list[BatchJob]: Jobs in the order of the manifest lines.
+    """
+    folder = Path(manifest_path).parent
+    jobs = []
+    with open(manifest_path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                pdf_path = Path(entry["pdf"])
+                overrides = entry.get("overrides") or {}
+                if not isinstance(overrides, dict):
+                    raise TypeError("'overrides' should be an object")
+                model_overrides = sorted(MODEL_PARAMETERS & overrides.keys())
+                if model_overrides:
+                    raise ValueError(
+                        f"{', '.join(model_overrides)} cannot be overridden "
+                        "per article since all articles are summarized by one model"
+                    )
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                raise ValueError(
+                    f"Line {line_number} of manifest '{manifest_path}' is not a valid job: {e}"
+                ) from e
+            jobs.append(
+                BatchJob(
+                    pdf_path=str(
+                        pdf_path
+                        if pdf_path.is_absolute()
+                        else folder / pdf_path
+                    ),
+                    report_name=entry.get("report_name"),
+                    overrides=overrides,
+                )
+            )
+
+    return jobs
+
+
+def collect_batch_jobs(inputs: list[str]) -> list[BatchJob]:
+    """Collects jobs from directories, glob patterns, JSONL manifests and paths to PDF-files.
+
+    Args:
+        inputs (list[str]): Directories with PDF-articles, glob patterns (e.g. "articles/**/*.pdf"), manifests with "jsonl" extension or paths to PDF-articles.
+
+    Raises:
+        ValueError: Exception raised if no articles are found.
+
+    Returns:
+        list[BatchJob]: Jobs in the order of `inputs` (sorted by name within each directory or pattern).
+    """
+    jobs = []
+    for item in inputs:
+        if Path(item).is_dir():
+            pdf_paths = [str(p) for p in sorted(Path(item).glob("*.pdf"))]
+        elif item.endswith(".jsonl"):
+            jobs.extend(load_manifest(item))
+            continue
+        elif glob.has_magic(item):
+            pdf_paths = sorted(
+                p for p in glob.glob(item, recursive=True) if Path(p).is_file()
+            )
+        else:
+            pdf_paths = [item]
+        jobs.extend(BatchJob(pdf_path=pdf_path) for pdf_path in pdf_paths)
+
+    if not jobs:
+        raise ValueError("No articles to summarize found.")
+
+    return jobs
+
+
+class ReportSource:
+    """Stands in for the summarizer in reports of articles summarized by worker processes.
+
+    Holds the description of the model loaded by the workers and the latest result, so
+    that reports are written without loading the model in the process writing them.
+
+    Attributes:
+        model_path (str): Path to the Transformer model.
+        tokenizer_path (str): Path to Transformer tokenizer.
+        lora_adapters_path (Optional[str]): Path to attached LoRA adapters.
+        context_window (Optional[int]): Maximum context window of the model (None until reported by a worker).
+        pdf_path (str): Path to the latest summarized article.
+        clean_text (str): Cleaned text of the latest summarized article.
+        summary (str): Summary of the latest summarized article.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        tokenizer_path: Optional[str] = None,
+        lora_adapters_path: Optional[str] = None,
+        context_window: Optional[int] = None,
+    ):
+        """Initializes a ReportSource instance.
+
+        Args:
+            model_path (str): Path to the Transformer model.
+            tokenizer_path (Optional[str], optional): Path to Transformer tokenizer (the model path if None). Defaults to None.
+            lora_adapters_path (Optional[str], optional): Path to attached LoRA adapters. Defaults to None.
+            context_window (Optional[int], optional): Maximum context window of the model. Defaults to None.
+        """
+        self.model_path = model_path
+        self.tokenizer_path = tokenizer_path or model_path
+        self.lora_adapters_path = lora_adapters_path
+        self.context_window = context_window
+        self.pdf_path = ""
+        self.clean_text = ""
+        self.summary = ""
+        self._stats = None
+
+    def _store_result(
+        self, result: "ArticleSummarizer.SummarizationResult"
+    ) -> None:
+        """Saves the result of a summarized article to be reported.
+
+        Args:
+            result (SummarizationResult): Summary and statistics of the article.
+        """
+        self.pdf_path = result.pdf_path
+        self.clean_text = result.clean_text
+        self.summary = result.summary
+        self._stats = result.stats
+
+    def _get_stats(self) -> "ArticleSummarizer.SummaryStatisticsConfig":
+        """Returns statistics of the latest summarized article.
+
+        Returns:
+            SummaryStatisticsConfig: Statistics computed when the article was summarized.
+        """
+        return self._stats
+
+
+class ReportWriter:
+    """Writes summary reports in a background thread while next articles are summarized.
+
+    Reports rely on the latest result stored in the summarizer, so they are written
+    one at a time by a single thread, which also extracts keywords of the articles.
+
+    Usage:
+        with ReportWriter(summarizer) as writer:
+            writer.submit(result, report_params)
+
+    Attributes:
+        summarizer (Union[ArticleSummarizer, ReportSource]): Instance of ArticleSummarizer class that summarized the articles or the description of the model of worker processes.
+        idf_index (Optional[CorpusIndex]): Index of document frequencies used by "tfidf" engine.
+        written (int): Number of written reports.
+        failed (int): Number of reports that could not be written.
+    """
+
+    def __init__(
+        self,
+        summarizer: Union["ArticleSummarizer", ReportSource],
+        idf_index: Optional[CorpusIndex] = None,
+    ):
+        """Initializes a ReportWriter instance.
+
+        Args:
+            summarizer (Union[ArticleSummarizer, ReportSource]): Instance of ArticleSummarizer class that summarized the articles or the description of the model of worker processes.
+            idf_index (Optional[CorpusIndex], optional): Index of document frequencies used by "tfidf" engine. Defaults to None.
+        """
+        self.summarizer = summarizer
+        self.idf_index = idf_index
+        self.written = 0
+        self.failed = 0
+        self._queue: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Starts the thread writing reports."""
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run, name="report-writer", daemon=True
+            )
+            self._worker.start()
+
+    def close(self) -> None:
+        """Writes the queued reports and stops the thread."""
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+
+    def __enter__(self) -> "ReportWriter":
+        """Starts the thread writing reports."""
+        self.start()
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stops the thread writing reports."""
+        self.close()
+
+    def submit(
+        self,
+        result: "ArticleSummarizer.SummarizationResult",
+        report_params: dict[str, Any],
+        callback: Optional[Callable[[Optional[Exception]], None]] = None,
+    ) -> None:
+        """Queues the report of a summarized article.
+
+        Args:
+            result (SummarizationResult): Summary and statistics of the article.
+            report_params (dict[str, Any]): Arguments of `SummaryReportGenerator` with "filename" of the report.
+            callback (Optional[Callable[[Optional[Exception]], None]], optional): Function called in the writer thread with None once the report is written or with the exception if it could not be written. Defaults to None.
+        """
+        self.start()
+        self._queue.put((result, report_params, callback))
+
+    def _write(
+        self,
+        result: "ArticleSummarizer.SummarizationResult",
+        report_params: dict[str, Any],
+    ) -> None:
+        """Writes the report of a summarized article.
+
+        Args:
+            result (SummarizationResult): Summary and statistics of the article.
+            report_params (dict[str, Any]): Arguments of `SummaryReportGenerator` with "filename" of the report.
+        """
+        from ..core.summarizer import ArticleSummarizer
+
+        params = dict(report_params)
+        filename = params.pop("filename")
+        self.summarizer._store_result(result)
+        report_generator = ArticleSummarizer.SummaryReportGenerator(
+            summarizer=self.summarizer,
+            idf_index=self.idf_index,
+            timer=StageTimer(),
+            **params,
+        )
+        report_generator.generate_txt_report(filename=filename)
+
+    def _run(self) -> None:
+        """Writes queued reports until the writer is closed."""
+        while (item := self._queue.get()) is not None:
+            result, report_params, callback = item
+            error = None
+            try:
+                self._write(result, report_params)
+                self.written += 1
+            except Exception as e:
+                self.failed += 1
+                error = e
+            if callback is not None:
+                callback(error)
+
+
+async def summarize_jobs(
+    summarizer: "ArticleSummarizer",
+    jobs: list[tuple[BatchJob, SummaryGenerationConfig]],
+    on_result: Callable[
+        [BatchJob, "ArticleSummarizer.SummarizationResult"], None
+    ],
+    on_error: Callable[[BatchJob, Exception], None],
+    batch_size: int = 8,
+    max_pending: int = 16,
+    executor: Optional[Executor] = None,
+) -> None:
+    """Summarizes articles extracted in an executor with batched generation.
+
+    A failing article is passed to `on_error` without stopping the others.
+
+    Args:
+        summarizer (ArticleSummarizer): Instance of ArticleSummarizer class used for generation.
+        jobs (list[tuple[BatchJob, SummaryGenerationConfig]]): Jobs with their configuration settings for summarization task.
+        on_result (Callable[[BatchJob, SummarizationResult], None]): Function called with each summarized job and its result.
+        on_error (Callable[[BatchJob, Exception], None]): Function called with each failed job and the exception.
+        batch_size (int, optional): Maximum number of articles to summarize in one `generate` call. Defaults to 8.
+        max_pending (int, optional): Maximum number of articles being prepared or waiting for generation. Defaults to 16.
+        executor (Optional[Executor], optional): Thread or process executor running extraction and cleaning (default executor of the event loop if None). Defaults to None.
+    """
+    # Importing the pipeline only when summarizing since it loads NLTK
+    from ..core.async_pipeline import AsyncSummarizationPipeline
+
+    async with AsyncSummarizationPipeline(
+        summarizer,
+        batch_size=batch_size,
+        max_pending=max_pending,
+        executor=executor,
+    ) as pipeline:
+
+        async def process(
+            job: BatchJob, config: SummaryGenerationConfig
+        ) -> None:
+            """Summarizes a single job reporting its result or error."""
+            try:
+                result = await pipeline.summarize(
+                    pdf_path=job.pdf_path, config=config
+                )
+            except Exception as e:
+                on_error(job, e)
+                return
+            on_result(job, result)
+
+        await asyncio.gather(*(process(job, config) for job, config in jobs))
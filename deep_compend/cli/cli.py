@@ -2,130 +2,302 @@
 
 import argparse
 import sys
+from contextlib import nullcontext
 from dataclasses import asdict
+from pathlib import Path
+from typing import Optional
 
+from ..extractors.keywords_extractor import KEYWORD_ENGINES
+from ..utils.profiling import Profiler
+from .client import DEFAULT_SERVER_ADDRESS
 from .config import DefaultCLIParametersConfig, load_config, merge_configs
 from .subcommands import (
-    run_keyword_extraction,
+    collect_pdf_paths,
+    run_batch_summarization,
+    run_keyword_extraction_many,
+    run_keyword_extraction_remote,
+    run_server,
     run_summarization,
+    run_summarization_remote,
     run_text_extraction,
 )
 
 
-def main():
-    """CLI for `deep-compend` command with subcommands."""
+def add_profiling_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds options for profiling a subcommand.
 
-    # Defining an Arguments Parser and sub-parsers
-    parser = argparse.ArgumentParser(description="Article summarization tool")
-    subparsers = parser.add_subparsers(dest="command")
-
-    # ---------------- Summarization/Report generation sub-parser ---------------------------#
-
-    summ_parser = subparsers.add_parser(
-        "summarize",
-        description="Summarizes a PDF article using a Hugging Face model",
-        help="Summarizes a PDF article using a Hugging Face model",
+    Args:
+        parser (argparse.ArgumentParser): Parser of a subcommand.
+    """
+    parser.add_argument(
+        "-pr",
+        "--profile",
+        action="store_true",
+        default=None,
+        help="Save a cProfile dump of the run and display the hotspots",
     )
-
-    # Positional argument: PDF file path
-    summ_parser.add_argument(
-        "filepath", type=str, help="Path to the PDF article to be summarized"
+    parser.add_argument(
+        "-prn",
+        "--profile-top",
+        type=int,
+        help="Number of hotspots to display when profiling",
     )
 
-    # Other optional arguments
-    summ_parser.add_argument(
+
+def add_summarization_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds options of summary generation and report formatting.
+
+    Args:
+        parser (argparse.ArgumentParser): Parser of a subcommand.
+    """
+    parser.add_argument(
         "-c", "--config", type=str, help="Path to the config JSON file"
     )
-    summ_parser.add_argument(
+    parser.add_argument(
         "-mp",
         "--model-path",
         type=str,
         help="Path to summarization model",
     )
-    summ_parser.add_argument(
+    parser.add_argument(
         "-tp",
         "--tokenizer-path",
         type=str,
         help="Path to summarization model tokenizer",
     )
-    summ_parser.add_argument(
+    parser.add_argument(
         "-mxot",
         "--max-output-tokens",
         type=int,
         help="Maximum number of output tokens",
     )
-    summ_parser.add_argument(
+    parser.add_argument(
         "-mnot",
         "--min-output-tokens",
         type=int,
         help="Minimum number of output tokens",
     )
-    summ_parser.add_argument(
+    parser.add_argument(
         "-nb", "--num-beams", type=int, help="Number of beams for beam search"
     )
-    summ_parser.add_argument(
+    parser.add_argument(
         "-lp",
         "--length-penalty",
         type=float,
         help="Penalty for the summary length",
     )
-    summ_parser.add_argument(
+    parser.add_argument(
         "-rp",
         "--repetition-penalty",
         type=float,
         help="Penalty for repetitive words",
     )
-    summ_parser.add_argument(
+    parser.add_argument(
         "-nrns",
         "--no-repeat-ngram-size",
         type=int,
         help="Avoid repetitive phrases",
     )
-    summ_parser.add_argument(
+    parser.add_argument(
         "-lap", "--lora-adapters-path", type=str, help="Path to LoRA adapters"
     )
-    summ_parser.add_argument(
+    parser.add_argument(
         "-lw",
         "--line-width",
         type=int,
         help="Maximum line width for report formatting",
     )
-    summ_parser.add_argument(
+    parser.add_argument(
         "-mkn",
         "--max-keywords-num",
         type=int,
         help="Maximum number of keywords in the summary report",
     )
-    summ_parser.add_argument(
+    parser.add_argument(
         "-mkl",
         "--min-keywords-length",
         type=int,
         help="Minimum length of keywords to consider in the summary report",
     )
-    summ_parser.add_argument(
-        "-rn",
-        "--report-name",
-        type=str,
-        help="Name of the output summary report",
-    )
-    summ_parser.add_argument(
+    parser.add_argument(
         "-sf",
         "--save-folder",
         type=str,
         help="Folder to save the generated summary",
     )
-    summ_parser.add_argument(
+    parser.add_argument(
         "-slm",
         "--spacy-lang-model",
         type=str,
         help="Name of Spacy language model to be used for keyword extraction",
     )
-    summ_parser.add_argument(
+    parser.add_argument(
         "-gsr",
         "--generate-summary-report",
         type=bool,
         help="Trigger for summary report generation",
     )
+    parser.add_argument(
+        "-cd",
+        "--cache-dir",
+        type=str,
+        help="Directory with persistent caches",
+    )
+    parser.add_argument(
+        "-nc",
+        "--no-cache",
+        action="store_true",
+        default=None,
+        help="Disable the extracted text and summary caches",
+    )
+    parser.add_argument(
+        "-rc",
+        "--refresh-cache",
+        action="store_true",
+        default=None,
+        help="Regenerate summaries ignoring cached ones",
+    )
+    parser.add_argument(
+        "-cms",
+        "--cache-max-size-mb",
+        type=int,
+        help="Maximum size of the summary cache in megabytes",
+    )
+    parser.add_argument(
+        "-cma",
+        "--cache-max-age-days",
+        type=float,
+        help="Maximum age of cached summaries in days",
+    )
+    parser.add_argument(
+        "-ke",
+        "--keyword-engine",
+        type=str,
+        choices=KEYWORD_ENGINES,
+        help="Backend for keyword extraction: Spacy language model or TF-IDF over the corpus of processed articles",
+    )
+    parser.add_argument(
+        "-ew",
+        "--extraction-workers",
+        type=int,
+        help="Number of processes extracting page texts of large PDF-files",
+    )
+
+
+def main():
+    """CLI for `deep-compend` command with subcommands."""
+
+    # Defining an Arguments Parser and sub-parsers
+    parser = argparse.ArgumentParser(description="Article summarization tool")
+    subparsers = parser.add_subparsers(dest="command")
+
+    # ---------------- Summarization/Report generation sub-parser ---------------------------#
+
+    summ_parser = subparsers.add_parser(
+        "summarize",
+        description="Summarizes a PDF article using a Hugging Face model",
+        help="Summarizes a PDF article using a Hugging Face model",
+    )
+
+    # Positional argument: PDF file path
+    summ_parser.add_argument(
+        "filepath", type=str, help="Path to the PDF article to be summarized"
+    )
+
+    # Other optional arguments
+    add_summarization_arguments(summ_parser)
+    summ_parser.add_argument(
+        "-rn",
+        "--report-name",
+        type=str,
+        help="Name of the output summary report",
+    )
+    summ_parser.add_argument(
+        "-ld",
+        "--long-document",
+        action="store_true",
+        default=None,
+        help="Summarize the full article text in chunks instead of truncating it to the context window",
+    )
+    summ_parser.add_argument(
+        "-srv",
+        "--server",
+        type=str,
+        help="Address of a running `deep-compend serve` to send the job to (e.g. 127.0.0.1:8765 or unix:/tmp/deep-compend.sock)",
+    )
+    add_profiling_arguments(summ_parser)
+    summ_parser.add_argument(
+        "-prt",
+        "--profile-torch",
+        action="store_true",
+        default=None,
+        help="Save PyTorch profiler traces of model generation when profiling",
+    )
+
+    # ---------------- Batch summarization sub-parser ---------------------------#
+
+    batch_parser = subparsers.add_parser(
+        "summarize-batch",
+        description="Summarizes many PDF articles with the model loaded once, preparing articles in worker processes while summaries are generated in batches",
+        help="Summarizes PDF articles from directories, glob patterns or JSONL manifests",
+    )
+    batch_parser.add_argument(
+        "inputs",
+        type=str,
+        nargs="+",
+        help="Directories with PDF articles, glob patterns, JSONL manifests of jobs or paths to PDF articles",
+    )
+    add_summarization_arguments(batch_parser)
+    batch_parser.add_argument(
+        "-bs",
+        "--batch-size",
+        type=int,
+        help="Maximum number of articles summarized in one batch",
+    )
+    batch_parser.add_argument(
+        "-mpd",
+        "--max-pending",
+        type=int,
+        help="Maximum number of articles prepared ahead of generation",
+    )
+    batch_parser.add_argument(
+        "-pw",
+        "--prepare-workers",
+        type=int,
+        help="Number of processes extracting and cleaning articles",
+    )
+    batch_parser.add_argument(
+        "-j",
+        "--journal",
+        type=str,
+        help="Path to a JSONL journal of processed articles used to resume interrupted runs",
+    )
+    batch_parser.add_argument(
+        "-ma",
+        "--max-attempts",
+        type=int,
+        help="Maximum number of attempts to summarize an article recorded in the journal",
+    )
+    batch_parser.add_argument(
+        "-nw",
+        "--num-workers",
+        type=int,
+        help="Number of processes loading the model and summarizing articles from a shared queue (summarized in this process if 1)",
+    )
+    batch_parser.add_argument(
+        "-tpw",
+        "--threads-per-worker",
+        type=int,
+        help="Number of CPU cores each worker process is pinned to and uses for PyTorch threads (cores split evenly by default)",
+    )
+    add_profiling_arguments(batch_parser)
+    batch_parser.add_argument(
+        "-prt",
+        "--profile-torch",
+        action="store_true",
+        default=None,
+        help="Save PyTorch profiler traces of model generation when profiling",
+    )
 
     # ---------------- Text retrieval sub-parser ---------------------------#
 
@@ -137,6 +309,34 @@ def main():
     text_parser.add_argument(
         "filepath", type=str, help="Path to the PDF article"
     )
+    text_parser.add_argument(
+        "-cd",
+        "--cache-dir",
+        type=str,
+        help="Directory with persistent caches",
+        default="~/.cache/deep-compend",
+    )
+    text_parser.add_argument(
+        "-nc",
+        "--no-cache",
+        action="store_true",
+        help="Disable the extracted text cache",
+    )
+    text_parser.add_argument(
+        "-ew",
+        "--extraction-workers",
+        type=int,
+        help="Number of processes extracting page texts of large PDF-files",
+        default=1,
+    )
+    add_profiling_arguments(text_parser)
+    text_parser.add_argument(
+        "-prd",
+        "--profile-dir",
+        type=str,
+        help="Directory where to save profiling results",
+        default=".",
+    )
 
     # ---------------- Keywords retrieval sub-parser ---------------------------#
 
@@ -146,7 +346,10 @@ def main():
         help="Extracts keywords from article",
     )
     kwrds_parser.add_argument(
-        "filepath", type=str, help="Path to the PDF article to be summarized"
+        "filepath",
+        type=str,
+        nargs="+",
+        help="Paths to PDF articles or directories with them",
     )
     kwrds_parser.add_argument(
         "-mxkn",
@@ -169,26 +372,203 @@ def main():
         help="Name of Spacy language model to be used for keyword extraction",
         default="en_core_web_sm",
     )
+    kwrds_parser.add_argument(
+        "-ke",
+        "--keyword-engine",
+        type=str,
+        choices=KEYWORD_ENGINES,
+        help="Backend for keyword extraction: Spacy language model or TF-IDF over the corpus of processed articles",
+        default="spacy",
+    )
+    kwrds_parser.add_argument(
+        "-cd",
+        "--cache-dir",
+        type=str,
+        help="Directory with persistent caches",
+        default="~/.cache/deep-compend",
+    )
+    kwrds_parser.add_argument(
+        "-nc",
+        "--no-cache",
+        action="store_true",
+        help="Disable the extracted text cache",
+    )
+    kwrds_parser.add_argument(
+        "-ew",
+        "--extraction-workers",
+        type=int,
+        help="Number of processes extracting page texts of large PDF-files",
+        default=1,
+    )
+    kwrds_parser.add_argument(
+        "-bs",
+        "--batch-size",
+        type=int,
+        help="Number of articles processed by Spacy language model at once",
+        default=32,
+    )
+    kwrds_parser.add_argument(
+        "-np",
+        "--n-process",
+        type=int,
+        help="Number of processes running Spacy language model",
+        default=1,
+    )
+    kwrds_parser.add_argument(
+        "-srv",
+        "--server",
+        type=str,
+        help="Address of a running `deep-compend serve` to send the jobs to",
+    )
+    add_profiling_arguments(kwrds_parser)
+    kwrds_parser.add_argument(
+        "-prd",
+        "--profile-dir",
+        type=str,
+        help="Directory where to save profiling results",
+        default=".",
+    )
+
+    # ---------------- Summarization server sub-parser ---------------------------#
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        description="Keeps the summarization model in memory and serves jobs sent by `--server` option of other subcommands",
+        help="Serves summarization jobs with a resident model",
+    )
+    serve_parser.add_argument(
+        "-a",
+        "--address",
+        type=str,
+        help="Address to listen on: host:port or unix:/path/to/socket",
+        default=DEFAULT_SERVER_ADDRESS,
+    )
+    serve_parser.add_argument(
+        "-mp",
+        "--model-path",
+        type=str,
+        help="Path to summarization model",
+        default="google-t5/t5-small",
+    )
+    serve_parser.add_argument(
+        "-tp",
+        "--tokenizer-path",
+        type=str,
+        help="Path to summarization model tokenizer",
+    )
+    serve_parser.add_argument(
+        "-lap", "--lora-adapters-path", type=str, help="Path to LoRA adapters"
+    )
+    serve_parser.add_argument(
+        "-slm",
+        "--spacy-lang-model",
+        type=str,
+        help="Name of Spacy language model loaded at startup",
+        default="en_core_web_sm",
+    )
+    serve_parser.add_argument(
+        "-mbs",
+        "--max-batch-size",
+        type=int,
+        help="Maximum number of concurrent requests summarized in one batch",
+        default=8,
+    )
+    serve_parser.add_argument(
+        "-mwm",
+        "--max-wait-ms",
+        type=float,
+        help="Maximum time in milliseconds a request waits for others to share a batch",
+        default=10.0,
+    )
+    serve_parser.add_argument(
+        "-cd",
+        "--cache-dir",
+        type=str,
+        help="Directory with persistent caches",
+        default="~/.cache/deep-compend",
+    )
+    serve_parser.add_argument(
+        "-nc",
+        "--no-cache",
+        action="store_true",
+        help="Disable the extracted text and summary caches",
+    )
+    serve_parser.add_argument(
+        "-ew",
+        "--extraction-workers",
+        type=int,
+        help="Number of processes extracting page texts of large PDF-files",
+        default=1,
+    )
 
     # -----------------------------------------------------------------------------#
 
     # Parsing the arguments
     args = parser.parse_args()
+    profiler: Optional[Profiler] = None
+    exit_code = 0
     try:
         # Sub-command to extract text from article
         if args.command == "extract-text":
-            extracted_text = run_text_extraction(pdf_path=args.filepath)
+            if args.profile:
+                profiler = Profiler(
+                    output_dir=args.profile_dir,
+                    name=args.command,
+                    top_n=args.profile_top or 20,
+                )
+                if args.extraction_workers > 1:
+                    profiler.skip("page extraction of large PDF-files")
+            with profiler.profile() if profiler else nullcontext():
+                extracted_text = run_text_extraction(
+                    pdf_path=args.filepath,
+                    cache_dir=None if args.no_cache else args.cache_dir,
+                    num_workers=args.extraction_workers,
+                )
             print(f"Extracted text: {extracted_text}")
 
         # Sub-command to extract keywords from article text
         elif args.command == "extract-keywords":
-            extracted_keywords = run_keyword_extraction(
-                pdf_path=args.filepath,
-                lm=args.spacy_lang_model,
-                min_kwrd_length=args.min_keywords_length,
-                max_keywords_num=args.max_keywords_num,
-            )
-            print(f"Extracted keywords: {extracted_keywords}")
+            if args.profile:
+                profiler = Profiler(
+                    output_dir=args.profile_dir,
+                    name=args.command,
+                    top_n=args.profile_top or 20,
+                )
+                if args.server:
+                    profiler.skip("keyword extraction on the server")
+                if args.extraction_workers > 1:
+                    profiler.skip("page extraction of large PDF-files")
+                if args.n_process > 1:
+                    profiler.skip("language model of keyword extraction")
+            pdf_paths = collect_pdf_paths(args.filepath)
+            with profiler.profile() if profiler else nullcontext():
+                if args.server:
+                    extracted_keywords = run_keyword_extraction_remote(
+                        pdf_paths=pdf_paths,
+                        server=args.server,
+                        lm=args.spacy_lang_model,
+                        min_kwrd_length=args.min_keywords_length,
+                        max_keywords_num=args.max_keywords_num,
+                        engine=args.keyword_engine,
+                    )
+                else:
+                    extracted_keywords = run_keyword_extraction_many(
+                        pdf_paths=pdf_paths,
+                        lm=args.spacy_lang_model,
+                        min_kwrd_length=args.min_keywords_length,
+                        max_keywords_num=args.max_keywords_num,
+                        cache_dir=None if args.no_cache else args.cache_dir,
+                        num_workers=args.extraction_workers,
+                        batch_size=args.batch_size,
+                        n_process=args.n_process,
+                        engine=args.keyword_engine,
+                    )
+            # Displaying keywords of a single article without its path
+            if len(args.filepath) == 1 and pdf_paths == args.filepath:
+                print(f"Extracted keywords: {extracted_keywords[0]}")
+            else:
+                for pdf_path, kwrds in zip(pdf_paths, extracted_keywords):
+                    print(f"{pdf_path}: {kwrds}")
 
         # Sub-command to run summarization and summary report generation
         elif args.command == "summarize":
@@ -210,14 +590,87 @@ def main():
                 cli_config=cli_args,
             )
 
+            # Saving profiling results next to the report
+            if final_config["profile"]:
+                profiler = Profiler(
+                    output_dir=final_config["save_folder"],
+                    name=Path(final_config["report_name"]).stem,
+                    top_n=final_config["profile_top"],
+                    trace_generation=final_config["profile_torch"],
+                )
+                if final_config["server"]:
+                    profiler.skip("summarization on the server")
+                if final_config["extraction_workers"] > 1:
+                    profiler.skip("page extraction of large PDF-files")
+
             # Running summarization and generating report
-            if args.generate_summary_report:
-                run_summarization(config=final_config, generate_report=True)
-            else:
-                # Running summarization and displaying summary without report generation
-                generated_summary = run_summarization(config=final_config)
+            with profiler.profile() if profiler else nullcontext():
+                if final_config["server"]:
+                    # Sending the job to the server with the model already loaded
+                    generated_summary = run_summarization_remote(
+                        config=final_config,
+                        generate_report=bool(args.generate_summary_report),
+                    )
+                else:
+                    generated_summary = run_summarization(
+                        config=final_config,
+                        generate_report=bool(args.generate_summary_report),
+                        profiler=profiler,
+                    )
+            if not args.generate_summary_report:
+                # Displaying summary without report generation
                 print(f"Generated summary: {generated_summary}")
-        return 0
+
+        # Sub-command to summarize many articles with the model loaded once
+        elif args.command == "summarize-batch":
+            # Collecting the configuration shared by all articles
+            cli_args = {k: v for k, v in vars(args).items() if v is not None}
+            final_config = merge_configs(
+                default_config=asdict(DefaultCLIParametersConfig(filepath="")),
+                file_config=load_config(config_path=args.config),
+                cli_config=cli_args,
+            )
+
+            # Saving profiling results to the folder with reports
+            if final_config["profile"]:
+                profiler = Profiler(
+                    output_dir=final_config["save_folder"],
+                    name="summarize_batch",
+                    top_n=final_config["profile_top"],
+                    trace_generation=final_config["profile_torch"],
+                )
+                if final_config["extraction_workers"] > 1:
+                    profiler.skip("page extraction of large PDF-files")
+
+            with profiler.profile() if profiler else nullcontext():
+                stats = run_batch_summarization(
+                    inputs=args.inputs,
+                    config=final_config,
+                    generate_report=bool(args.generate_summary_report),
+                    profiler=profiler,
+                )
+            # Signalling that some articles could not be summarized
+            if stats.failed > 0:
+                exit_code = 1
+
+        # Sub-command to serve summarization jobs with a resident model
+        elif args.command == "serve":
+            run_server(
+                address=args.address,
+                model_path=args.model_path,
+                tokenizer_path=args.tokenizer_path,
+                lora_adapters_path=args.lora_adapters_path,
+                lm=args.spacy_lang_model,
+                max_batch_size=args.max_batch_size,
+                max_wait_ms=args.max_wait_ms,
+                cache_dir=None if args.no_cache else args.cache_dir,
+                extraction_workers=args.extraction_workers,
+            )
+
+        # Displaying the hotspots found by profiling
+        if profiler is not None:
+            print(profiler.summary(), file=sys.stderr)
+        return exit_code
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
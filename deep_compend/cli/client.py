@@ -0,0 +1,205 @@
+"""Thin client of the summarization server."""
+
+import http.client
+import json
+import socket
+from pathlib import Path
+from typing import Any, Optional, Union
+
+# Address of the server started by `deep-compend serve` without options
+DEFAULT_SERVER_ADDRESS = "127.0.0.1:8765"
+
+
+def parse_server_address(
+    address: str,
+) -> tuple[str, Union[str, tuple[str, int]]]:
+    """Parses the address of a server listening on a TCP port or a Unix socket.
+
+    Args:
+        address (str): Address in the form "host:port" (optionally prefixed by "http://") or "unix:/path/to/socket".
+
+    Raises:
+        ValueError: Exception raised if the address is malformed.
+
+    Returns:
+        tuple[str, Union[str, tuple[str, int]]]: Socket family ("tcp" or "unix") and host with port or path to the socket.
+    """
+    if address.startswith("unix:"):
+        path = address[len("unix:") :].removeprefix("//")
+        if not path:
+            raise ValueError("Path to the Unix socket should not be empty.")
+        return "unix", path
+
+    host, _, port = address.removeprefix("http://").rstrip("/").rpartition(":")
+    if not host or not port.isdigit():
+        raise ValueError(
+            "Server address should be 'host:port' or 'unix:/path/to/socket'."
+        )
+
+    return "tcp", (host, int(port))
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix socket."""
+
+    def __init__(self, socket_path: str, timeout: float):
+        """Initializes a _UnixHTTPConnection instance.
+
+        Args:
+            socket_path (str): Path to the Unix socket.
+            timeout (float): Timeout of socket operations in seconds.
+        """
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        """Connects to the Unix socket."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+class SummarizationClient:
+    """Sends summarization and keyword extraction jobs to a running `deep-compend serve`.
+
+    The client does not import PyTorch, Transformers or SpaCy. Paths are resolved before
+    being sent, so that the server reads articles and writes reports at the same locations.
+
+    Attributes:
+        address (str): Address of the server.
+        timeout (float): Timeout of a single request in seconds.
+    """
+
+    def __init__(
+        self, address: str = DEFAULT_SERVER_ADDRESS, timeout: float = 600.0
+    ):
+        """Initializes a SummarizationClient instance.
+
+        Args:
+            address (str, optional): Address in the form "host:port" or "unix:/path/to/socket". Defaults to "127.0.0.1:8765".
+            timeout (float, optional): Timeout of a single request in seconds. Defaults to 600.0.
+        """
+        self.address = address
+        self.timeout = timeout
+        self._family, self._location = parse_server_address(address)
+
+    def _connect(self) -> http.client.HTTPConnection:
+        """Opens a connection to the server."""
+        if self._family == "unix":
+            return _UnixHTTPConnection(self._location, timeout=self.timeout)
+
+        host, port = self._location
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _request(
+        self, method: str, endpoint: str, payload: Optional[dict] = None
+    ) -> dict[str, Any]:
+        """Sends a request to the server and decodes its JSON response.
+
+        Args:
+            method (str): HTTP method.
+            endpoint (str): Path of the endpoint.
+            payload (Optional[dict], optional): JSON body of the request. Defaults to None.
+
+        Raises:
+            ConnectionError: Exception raised if the server is not reachable.
+            RuntimeError: Exception raised if the server failed to process the request.
+
+        Returns:
+            dict[str, Any]: Decoded response.
+        """
+        body = json.dumps(payload).encode("utf-8") if payload else None
+        connection = self._connect()
+        try:
+            connection.request(
+                method,
+                endpoint,
+                body=body,
+                headers={"Content-Type": "application/json"},
+            )
+            response = connection.getresponse()
+            data = json.loads(response.read() or b"{}")
+        except (ConnectionRefusedError, FileNotFoundError) as e:
+            raise ConnectionError(
+                f"Summarization server is not reachable at '{self.address}'."
+            ) from e
+        finally:
+            connection.close()
+
+        if response.status != 200:
+            raise RuntimeError(data.get("error", f"HTTP {response.status}"))
+
+        return data
+
+    def health(self) -> dict[str, Any]:
+        """Retrieves the state of the server.
+
+        Returns:
+            dict[str, Any]: Loaded model and statistics of processed requests.
+        """
+        return self._request("GET", "/health")
+
+    def summarize(
+        self,
+        pdf_path: str,
+        config: Optional[dict[str, Any]] = None,
+        long_document: bool = False,
+        report: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Summarizes an article on the server.
+
+        Args:
+            pdf_path (str): Path to an article to be summarized.
+            config (Optional[dict[str, Any]], optional): Fields of SummaryGenerationConfig (defaults of the server if None). Defaults to None.
+            long_document (bool, optional): Flag to summarize the full article text in chunks. Defaults to False.
+            report (Optional[dict[str, Any]], optional): Arguments of `generate_summary_report` to additionally write a report. Defaults to None.
+
+        Returns:
+            dict[str, Any]: Path to the article, summary, statistics and path to the report (if written).
+        """
+        if report is not None and "save_folder" in report:
+            report = {
+                **report,
+                "save_folder": str(Path(report["save_folder"]).resolve()),
+            }
+
+        return self._request(
+            "POST",
+            "/summarize",
+            {
+                "filepath": str(Path(pdf_path).resolve()),
+                "config": config or {},
+                "long_document": long_document,
+                "report": report,
+            },
+        )
+
+    def extract_keywords(
+        self,
+        pdf_path: str,
+        lm: str = "en_core_web_sm",
+        min_kwrd_length: int = 3,
+        engine: str = "spacy",
+    ) -> list[str]:
+        """Extracts keywords of an article on the server.
+
+        Args:
+            pdf_path (str): Path to an article.
+            lm (str, optional): Name of a language model to be used for keyword extraction. Defaults to "en_core_web_sm".
+            min_kwrd_length (int, optional): Minimum length of a keyword to consider. Defaults to 3.
+            engine (str, optional): Backend scoring keyword candidates ("spacy" or "tfidf"). Defaults to "spacy".
+
+        Returns:
+            list[str]: Extracted keywords.
+        """
+        return self._request(
+            "POST",
+            "/keywords",
+            {
+                "filepath": str(Path(pdf_path).resolve()),
+                "lm": lm,
+                "min_kwrd_length": min_kwrd_length,
+                "engine": engine,
+            },
+        )["keywords"]
@@ -24,6 +24,25 @@ class DefaultCLIParametersConfig:
         min_keywords_length (int): Minimum length of a keyword to consider. Defaults to 3.
         spacy_lang_model (str): Name of a SpaCy model to use for keywords retrieval. Defaults to "en_core_web_sm".
         config (Optional[str]): Name of a config file for summary generation. Defaults to None.
+        long_document (bool): Flag to summarize the full article text exceeding the context window. Defaults to False.
+        cache_dir (str): Directory with persistent caches. Defaults to "~/.cache/deep-compend".
+        no_cache (bool): Flag to disable the extracted text and summary caches. Defaults to False.
+        refresh_cache (bool): Flag to regenerate summaries ignoring cached ones. Defaults to False.
+        cache_max_size_mb (int): Maximum size of the summary cache in megabytes. Defaults to 512.
+        cache_max_age_days (Optional[float]): Maximum age of cached summaries in days. Defaults to None.
+        extraction_workers (int): Number of processes extracting page texts of large PDF-files. Defaults to 1.
+        keyword_engine (str): Backend for keyword extraction ("spacy" or "tfidf"). Defaults to "spacy".
+        profile (bool): Flag to save a cProfile dump next to the report and display hotspots. Defaults to False.
+        profile_torch (bool): Flag to save PyTorch profiler traces of `generate` calls when profiling. Defaults to False.
+        profile_top (int): Number of hotspots to display when profiling. Defaults to 20.
+        server (Optional[str]): Address of a running summarization server to send the job to. Defaults to None.
+        batch_size (int): Maximum number of articles summarized in one `generate` call by `summarize-batch`. Defaults to 8.
+        max_pending (int): Maximum number of articles prepared ahead of generation by `summarize-batch`. Defaults to 16.
+        prepare_workers (int): Number of processes extracting and cleaning articles for `summarize-batch`. Defaults to 2.
+        journal (Optional[str]): Path to the journal of `summarize-batch` allowing interrupted runs to resume. Defaults to None.
+        max_attempts (int): Maximum number of attempts to summarize an article recorded in the journal. Defaults to 3.
+        num_workers (int): Number of processes summarizing articles for `summarize-batch` (summarized in the main process if 1). Defaults to 1.
+        threads_per_worker (Optional[int]): Number of CPU cores and PyTorch threads of each worker process (cores split evenly if None). Defaults to None.
     """
 
     filepath: str
@@ -43,6 +62,25 @@ class DefaultCLIParametersConfig:
     min_keywords_length: int = 3
     spacy_lang_model: str = "en_core_web_sm"
     config: Optional[str] = None
+    long_document: bool = False
+    cache_dir: str = "~/.cache/deep-compend"
+    no_cache: bool = False
+    refresh_cache: bool = False
+    cache_max_size_mb: int = 512
+    cache_max_age_days: Optional[float] = None
+    extraction_workers: int = 1
+    keyword_engine: str = "spacy"
+    profile: bool = False
+    profile_torch: bool = False
+    profile_top: int = 20
+    server: Optional[str] = None
+    batch_size: int = 8
+    max_pending: int = 16
+    prepare_workers: int = 2
+    journal: Optional[str] = None
+    max_attempts: int = 3
+    num_workers: int = 1
+    threads_per_worker: Optional[int] = None
 
     @staticmethod
     def from_dict(d: dict) -> "DefaultCLIParametersConfig":
@@ -0,0 +1,237 @@
+"""Append-only journal of batch summarization jobs allowing interrupted runs to resume."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+# Parameters affecting how articles are processed but not their summaries and reports
+RUN_ONLY_PARAMETERS = frozenset(
+    {
+        "config",
+        "filepath",
+        "no_cache",
+        "refresh_cache",
+        "cache_dir",
+        "cache_max_size_mb",
+        "cache_max_age_days",
+        "extraction_workers",
+        "profile",
+        "profile_torch",
+        "profile_top",
+        "server",
+        "batch_size",
+        "max_pending",
+        "prepare_workers",
+        "journal",
+        "max_attempts",
+        "num_workers",
+        "threads_per_worker",
+    }
+)
+
+
+@dataclass
+class JournalEntry:
+    """Latest state of a job recorded in the journal.
+
+    Attributes:
+        pdf_path (str): Path to the article.
+        status (str): State of the job ("done" or "failed").
+        attempts (int): Number of failed attempts.
+        error (Optional[str]): Message of the latest error.
+    """
+
+    pdf_path: str
+    status: str
+    attempts: int = 0
+    error: Optional[str] = None
+
+
+class BatchJournal:
+    """Append-only JSONL journal of finished and failed batch jobs.
+
+    Every finished or failed job appends a single line, which is flushed (and synced to disk
+    with `sync=True`) right away, so that a run interrupted at any point can be resumed
+    skipping the finished jobs. Jobs are keyed on a fingerprint of the PDF-file (path, size
+    and modification time) and the effective configuration of the job, so that changed
+    articles or parameters are processed again. A truncated last line left by a crash is ignored.
+
+    Attributes:
+        path (Path): Path to the journal.
+        sync (bool): Flag to sync every appended line to disk.
+        entries (dict[str, JournalEntry]): Latest state of each recorded job.
+    """
+
+    def __init__(self, path: str, sync: bool = True):
+        """Initializes a BatchJournal instance and loads the recorded jobs.
+
+        Args:
+            path (str): Path to the journal (created if non-existent).
+            sync (bool, optional): Flag to sync every appended line to disk. Defaults to True.
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.sync = sync
+        self.entries: dict[str, JournalEntry] = {}
+        self._lock = threading.Lock()
+        self._load()
+        self._file = self.path.open("a", encoding="utf-8")
+        # Terminating the truncated last line so that it does not corrupt the next one
+        if self.path.stat().st_size > 0:
+            with self.path.open("rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    self._file.write("\n")
+
+    def _load(self) -> None:
+        """Replays the journal keeping the latest state of each job."""
+        if not self.path.exists():
+            return
+
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    self.entries[record["key"]] = JournalEntry(
+                        pdf_path=record["pdf_path"],
+                        status=record["status"],
+                        attempts=record.get("attempts", 0),
+                        error=record.get("error"),
+                    )
+                except (ValueError, KeyError, TypeError):
+                    # Skipping the line being written when the run was interrupted
+                    continue
+
+    @staticmethod
+    def make_key(pdf_path: str, config: dict[str, Any]) -> str:
+        """Computes the key of a job from the PDF-file fingerprint and the effective configuration.
+
+        Args:
+            pdf_path (str): Path to the article.
+            config (dict[str, Any]): Effective configuration of the job.
+
+        Returns:
+            str: Hexadecimal SHA-256 digest.
+        """
+        try:
+            stat = os.stat(pdf_path)
+            fingerprint = (
+                f"{Path(pdf_path).resolve()}|{stat.st_size}|{stat.st_mtime_ns}"
+            )
+        except OSError:
+            # Keying missing files by path so that their failures are recorded as well
+            fingerprint = str(Path(pdf_path).resolve())
+        payload = json.dumps(
+            {
+                "file": fingerprint,
+                "config": {
+                    k: v
+                    for k, v in config.items()
+                    if k not in RUN_ONLY_PARAMETERS
+                },
+            },
+            sort_keys=True,
+        )
+
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _append(self, key: str, entry: JournalEntry) -> None:
+        """Appends the state of a job to the journal.
+
+        Args:
+            key (str): Key of the job computed with `make_key`.
+            entry (JournalEntry): State of the job.
+        """
+        line = json.dumps(
+            {
+                "key": key,
+                "pdf_path": entry.pdf_path,
+                "status": entry.status,
+                "attempts": entry.attempts,
+                "error": entry.error,
+                "time": time.time(),
+            }
+        )
+        with self._lock:
+            self.entries[key] = entry
+            self._file.write(line + "\n")
+            self._file.flush()
+            if self.sync:
+                os.fsync(self._file.fileno())
+
+    def is_done(self, key: str) -> bool:
+        """Checks whether a job has been finished.
+
+        Args:
+            key (str): Key of the job computed with `make_key`.
+
+        Returns:
+            bool: True if the job has been finished.
+        """
+        entry = self.entries.get(key)
+
+        return entry is not None and entry.status == "done"
+
+    def attempts(self, key: str) -> int:
+        """Returns the number of failed attempts of a job.
+
+        Args:
+            key (str): Key of the job computed with `make_key`.
+
+        Returns:
+            int: Number of failed attempts (0 if the job has not failed).
+        """
+        entry = self.entries.get(key)
+
+        return entry.attempts if entry is not None else 0
+
+    def record_done(self, key: str, pdf_path: str) -> None:
+        """Records a finished job.
+
+        Args:
+            key (str): Key of the job computed with `make_key`.
+            pdf_path (str): Path to the article.
+        """
+        self._append(
+            key,
+            JournalEntry(
+                pdf_path=pdf_path, status="done", attempts=self.attempts(key)
+            ),
+        )
+
+    def record_failure(
+        self, key: str, pdf_path: str, error: Exception
+    ) -> None:
+        """Records a failed attempt of a job.
+
+        Args:
+            key (str): Key of the job computed with `make_key`.
+            pdf_path (str): Path to the article.
+            error (Exception): Raised exception.
+        """
+        self._append(
+            key,
+            JournalEntry(
+                pdf_path=pdf_path,
+                status="failed",
+                attempts=self.attempts(key) + 1,
+                error=f"{type(error).__name__}: {error}",
+            ),
+        )
+
+    def close(self) -> None:
+        """Closes the journal."""
+        self._file.close()
+
+    def __enter__(self) -> "BatchJournal":
+        """Returns the opened journal."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Closes the journal."""
+        self.close()
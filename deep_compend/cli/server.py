@@ -0,0 +1,388 @@
+"""Long-lived summarization server keeping models resident between requests."""
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional
+
+from ..core.batcher import MicroBatcher
+from ..core.configs import SummaryGenerationConfig
+from ..core.summarizer import ArticleSummarizer
+from ..extractors import CorpusIndex, KeywordsExtractor
+from ..utils.timing import StageTimer
+from .client import parse_server_address
+
+
+class SummarizationService:
+    """Processes jobs of the server with a resident summarizer and keyword extractors.
+
+    Regular summaries of concurrent requests are generated in shared batches by a
+    micro-batcher. Long documents and reports rely on the latest result stored in the
+    summarizer, so they are processed one at a time.
+
+    Attributes:
+        summarizer (ArticleSummarizer): Instance of ArticleSummarizer class kept in memory.
+        batcher (MicroBatcher): Micro-batcher grouping concurrent requests into `generate` calls.
+        idf_index (Optional[CorpusIndex]): Index of document frequencies used by "tfidf" engine.
+    """
+
+    def __init__(
+        self,
+        summarizer: ArticleSummarizer,
+        max_batch_size: int = 8,
+        max_wait: float = 0.01,
+        idf_index: Optional[CorpusIndex] = None,
+    ):
+        """Initializes a SummarizationService instance and starts the micro-batcher.
+
+        Args:
+            summarizer (ArticleSummarizer): Instance of ArticleSummarizer class kept in memory.
+            max_batch_size (int, optional): Maximum number of requests in a batch. Defaults to 8.
+            max_wait (float, optional): Maximum time in seconds the first request of a batch waits for others. Defaults to 0.01.
+            idf_index (Optional[CorpusIndex], optional): Index of document frequencies used by "tfidf" engine. Defaults to None.
+        """
+        self.summarizer = summarizer
+        self.batcher = MicroBatcher(
+            summarizer=summarizer,
+            max_batch_size=max_batch_size,
+            max_wait=max_wait,
+        )
+        self.idf_index = idf_index
+        self._keywords_extractors: dict[tuple, KeywordsExtractor] = {}
+        self._keywords_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self.batcher.start()
+
+    def close(self) -> None:
+        """Stops the micro-batcher and saves the corpus index."""
+        self.batcher.close()
+        if self.idf_index is not None:
+            self.idf_index.save()
+
+    def _keywords_extractor(
+        self, lm: str, min_kwrd_length: int, engine: str
+    ) -> KeywordsExtractor:
+        """Returns a keyword extractor with the given settings created once per server.
+
+        Args:
+            lm (str): Name of a language model to be used for keyword extraction.
+            min_kwrd_length (int): Minimum length of a keyword to consider.
+            engine (str): Backend scoring keyword candidates ("spacy" or "tfidf").
+
+        Returns:
+            KeywordsExtractor: Instance of a KeywordsExtractor class.
+        """
+        key = (lm, min_kwrd_length, engine)
+        with self._keywords_lock:
+            if key not in self._keywords_extractors:
+                self._keywords_extractors[key] = KeywordsExtractor(
+                    lm=lm,
+                    min_kwrd_length=min_kwrd_length,
+                    engine=engine,
+                    idf_index=self.idf_index if engine == "tfidf" else None,
+                )
+
+            return self._keywords_extractors[key]
+
+    def _extract_keywords(
+        self, text: str, lm: str, min_kwrd_length: int, engine: str
+    ) -> list[str]:
+        """Extracts keywords of an article text.
+
+        Args:
+            text (str): Cleaned text of an article.
+            lm (str): Name of a language model to be used for keyword extraction.
+            min_kwrd_length (int): Minimum length of a keyword to consider.
+            engine (str): Backend scoring keyword candidates ("spacy" or "tfidf").
+
+        Returns:
+            list[str]: Collection of extracted keywords.
+        """
+        keywords_extractor = self._keywords_extractor(
+            lm, min_kwrd_length, engine
+        )
+        if keywords_extractor.idf_index is None:
+            return keywords_extractor.extract(text)
+
+        # Updating the shared corpus index by one request at a time
+        with self._keywords_lock:
+            return self.summarizer._extract_keywords(text, keywords_extractor)
+
+    def _write_report(
+        self,
+        result: ArticleSummarizer.SummarizationResult,
+        filename: Optional[str] = None,
+        save_folder: str = "summaries",
+        linewidth: int = 100,
+        kwrds_num: int = 5,
+        lm: str = "en_core_web_sm",
+        min_kwrd_length: int = 3,
+        keyword_engine: str = "spacy",
+    ) -> Optional[str]:
+        """Writes a summary report of an article.
+
+        Args:
+            result (SummarizationResult): Summary and statistics of the article.
+            filename (Optional[str], optional): Report name. Defaults to None.
+            save_folder (str, optional): Folder where to save a report. Defaults to "summaries".
+            linewidth (int, optional): Max width of a line in a report. Defaults to 100.
+            kwrds_num (int, optional): Number of keywords to show in report. Defaults to 5.
+            lm (str, optional): Name of a language model to be used for keyword extraction. Defaults to "en_core_web_sm".
+            min_kwrd_length (int, optional): Minimal length of keyword to include. Defaults to 3.
+            keyword_engine (str, optional): Backend for keyword extraction ("spacy" or "tfidf"). Defaults to "spacy".
+
+        Raises:
+            ValueError: Exception raised if extension file in `filename` is not "txt".
+
+        Returns:
+            Optional[str]: Path to the report (None if `filename` is not specified).
+        """
+        if (filename is not None) and (".txt" not in filename):
+            raise ValueError("Summary report should have 'txt' extension.")
+
+        timer = StageTimer()
+        with timer.measure("keywords"):
+            keywords = self._extract_keywords(
+                result.clean_text, lm, min_kwrd_length, keyword_engine
+            )
+        with self._state_lock:
+            self.summarizer._store_result(result)
+            report_generator = self.summarizer.SummaryReportGenerator(
+                summarizer=self.summarizer,
+                save_folder=save_folder,
+                kwrds_num=kwrds_num,
+                linewidth=linewidth,
+                lm=lm,
+                min_kwrd_length=min_kwrd_length,
+                engine=keyword_engine,
+                idf_index=self.idf_index,
+                timer=timer,
+            )
+            report_generator.generate_txt_report(
+                filename=filename, keywords=keywords
+            )
+
+        return str(Path(save_folder) / filename) if filename else None
+
+    def summarize(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Summarizes an article and optionally writes its report.
+
+        Args:
+            payload (dict[str, Any]): Request with "filepath", "config", "long_document" and "report" fields.
+
+        Returns:
+            dict[str, Any]: Path to the article, summary, statistics and path to the report.
+        """
+        pdf_path = payload["filepath"]
+        config = SummaryGenerationConfig(**(payload.get("config") or {}))
+        if payload.get("long_document"):
+            with self._state_lock:
+                self.summarizer.summarize_long(
+                    pdf_path=pdf_path, config=config
+                )
+                result = self.summarizer.SummarizationResult(
+                    pdf_path=self.summarizer.pdf_path,
+                    clean_text=self.summarizer.clean_text,
+                    summary=self.summarizer.summary,
+                    stats=self.summarizer._get_stats(),
+                )
+        else:
+            result = self.batcher.summarize(pdf_path=pdf_path, config=config)
+
+        report_path = None
+        if payload.get("report") is not None:
+            report_path = self._write_report(result, **payload["report"])
+
+        return {
+            "pdf_path": result.pdf_path,
+            "summary": result.summary,
+            "stats": asdict(result.stats),
+            "report_path": report_path,
+        }
+
+    def extract_keywords(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Extracts keywords of an article.
+
+        Args:
+            payload (dict[str, Any]): Request with "filepath", "lm", "min_kwrd_length" and "engine" fields.
+
+        Returns:
+            dict[str, Any]: Extracted keywords.
+        """
+        _, text = self.summarizer._extract_text(
+            pdf_path=payload["filepath"], timer=StageTimer()
+        )
+        keywords = self._extract_keywords(
+            text,
+            lm=payload.get("lm", "en_core_web_sm"),
+            min_kwrd_length=payload.get("min_kwrd_length", 3),
+            engine=payload.get("engine", "spacy"),
+        )
+
+        return {"keywords": keywords}
+
+    def health(self) -> dict[str, Any]:
+        """Describes the loaded model and statistics of processed requests.
+
+        Returns:
+            dict[str, Any]: State of the server.
+        """
+        stats = self.batcher.stats
+
+        return {
+            "status": "ok",
+            "model_path": self.summarizer.model_path,
+            "device": str(self.summarizer.device),
+            "requests": stats.requests,
+            "batches": stats.batches,
+            "mean_batch_size": stats.mean_batch_size,
+            "max_batch_size": stats.max_batch_size,
+        }
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Routes HTTP requests with JSON bodies to the summarization service."""
+
+    def _send(self, status: int, body: dict[str, Any]) -> None:
+        """Sends a JSON response.
+
+        Args:
+            status (int): HTTP status code.
+            body (dict[str, Any]): Body of the response.
+        """
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        """Handles requests for the state of the server."""
+        if self.path == "/health":
+            self._send(200, self.server.service.health())
+        else:
+            self._send(404, {"error": f"Unknown endpoint '{self.path}'."})
+
+    def do_POST(self) -> None:
+        """Handles summarization and keyword extraction jobs."""
+        service: SummarizationService = self.server.service
+        routes = {
+            "/summarize": service.summarize,
+            "/keywords": service.extract_keywords,
+        }
+        if self.path not in routes:
+            self._send(404, {"error": f"Unknown endpoint '{self.path}'."})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            self._send(200, routes[self.path](payload))
+        except KeyError as e:
+            self._send(400, {"error": f"Missing field {e}."})
+        except (ValueError, TypeError) as e:
+            self._send(400, {"error": str(e)})
+        except Exception as e:
+            self._send(500, {"error": str(e)})
+
+    def log_message(self, format: str, *args) -> None:
+        """Disables logging of every request."""
+
+
+class _TCPServer(ThreadingHTTPServer):
+    """HTTP server handling each request in a separate thread."""
+
+    def __init__(
+        self, address: tuple[str, int], service: SummarizationService
+    ):
+        super().__init__(address, _RequestHandler)
+        self.service = service
+
+
+def _remove_socket(path: str) -> None:
+    """Removes a Unix socket file left by a server that is no longer running.
+
+    Args:
+        path (str): Path to the socket.
+
+    Raises:
+        FileExistsError: Exception raised if the path is not a Unix socket or a server is still listening on it.
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"'{path}' exists and is not a Unix socket.")
+
+    # Checking whether a server still accepts connections on the socket
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        # Server busy with a full backlog of connections is still running
+        probe.settimeout(1.0)
+        try:
+            probe.connect(path)
+            running = True
+        except FileNotFoundError:
+            return
+        except ConnectionRefusedError:
+            running = False
+        except TimeoutError:
+            running = True
+    if running:
+        raise FileExistsError(f"A server is already running on '{path}'.")
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP server listening on a Unix socket and handling each request in a separate thread."""
+
+    daemon_threads = True
+
+    def __init__(self, path: str, service: SummarizationService):
+        # Removing the socket left by a server that has not been shut down properly
+        _remove_socket(path)
+        super().__init__(path, _RequestHandler)
+        self.service = service
+
+    def server_close(self) -> None:
+        """Closes the server and removes the socket file."""
+        super().server_close()
+        # Leaving a file or a socket of another server that has replaced this one meanwhile
+        try:
+            _remove_socket(self.server_address)
+        except FileExistsError:
+            pass
+
+
+def make_server(
+    service: SummarizationService, address: str
+) -> socketserver.BaseServer:
+    """Creates an HTTP server exposing the summarization service.
+
+    Endpoints:
+        GET /health: State of the server.
+        POST /summarize: Summarization of an article (see `SummarizationService.summarize`).
+        POST /keywords: Keyword extraction (see `SummarizationService.extract_keywords`).
+
+    Args:
+        service (SummarizationService): Service processing the requests.
+        address (str): Address in the form "host:port" (port 0 picks a free port) or "unix:/path/to/socket".
+
+    Returns:
+        socketserver.BaseServer: Bound server ready for `serve_forever`.
+    """
+    family, location = parse_server_address(address)
+    if family == "unix":
+        return _UnixServer(location, service)
+
+    return _TCPServer(location, service)
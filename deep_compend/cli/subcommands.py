@@ -1,24 +1,131 @@
-from typing import Any, Optional
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import asdict
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from ..core.configs import SummaryGenerationConfig
-from ..core.summarizer import ArticleSummarizer
-from ..extractors import KeywordsExtractor, PDFExtractor
+from ..core.summary_cache import SummaryCache
+from ..extractors import (
+    CorpusIndex,
+    KeywordsExtractor,
+    PDFExtractor,
+    TextCache,
+)
+from ..utils.profiling import Profiler
+from ..utils.timing import format_timings
+from .batch import (
+    BatchJob,
+    BatchStatistics,
+    ReportSource,
+    ReportWriter,
+    collect_batch_jobs,
+    format_batch_statistics,
+    summarize_jobs,
+)
+from .client import SummarizationClient
+from .config import merge_configs
+from .journal import BatchJournal
 
+if TYPE_CHECKING:
+    from ..core.generation_metrics import GenerationMetrics
 
-def run_summarization(
-    config: dict[str, Any], generate_report: bool = False
-) -> Optional[str]:
-    """Generates summary and/or creates a summary report.
+
+def _open_text_cache(cache_dir: Optional[str]) -> Optional[TextCache]:
+    """Opens the persistent cache of extracted texts located in the cache directory.
+
+    Args:
+        cache_dir (Optional[str]): Directory with persistent caches (no cache if None).
+
+    Returns:
+        Optional[TextCache]: Cache of extracted texts or None.
+    """
+    if cache_dir is None:
+        return None
+
+    return TextCache(cache_dir=str(Path(cache_dir) / "texts"))
+
+
+def _open_idf_index(cache_dir: Optional[str]) -> Optional[CorpusIndex]:
+    """Opens the corpus index of document frequencies located in the cache directory.
+
+    Args:
+        cache_dir (Optional[str]): Directory with persistent caches (no index if None).
+
+    Returns:
+        Optional[CorpusIndex]: Index of document frequencies or None.
+    """
+    if cache_dir is None:
+        return None
+
+    return CorpusIndex(index_dir=str(Path(cache_dir) / "idf"))
+
+
+def _open_summary_cache(
+    cache_dir: str,
+    max_size_mb: int = 512,
+    max_age_days: Optional[float] = None,
+    refresh: bool = False,
+) -> SummaryCache:
+    """Opens the persistent cache of generated summaries located in the cache directory.
+
+    Args:
+        cache_dir (str): Directory with persistent caches.
+        max_size_mb (int, optional): Maximum size of the cache in megabytes. Defaults to 512.
+        max_age_days (Optional[float], optional): Maximum age of cached summaries in days. Defaults to None.
+        refresh (bool, optional): Flag to regenerate summaries ignoring cached ones. Defaults to False.
+
+    Returns:
+        SummaryCache: Cache of generated summaries.
+    """
+    return SummaryCache(
+        path=str(Path(cache_dir) / "summaries.sqlite"),
+        max_size_bytes=max_size_mb * 1024**2,
+        max_age_seconds=max_age_days * 86400 if max_age_days else None,
+        refresh=refresh,
+    )
+
+
+def _open_caches(
+    config: dict[str, Any],
+) -> tuple[Optional[TextCache], Optional[SummaryCache]]:
+    """Opens the persistent caches of extracted texts and generated summaries unless disabled.
 
     Args:
         config (dict[str, Any]): Configuration for summarization task.
-        generate_report (bool, optional): Flag to additionally generate summary report. Defaults to False.
 
     Returns:
-        Optional[str]: None or text of the generated summary.
+        tuple[Optional[TextCache], Optional[SummaryCache]]: Caches of extracted texts and generated summaries (None if disabled).
     """
-    # Defining the summary generation config
-    summ_config = SummaryGenerationConfig(
+    if config.get("no_cache"):
+        return None, None
+
+    cache_dir = config.get("cache_dir", "~/.cache/deep-compend")
+    summary_cache = _open_summary_cache(
+        cache_dir=cache_dir,
+        max_size_mb=config.get("cache_max_size_mb", 512),
+        max_age_days=config.get("cache_max_age_days"),
+        refresh=bool(config.get("refresh_cache")),
+    )
+
+    return _open_text_cache(cache_dir=cache_dir), summary_cache
+
+
+def _make_generation_config(config: dict[str, Any]) -> SummaryGenerationConfig:
+    """Collects parameters of summary generation from the CLI configuration.
+
+    Args:
+        config (dict[str, Any]): Configuration for summarization task.
+
+    Returns:
+        SummaryGenerationConfig: Configuration settings for summarization task.
+    """
+    return SummaryGenerationConfig(
         min_length=config["min_output_tokens"],
         max_length=config["max_output_tokens"],
         num_beams=config["num_beams"],
@@ -27,52 +134,509 @@ def run_summarization(
         no_repeat_ngram_size=config["no_repeat_ngram_size"],
     )
 
-    # Instantiating an object for summarization
+
+def run_summarization(
+    config: dict[str, Any],
+    generate_report: bool = False,
+    profiler: Optional[Profiler] = None,
+) -> Optional[str]:
+    """Generates summary and/or creates a summary report.
+
+    Args:
+        config (dict[str, Any]): Configuration for summarization task.
+        generate_report (bool, optional): Flag to additionally generate summary report. Defaults to False.
+        profiler (Optional[Profiler], optional): Profiler recording PyTorch traces of `generate` calls. Defaults to None.
+
+    Returns:
+        Optional[str]: None or text of the generated summary.
+    """
+    # Importing PyTorch and Transformers only when summarizing
+    from ..core.generation_metrics import format_generation_metrics
+    from ..core.summarizer import ArticleSummarizer
+
+    # Defining the summary generation config
+    summ_config = _make_generation_config(config)
+
+    # Opening the persistent caches of extracted texts and generated summaries
+    text_cache, summary_cache = _open_caches(config)
+
+    # Instantiating an object for summarization (optionally with LoRA adapters attached)
+    # Models loaded by previous calls are reused from the process-wide registry
     article_summarizer = ArticleSummarizer(
         model_path=config["model_path"],
         tokenizer_path=config.get("tokenizer_path"),
+        lora_adapters_path=config.get("lora_adapters_path"),
+        summary_cache=summary_cache,
+        text_cache=text_cache,
+        extraction_workers=config.get("extraction_workers", 1),
+        profiler=profiler,
     )
 
-    # Optionally attaching LoRA adapters to the model specified
-    if config.get("lora_adapters_path"):
-        article_summarizer.load_lora_adapters(
-            lora_adapters_path=config["lora_adapters_path"]
+    # Opening the corpus index of TF-IDF keyword engine
+    idf_index = None
+    keyword_engine = config.get("keyword_engine", "spacy")
+    if (
+        generate_report
+        and keyword_engine == "tfidf"
+        and not config.get("no_cache")
+    ):
+        idf_index = _open_idf_index(
+            cache_dir=config.get("cache_dir", "~/.cache/deep-compend")
         )
+    report_params = {
+        "filename": config["report_name"],
+        "linewidth": config["line_width"],
+        "kwrds_num": config["max_keywords_num"],
+        "save_folder": config["save_folder"],
+        "min_kwrd_length": config["min_keywords_length"],
+        "lm": config["spacy_lang_model"],
+        "keyword_engine": keyword_engine,
+        "idf_index": idf_index,
+    }
 
-    # Generating summary of the text
-    summary = article_summarizer.summarize(
-        pdf_path=config["filepath"], config=summ_config
-    )
+    # Generating summary of the text (in chunks if it exceeds the context window)
+    if config.get("long_document"):
+        summary = article_summarizer.summarize_long(
+            pdf_path=config["filepath"], config=summ_config
+        )
+        if generate_report:
+            article_summarizer.generate_summary_report(**report_params)
+    elif generate_report:
+        # Extracting keywords and statistics while the summary is generated
+        summary = article_summarizer.summarize_with_report(
+            pdf_path=config["filepath"], config=summ_config, **report_params
+        )
+        print(
+            f"Stage timings: {format_timings(article_summarizer.stage_timings)}",
+            file=sys.stderr,
+        )
+    else:
+        summary = article_summarizer.summarize(
+            pdf_path=config["filepath"], config=summ_config
+        )
 
-    # Generating a summary report
-    if generate_report:
-        article_summarizer.generate_summary_report(
-            filename=config["report_name"],
-            linewidth=config["line_width"],
-            kwrds_num=config["max_keywords_num"],
-            save_folder=config["save_folder"],
-            min_kwrd_length=config["min_keywords_length"],
-            lm=config["spacy_lang_model"],
+    # Reporting the speed of generation unless the summary has been cached
+    run_metrics = article_summarizer.run_metrics
+    if run_metrics.generate_calls > 0:
+        print(
+            f"Generation metrics: {format_generation_metrics(run_metrics)}",
+            file=sys.stderr,
         )
+
+    if idf_index is not None:
+        idf_index.save()
+
+    # Reporting how many summaries have been taken from the cache
+    if summary_cache is not None:
+        print(f"Summary cache: {summary_cache.stats}", file=sys.stderr)
+        summary_cache.close()
+
+    if generate_report:
         return
 
     return summary
 
 
-def run_text_extraction(pdf_path: str) -> str:
+def run_summarization_remote(
+    config: dict[str, Any], generate_report: bool = False
+) -> Optional[str]:
+    """Generates summary and/or creates a summary report on a running summarization server.
+
+    Caching and profiling options are ignored since they are set when the server is started.
+
+    Args:
+        config (dict[str, Any]): Configuration for summarization task with the address of the server in "server" key.
+        generate_report (bool, optional): Flag to additionally generate summary report. Defaults to False.
+
+    Returns:
+        Optional[str]: None or text of the generated summary.
+    """
+    client = SummarizationClient(address=config["server"])
+    report = None
+    if generate_report:
+        report = {
+            "filename": config["report_name"],
+            "save_folder": config["save_folder"],
+            "linewidth": config["line_width"],
+            "kwrds_num": config["max_keywords_num"],
+            "lm": config["spacy_lang_model"],
+            "min_kwrd_length": config["min_keywords_length"],
+            "keyword_engine": config.get("keyword_engine", "spacy"),
+        }
+    response = client.summarize(
+        pdf_path=config["filepath"],
+        config=asdict(_make_generation_config(config)),
+        long_document=bool(config.get("long_document")),
+        report=report,
+    )
+
+    if generate_report:
+        print(f"Summary saved to '{response['report_path']}'")
+        return
+
+    return response["summary"]
+
+
+def _summarize_jobs_with_workers(
+    jobs: list[BatchJob],
+    config: dict[str, Any],
+    stats: BatchStatistics,
+    on_result: Callable[[BatchJob, Any], None],
+    on_error: Callable[[BatchJob, Exception], None],
+    report_writer: Optional[ReportWriter] = None,
+    summary_cache: Optional[SummaryCache] = None,
+    text_cache: Optional[TextCache] = None,
+) -> "GenerationMetrics":
+    """Summarizes batch jobs in worker processes, each loading the model and pinned to its own CPU cores.
+
+    Args:
+        jobs (list[BatchJob]): Jobs with their effective configurations.
+        config (dict[str, Any]): Configuration for summarization task with "num_workers" and "threads_per_worker".
+        stats (BatchStatistics): Statistics of the run receiving the elapsed time (excluding model loading).
+        on_result (Callable[[BatchJob, Any], None]): Function called with each job and its result.
+        on_error (Callable[[BatchJob, Exception], None]): Function called with each failed job and its exception.
+        report_writer (Optional[ReportWriter], optional): Background writer of reports (None if reports are not generated). Defaults to None.
+        summary_cache (Optional[SummaryCache], optional): Persistent cache of generated summaries reopened by each worker. Defaults to None.
+        text_cache (Optional[TextCache], optional): Persistent cache of extracted texts. Defaults to None.
+
+    Returns:
+        GenerationMetrics: Generation speed aggregated over the workers.
+    """
+    from ..core.worker_pool import SummarizationWorkerPool
+
+    pool = SummarizationWorkerPool(
+        model_path=config["model_path"],
+        tokenizer_path=config.get("tokenizer_path"),
+        lora_adapters_path=config.get("lora_adapters_path"),
+        num_workers=config["num_workers"],
+        threads_per_worker=config.get("threads_per_worker"),
+        batch_size=config.get("batch_size", 8),
+        summary_cache=summary_cache,
+        text_cache=text_cache,
+        extraction_workers=config.get("extraction_workers", 1),
+    )
+    with pool, report_writer or nullcontext():
+        if report_writer is not None:
+            # Describing the model loaded by the workers in the reports
+            report_writer.summarizer.context_window = pool.workers[
+                0
+            ].context_window
+        for worker_id, worker in enumerate(pool.workers):
+            mapped_weights = (
+                f"{worker.mapped_weights:.0%}"
+                if worker.mapped_weights is not None
+                else "unknown"
+            )
+            print(
+                f"Worker {worker_id}: pid {worker.pid}, "
+                f"{worker.num_threads} threads on cores {worker.cores}, "
+                f"memory-mapped weights {mapped_weights}",
+                file=sys.stderr,
+            )
+        start = time.perf_counter()
+        for index, result, error in pool.summarize_as_completed(
+            [
+                (job.pdf_path, _make_generation_config(job.config))
+                for job in jobs
+            ]
+        ):
+            if error is None:
+                on_result(jobs[index], result)
+            else:
+                on_error(jobs[index], error)
+    stats.elapsed = time.perf_counter() - start
+
+    return pool.run_metrics
+
+
+def run_batch_summarization(
+    inputs: list[str],
+    config: dict[str, Any],
+    generate_report: bool = False,
+    profiler: Optional[Profiler] = None,
+) -> BatchStatistics:
+    """Summarizes articles from directories, glob patterns or JSONL manifests with the model loaded once.
+
+    Articles are extracted and cleaned by a pool of processes while previously prepared ones
+    are summarized in batches, and reports are written by a background thread. An article
+    that fails is reported without stopping the others. With a journal, finished and failed
+    articles are recorded as soon as they are processed, so that a restarted run skips the
+    finished ones and retries the failed ones up to `max_attempts` times in total. With
+    `num_workers` above 1, articles are summarized by worker processes instead, each
+    loading the model and pinned to its own slice of CPU cores.
+
+    Args:
+        inputs (list[str]): Directories with PDF-articles, glob patterns, JSONL manifests or paths to PDF-articles.
+        config (dict[str, Any]): Configuration for summarization task shared by all articles (overridden per article by manifests) with optional path to the "journal".
+        generate_report (bool, optional): Flag to additionally generate summary reports. Defaults to False.
+        profiler (Optional[Profiler], optional): Profiler recording PyTorch traces of `generate` calls. Defaults to None.
+
+    Raises:
+        ValueError: Exception raised if no articles are found, a report name does not have "txt" extension or several articles have the same report.
+
+    Returns:
+        BatchStatistics: Numbers of summarized, failed and skipped articles and throughput of the run.
+    """
+    # Importing PyTorch and Transformers only when summarizing
+    from ..core.generation_metrics import format_generation_metrics
+    from ..core.summarizer import ArticleSummarizer
+
+    # Resolving the effective configuration of each article before loading the model
+    jobs = collect_batch_jobs(inputs)
+    for job in jobs:
+        job.config = merge_configs(
+            default_config=config,
+            file_config={},
+            cli_config={**job.overrides, "filepath": job.pdf_path},
+        )
+        job.config["report_name"] = (
+            job.report_name or f"{Path(job.pdf_path).stem}.txt"
+        )
+        if generate_report and ".txt" not in job.config["report_name"]:
+            raise ValueError("Summary report should have 'txt' extension.")
+
+    # Refusing to overwrite reports of articles with the same name in different folders
+    if generate_report:
+        reported: dict[Path, str] = {}
+        for job in jobs:
+            report_path = (
+                Path(job.config["save_folder"]) / job.config["report_name"]
+            ).resolve()
+            if report_path in reported:
+                raise ValueError(
+                    f"Reports of '{reported[report_path]}' and '{job.pdf_path}' "
+                    f"would both be saved to '{report_path}'. "
+                    "Set distinct report names in a manifest."
+                )
+            reported[report_path] = job.pdf_path
+
+    def print_error(pdf_path: str, error: Exception) -> None:
+        """Displays the error of an article without stopping the run."""
+        print(f"Error: '{pdf_path}': {error}", file=sys.stderr)
+
+    # Skipping jobs finished by previous runs and those failed too many times
+    stats = BatchStatistics()
+    stats_lock = threading.Lock()
+    journal = None
+    if config.get("journal"):
+        journal = BatchJournal(path=config["journal"])
+        max_attempts = config.get("max_attempts", 3)
+        pending = []
+        for job in jobs:
+            job.key = journal.make_key(
+                job.pdf_path,
+                {**job.config, "generate_report": generate_report},
+            )
+            if journal.is_done(job.key):
+                stats.skipped += 1
+            elif journal.attempts(job.key) >= max_attempts:
+                stats.failed += 1
+                print_error(
+                    job.pdf_path,
+                    RuntimeError(
+                        f"Skipped after {journal.attempts(job.key)} failed attempts "
+                        f"(last error: {journal.entries[job.key].error})"
+                    ),
+                )
+            else:
+                pending.append(job)
+        jobs = pending
+
+    def on_done(job: BatchJob, error: Optional[Exception] = None) -> None:
+        """Counts and records a finished or failed article."""
+        with stats_lock:
+            if error is None:
+                stats.articles += 1
+            else:
+                stats.failed += 1
+        if error is not None:
+            print_error(job.pdf_path, error)
+        if journal is not None:
+            if error is None:
+                journal.record_done(job.key, job.pdf_path)
+            else:
+                journal.record_failure(job.key, job.pdf_path, error)
+
+    if not jobs:
+        print(
+            f"Batch throughput: {format_batch_statistics(stats)}",
+            file=sys.stderr,
+        )
+        if journal is not None:
+            journal.close()
+        return stats
+
+    # Opening the persistent caches of extracted texts and generated summaries
+    text_cache, summary_cache = _open_caches(config)
+    use_workers = config.get("num_workers", 1) > 1
+    # Worker processes load their own models, so this one only describes it in reports
+    article_summarizer = None
+    if not use_workers:
+        article_summarizer = ArticleSummarizer(
+            model_path=config["model_path"],
+            tokenizer_path=config.get("tokenizer_path"),
+            lora_adapters_path=config.get("lora_adapters_path"),
+            summary_cache=summary_cache,
+            text_cache=text_cache,
+            extraction_workers=config.get("extraction_workers", 1),
+            profiler=profiler,
+        )
+    idf_index = None
+    if (
+        generate_report
+        and any(job.config["keyword_engine"] == "tfidf" for job in jobs)
+        and not config.get("no_cache")
+    ):
+        idf_index = _open_idf_index(
+            cache_dir=config.get("cache_dir", "~/.cache/deep-compend")
+        )
+    report_writer = None
+    if generate_report:
+        report_writer = ReportWriter(
+            summarizer=article_summarizer
+            or ReportSource(
+                model_path=config["model_path"],
+                tokenizer_path=config.get("tokenizer_path"),
+                lora_adapters_path=config.get("lora_adapters_path"),
+            ),
+            idf_index=idf_index,
+        )
+
+    def on_result(job: BatchJob, result) -> None:
+        """Collects statistics of a summarized article and queues its report."""
+        with stats_lock:
+            stats.output_tokens += result.stats.output_token_count or 0
+        if not generate_report:
+            print(f"{job.pdf_path}: {result.summary}")
+            on_done(job)
+            return
+        # Recording the article once its report is written
+        report_writer.submit(
+            result,
+            {
+                "filename": job.config["report_name"],
+                "save_folder": job.config["save_folder"],
+                "kwrds_num": job.config["max_keywords_num"],
+                "linewidth": job.config["line_width"],
+                "lm": job.config["spacy_lang_model"],
+                "min_kwrd_length": job.config["min_keywords_length"],
+                "engine": job.config["keyword_engine"],
+            },
+            callback=partial(on_done, job),
+        )
+
+    if profiler is not None:
+        profiler.skip(
+            "summarization in worker processes"
+            if use_workers
+            else "extraction and cleaning of articles"
+        )
+
+    try:
+        if use_workers:
+            run_metrics = _summarize_jobs_with_workers(
+                jobs=jobs,
+                config=config,
+                stats=stats,
+                on_result=on_result,
+                on_error=on_done,
+                report_writer=report_writer,
+                summary_cache=summary_cache,
+                text_cache=text_cache,
+            )
+        else:
+            start = time.perf_counter()
+            with ProcessPoolExecutor(
+                max_workers=config.get("prepare_workers", 2)
+            ) as executor, report_writer or nullcontext():
+                asyncio.run(
+                    summarize_jobs(
+                        summarizer=article_summarizer,
+                        jobs=[
+                            (job, _make_generation_config(job.config))
+                            for job in jobs
+                        ],
+                        on_result=on_result,
+                        on_error=on_done,
+                        batch_size=config.get("batch_size", 8),
+                        max_pending=config.get("max_pending", 16),
+                        executor=executor,
+                    )
+                )
+            stats.elapsed = time.perf_counter() - start
+            run_metrics = article_summarizer.run_metrics
+    finally:
+        if journal is not None:
+            journal.close()
+
+    print(
+        f"Batch throughput: {format_batch_statistics(stats)}",
+        file=sys.stderr,
+    )
+    if run_metrics.generate_calls > 0:
+        print(
+            f"Generation metrics: {format_generation_metrics(run_metrics)}",
+            file=sys.stderr,
+        )
+
+    if idf_index is not None:
+        idf_index.save()
+    if summary_cache is not None:
+        # Cache hits of worker processes are counted by their own connections
+        if not use_workers:
+            print(f"Summary cache: {summary_cache.stats}", file=sys.stderr)
+        summary_cache.close()
+
+    return stats
+
+
+def run_text_extraction(
+    pdf_path: str, cache_dir: Optional[str] = None, num_workers: int = 1
+) -> str:
     """Retrieves preprocessed text from an article that goes as input to the model.
 
     Args:
         pdf_path (str): Path to PDF-article.
+        cache_dir (Optional[str], optional): Directory with persistent caches (no cache if None). Defaults to None.
+        num_workers (int, optional): Number of processes extracting page texts of large PDF-files. Defaults to 1.
     """
-    pdf_extractor = PDFExtractor(pdf_path=pdf_path)
+    pdf_extractor = PDFExtractor(
+        pdf_path=pdf_path,
+        text_cache=_open_text_cache(cache_dir),
+        num_workers=num_workers,
+    )
     extracted_text = pdf_extractor.retrieve_processed_text()
 
     return extracted_text
 
 
+def collect_pdf_paths(paths: list[str]) -> list[str]:
+    """Expands directories into paths to PDF-files located in them.
+
+    Args:
+        paths (list[str]): Paths to PDF-articles or directories with them.
+
+    Returns:
+        list[str]: Paths to PDF-articles (sorted by name within each directory).
+    """
+    pdf_paths = []
+    for path in paths:
+        if Path(path).is_dir():
+            pdf_paths.extend(str(p) for p in sorted(Path(path).glob("*.pdf")))
+        else:
+            pdf_paths.append(path)
+
+    return pdf_paths
+
+
 def run_keyword_extraction(
-    pdf_path: str, lm: str, min_kwrd_length: int, max_keywords_num: int
+    pdf_path: str,
+    lm: str,
+    min_kwrd_length: int,
+    max_keywords_num: int,
+    cache_dir: Optional[str] = None,
+    num_workers: int = 1,
+    engine: str = "spacy",
 ) -> list[str]:
     """Retrieves keywords from an article.
 
@@ -81,11 +645,173 @@ def run_keyword_extraction(
         lm (str): Name of a language model to be used for keyword extraction.
         min_kwrd_length (int): Minimum length of a keyword to consider.
         max_keywords_num (int): Maximum number of keywords to show.
+        cache_dir (Optional[str], optional): Directory with persistent caches (no cache if None). Defaults to None.
+        num_workers (int, optional): Number of processes extracting page texts of large PDF-files. Defaults to 1.
+        engine (str, optional): Backend scoring keyword candidates ("spacy" or "tfidf"). Defaults to "spacy".
+    """
+    return run_keyword_extraction_many(
+        pdf_paths=[pdf_path],
+        lm=lm,
+        min_kwrd_length=min_kwrd_length,
+        max_keywords_num=max_keywords_num,
+        cache_dir=cache_dir,
+        num_workers=num_workers,
+        engine=engine,
+    )[0]
+
+
+def run_keyword_extraction_many(
+    pdf_paths: list[str],
+    lm: str,
+    min_kwrd_length: int,
+    max_keywords_num: int,
+    cache_dir: Optional[str] = None,
+    num_workers: int = 1,
+    batch_size: int = 32,
+    n_process: int = 1,
+    engine: str = "spacy",
+) -> list[list[str]]:
+    """Retrieves keywords from several articles streamed through the language model in batches.
+
+    With "tfidf" engine, the articles are first added to the corpus index of document frequencies located in the cache directory.
+
+    Args:
+        pdf_paths (list[str]): Paths to PDF-articles.
+        lm (str): Name of a language model to be used for keyword extraction.
+        min_kwrd_length (int): Minimum length of a keyword to consider.
+        max_keywords_num (int): Maximum number of keywords to show.
+        cache_dir (Optional[str], optional): Directory with persistent caches (no cache if None). Defaults to None.
+        num_workers (int, optional): Number of processes extracting page texts of large PDF-files. Defaults to 1.
+        batch_size (int, optional): Number of texts processed by the language model at once. Defaults to 32.
+        n_process (int, optional): Number of processes running the language model. Defaults to 1.
+        engine (str, optional): Backend scoring keyword candidates ("spacy" or "tfidf"). Defaults to "spacy".
+
+    Returns:
+        list[list[str]]: Keywords of each article in the order of `pdf_paths`.
+    """
+    text_cache = _open_text_cache(cache_dir)
+    # Extracting texts lazily while the language model processes previous batches
+    texts = (
+        PDFExtractor(
+            pdf_path=pdf_path, text_cache=text_cache, num_workers=num_workers
+        ).retrieve_processed_text()
+        for pdf_path in pdf_paths
+    )
+
+    # Updating the corpus index before scoring so that IDF accounts for all articles
+    idf_index = None
+    if engine == "tfidf":
+        texts = list(texts)
+        idf_index = _open_idf_index(cache_dir)
+        if idf_index is not None:
+            idf_index.add_many(texts)
+            idf_index.save()
+
+    kwrds_extractor = KeywordsExtractor(
+        lm=lm,
+        min_kwrd_length=min_kwrd_length,
+        engine=engine,
+        idf_index=idf_index,
+    )
+    kwrds = kwrds_extractor.extract_many(
+        texts, batch_size=batch_size, n_process=n_process
+    )
+
+    return [doc_kwrds[:max_keywords_num] for doc_kwrds in kwrds]
+
+
+def run_keyword_extraction_remote(
+    pdf_paths: list[str],
+    server: str,
+    lm: str,
+    min_kwrd_length: int,
+    max_keywords_num: int,
+    engine: str = "spacy",
+) -> list[list[str]]:
+    """Retrieves keywords from several articles on a running summarization server.
+
+    Args:
+        pdf_paths (list[str]): Paths to PDF-articles.
+        server (str): Address of the server in the form "host:port" or "unix:/path/to/socket".
+        lm (str): Name of a language model to be used for keyword extraction.
+        min_kwrd_length (int): Minimum length of a keyword to consider.
+        max_keywords_num (int): Maximum number of keywords to show.
+        engine (str, optional): Backend scoring keyword candidates ("spacy" or "tfidf"). Defaults to "spacy".
+
+    Returns:
+        list[list[str]]: Keywords of each article in the order of `pdf_paths`.
     """
-    pdf_extractor = PDFExtractor(pdf_path=pdf_path)
-    text = pdf_extractor.retrieve_processed_text()
+    client = SummarizationClient(address=server)
+
+    return [
+        client.extract_keywords(
+            pdf_path=pdf_path,
+            lm=lm,
+            min_kwrd_length=min_kwrd_length,
+            engine=engine,
+        )[:max_keywords_num]
+        for pdf_path in pdf_paths
+    ]
 
-    kwrds_extractor = KeywordsExtractor(lm=lm, min_kwrd_length=min_kwrd_length)
-    kwrds = kwrds_extractor.extract(text)
 
-    return kwrds[:max_keywords_num]
+def run_server(
+    address: str,
+    model_path: str,
+    tokenizer_path: Optional[str] = None,
+    lora_adapters_path: Optional[str] = None,
+    lm: Optional[str] = "en_core_web_sm",
+    max_batch_size: int = 8,
+    max_wait_ms: float = 10.0,
+    cache_dir: Optional[str] = None,
+    extraction_workers: int = 1,
+) -> None:
+    """Serves summarization and keyword extraction jobs until interrupted.
+
+    Args:
+        address (str): Address to listen on in the form "host:port" or "unix:/path/to/socket".
+        model_path (str): Path to summarization model.
+        tokenizer_path (Optional[str], optional): Path to summarization model tokenizer. Defaults to None.
+        lora_adapters_path (Optional[str], optional): Path to LoRA adapters. Defaults to None.
+        lm (Optional[str], optional): Name of a SpaCy language model loaded at startup (not preloaded if None). Defaults to "en_core_web_sm".
+        max_batch_size (int, optional): Maximum number of requests summarized in one `generate` call. Defaults to 8.
+        max_wait_ms (float, optional): Maximum time in milliseconds a request waits for others to share a batch. Defaults to 10.0.
+        cache_dir (Optional[str], optional): Directory with persistent caches (no caches if None). Defaults to None.
+        extraction_workers (int, optional): Number of processes extracting page texts of large PDF-files. Defaults to 1.
+    """
+    # Importing the server only when serving since it loads PyTorch and Transformers
+    from ..core.summarizer import ArticleSummarizer
+    from ..extractors.keywords_extractor import load_spacy_pipeline
+    from .server import SummarizationService, make_server
+
+    summary_cache = (
+        _open_summary_cache(cache_dir=cache_dir) if cache_dir else None
+    )
+    summarizer = ArticleSummarizer(
+        model_path=model_path,
+        tokenizer_path=tokenizer_path,
+        lora_adapters_path=lora_adapters_path,
+        summary_cache=summary_cache,
+        text_cache=_open_text_cache(cache_dir),
+        extraction_workers=extraction_workers,
+    )
+    # Loading the language model before the first request arrives
+    if lm is not None:
+        load_spacy_pipeline(lm)
+
+    service = SummarizationService(
+        summarizer=summarizer,
+        max_batch_size=max_batch_size,
+        max_wait=max_wait_ms / 1000,
+        idf_index=_open_idf_index(cache_dir),
+    )
+    server = make_server(service=service, address=address)
+    print(f"Serving '{model_path}' at {address} (press Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if summary_cache is not None:
+            summary_cache.close()
@@ -0,0 +1,349 @@
+"""Asynchronous summarization with CPU stages pipelined against generation."""
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Optional
+
+import nltk
+
+from ..extractors import PDFExtractor, PDFSource, TextCache
+from ..utils.downloads import ensure_nltk_resource
+from ..utils.timing import StageTimer, StageTiming
+from .configs import SummaryGenerationConfig
+
+if TYPE_CHECKING:
+    from .summarizer import ArticleSummarizer
+
+
+def _extract_article(
+    pdf_path: PDFSource,
+    text_cache: Optional[TextCache] = None,
+    num_workers: int = 1,
+) -> tuple[str, str, int, int, dict[str, StageTiming]]:
+    """Retrieves and cleans the text of an article and counts its words and sentences.
+
+    Defined at module level, so that it can be run by a process executor.
+
+    Args:
+        pdf_path (PDFSource): Path to an article to be summarized or its content held in memory.
+        text_cache (Optional[TextCache], optional): Persistent cache of texts extracted from PDF-files. Defaults to None.
+        num_workers (int, optional): Number of processes extracting page texts of large PDF-files. Defaults to 1.
+
+    Returns:
+        tuple[str, str, int, int, dict[str, StageTiming]]: Path to the article (or name of its in-memory source), its cleaned text, numbers of words and sentences and timings of the stages.
+    """
+    timer = StageTimer()
+    pdf_extractor = PDFExtractor(
+        pdf_path=pdf_path,
+        text_cache=text_cache,
+        num_workers=num_workers,
+        timer=timer,
+    )
+    text = pdf_extractor.retrieve_processed_text()
+    with timer.measure("stats"):
+        word_count = len(nltk.tokenize.word_tokenize(text))
+        sentence_count = len(nltk.tokenize.sent_tokenize(text))
+
+    return pdf_extractor.name, text, word_count, sentence_count, timer.timings
+
+
+@dataclass
+class _AsyncRequest:
+    """Tokenized article waiting for generation.
+
+    Attributes:
+        article (ArticleSummarizer.PreparedArticle): Tokenized article.
+        config (SummaryGenerationConfig): Configuration settings for summarization task.
+        timer (StageTimer): Timer of the preparation stages.
+        future (asyncio.Future): Future receiving the result of summarization.
+    """
+
+    article: "ArticleSummarizer.PreparedArticle"
+    config: SummaryGenerationConfig
+    timer: StageTimer
+    future: asyncio.Future
+
+
+class AsyncSummarizationPipeline:
+    """Summarizes articles without blocking the event loop.
+
+    Extraction, cleaning and tokenization of articles run in an executor, and tokenized
+    articles are queued for a single generation worker, which summarizes all articles
+    queued so far (up to `batch_size`) in one `generate` call running in a dedicated thread.
+    Articles submitted meanwhile are prepared while the current batch is generated.
+    At most `max_pending` articles are being prepared or waiting in the queue, so that
+    submitting many articles at once does not hold all their texts in memory.
+
+    Usage:
+        async with AsyncSummarizationPipeline(summarizer) as pipeline:
+            future = await pipeline.submit("article.pdf")
+            result = await future
+
+    Attributes:
+        summarizer (ArticleSummarizer): Instance of ArticleSummarizer class used for generation.
+        batch_size (int): Maximum number of articles summarized in one `generate` call.
+        max_pending (int): Maximum number of articles being prepared or waiting for generation.
+        executor (Optional[Executor]): Executor running extraction and cleaning (default executor of the event loop if None).
+        loop (Optional[asyncio.AbstractEventLoop]): Event loop running the generation worker (None until started).
+    """
+
+    def __init__(
+        self,
+        summarizer: "ArticleSummarizer",
+        batch_size: int = 8,
+        max_pending: int = 16,
+        executor: Optional[Executor] = None,
+    ):
+        """Initializes an AsyncSummarizationPipeline instance.
+
+        Args:
+            summarizer (ArticleSummarizer): Instance of ArticleSummarizer class used for generation.
+            batch_size (int, optional): Maximum number of articles summarized in one `generate` call. Defaults to 8.
+            max_pending (int, optional): Maximum number of articles being prepared or waiting for generation. Defaults to 16.
+            executor (Optional[Executor], optional): Thread or process executor running extraction and cleaning (default executor of the event loop if None). Defaults to None.
+
+        Raises:
+            ValueError: Exception raised if `batch_size` or `max_pending` is not positive.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size should be a positive integer.")
+        if max_pending < 1:
+            raise ValueError(
+                "Maximum number of pending articles should be a positive integer."
+            )
+
+        self.summarizer = summarizer
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.executor = executor
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._worker: Optional[asyncio.Task] = None
+        # Number of submitted articles not queued yet and event set once there are none
+        self._preparing = 0
+        self._prepared: Optional[asyncio.Event] = None
+        self._closing = False
+
+        ensure_nltk_resource(resource_id="tokenizers/punkt")
+        ensure_nltk_resource(resource_id="tokenizers/punkt_tab")
+
+    def _start(self) -> None:
+        """Creates the queue and starts the generation worker in the running event loop."""
+        if self._worker is None:
+            # Leaving room for the item stopping the worker
+            self._queue = asyncio.Queue(maxsize=self.max_pending + 1)
+            self._slots = asyncio.Semaphore(self.max_pending)
+            self._prepared = asyncio.Event()
+            self._prepared.set()
+            self.loop = asyncio.get_running_loop()
+            self._worker = self.loop.create_task(self._run())
+
+    async def aclose(self) -> None:
+        """Summarizes the submitted articles and stops the generation worker.
+
+        Articles being prepared are queued before the worker is stopped, while articles
+        submitted once closing has started are rejected.
+        """
+        if self._worker is not None:
+            self._closing = True
+            try:
+                await self._prepared.wait()
+                await self._queue.put(None)
+                await self._worker
+            finally:
+                self._worker = None
+                self._closing = False
+
+    async def __aenter__(self) -> "AsyncSummarizationPipeline":
+        """Starts the generation worker."""
+        self._start()
+
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Stops the generation worker."""
+        await self.aclose()
+
+    async def _prepare(
+        self, pdf_path: PDFSource
+    ) -> tuple["ArticleSummarizer.PreparedArticle", StageTimer]:
+        """Extracts, cleans and tokenizes an article in executors.
+
+        Args:
+            pdf_path (PDFSource): Path to an article to be summarized or its content held in memory.
+
+        Returns:
+            tuple[PreparedArticle, StageTimer]: Tokenized article and timer of the preparation stages.
+        """
+        loop = asyncio.get_running_loop()
+        process_executor = isinstance(self.executor, ProcessPoolExecutor)
+        (
+            pdf_name,
+            text,
+            word_count,
+            sentence_count,
+            timings,
+        ) = await loop.run_in_executor(
+            self.executor,
+            (
+                _extract_article
+                if process_executor
+                else self.summarizer._profiled(_extract_article)
+            ),
+            pdf_path,
+            self.summarizer.text_cache,
+            self.summarizer.extraction_workers,
+        )
+        timer = StageTimer()
+        timer.timings.update(timings)
+        article = self.summarizer.PreparedArticle(
+            pdf_path=pdf_name,
+            clean_text=text,
+            model_input=self.summarizer._add_task_prefix(text),
+            word_count_full=word_count,
+            sentence_count_full=sentence_count,
+        )
+
+        # Tokenizing in a thread since the tokenizer is not available to other processes
+        def tokenize() -> None:
+            """Tokenizes the article text."""
+            with timer.measure("tokenize"):
+                article.input_ids = self.summarizer._tokenize(
+                    article.model_input
+                )
+
+        tokenizer_executor = None if process_executor else self.executor
+        await loop.run_in_executor(
+            tokenizer_executor, self.summarizer._profiled(tokenize)
+        )
+
+        return article, timer
+
+    async def submit(
+        self,
+        pdf_path: PDFSource,
+        config: Optional[SummaryGenerationConfig] = None,
+    ) -> asyncio.Future:
+        """Prepares an article and queues it for generation.
+
+        Waits while `max_pending` articles are already being prepared or queued.
+
+        Args:
+            pdf_path (PDFSource): Path to an article to be summarized or its content held in memory.
+            config (Optional[SummaryGenerationConfig], optional): Configuration settings for summarization task. Defaults to None.
+
+        Raises:
+            RuntimeError: Exception raised if the pipeline is being closed.
+
+        Returns:
+            asyncio.Future: Future receiving the SummarizationResult of the article.
+        """
+        if self._closing:
+            raise RuntimeError("Summarization pipeline is being closed.")
+        self._start()
+        # Keeping the worker running until the article is queued
+        self._preparing += 1
+        self._prepared.clear()
+        try:
+            # Taking a slot released once the generation worker takes the article
+            await self._slots.acquire()
+            try:
+                article, timer = await self._prepare(pdf_path)
+            except BaseException:
+                self._slots.release()
+                raise
+            future = asyncio.get_running_loop().create_future()
+            await self._queue.put(
+                _AsyncRequest(
+                    article=article,
+                    config=config or SummaryGenerationConfig(),
+                    timer=timer,
+                    future=future,
+                )
+            )
+        finally:
+            self._preparing -= 1
+            if self._preparing == 0:
+                self._prepared.set()
+
+        return future
+
+    async def summarize(
+        self,
+        pdf_path: PDFSource,
+        config: Optional[SummaryGenerationConfig] = None,
+    ) -> "ArticleSummarizer.SummarizationResult":
+        """Summarizes an article together with articles submitted concurrently.
+
+        Args:
+            pdf_path (PDFSource): Path to an article to be summarized or its content held in memory.
+            config (Optional[SummaryGenerationConfig], optional): Configuration settings for summarization task. Defaults to None.
+
+        Returns:
+            SummarizationResult: Summary and statistics of the article.
+        """
+        return await (await self.submit(pdf_path=pdf_path, config=config))
+
+    async def _generate(self, requests: list[_AsyncRequest]) -> None:
+        """Summarizes requests with the same generation config in a generation thread.
+
+        Args:
+            requests (list[_AsyncRequest]): Requests to be summarized together.
+        """
+        timer = StageTimer()
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self.summarizer._get_generation_executor(),
+                self.summarizer._profiled(
+                    partial(
+                        self.summarizer._generate_summaries,
+                        articles=[request.article for request in requests],
+                        config=requests[0].config,
+                        timer=timer,
+                    )
+                ),
+            )
+        except Exception as e:
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        self.summarizer._notify_timings(timer.timings)
+        for request, result in zip(requests, results):
+            # Combining timings of the preparation and of the shared batch
+            result.stats.stage_timings = {
+                **request.timer.timings,
+                **result.stats.stage_timings,
+            }
+            if not request.future.done():
+                request.future.set_result(result)
+
+    async def _run(self) -> None:
+        """Summarizes queued articles in batches until the pipeline is closed."""
+        closed = False
+        while not closed:
+            first = await self._queue.get()
+            if first is None:
+                break
+            # Taking articles queued while the previous batch was generated
+            batch = [first]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                request = self._queue.get_nowait()
+                if request is None:
+                    closed = True
+                    break
+                batch.append(request)
+            for _ in batch:
+                self._slots.release()
+
+            # Grouping requests by generation config preserving the arrival order
+            groups: dict[tuple, list[_AsyncRequest]] = {}
+            for request in batch:
+                key = tuple(asdict(request.config).items())
+                groups.setdefault(key, []).append(request)
+            for requests in groups.values():
+                await self._generate(requests)
@@ -0,0 +1,251 @@
+"""Micro-batching of concurrent summarization requests into shared `generate` calls."""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from ..extractors import PDFSource
+from ..utils.downloads import ensure_nltk_resource
+from ..utils.timing import StageTimer
+from .configs import SummaryGenerationConfig
+from .summarizer import ArticleSummarizer
+
+
+@dataclass
+class BatcherStatistics:
+    """Statistics of requests processed by a micro-batcher.
+
+    Attributes:
+        requests (int): Number of summarized requests.
+        batches (int): Number of batches sent to generation.
+        max_batch_size (int): Size of the largest batch.
+    """
+
+    requests: int = 0
+    batches: int = 0
+    max_batch_size: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Mean number of requests per batch."""
+        return self.requests / self.batches if self.batches != 0 else 0.0
+
+
+@dataclass
+class _Request:
+    """Summarization request waiting for generation.
+
+    Attributes:
+        article (ArticleSummarizer.PreparedArticle): Article prepared by the submitting thread.
+        config (SummaryGenerationConfig): Configuration settings for summarization task.
+        timer (StageTimer): Timer of the preparation stages.
+        future (Future): Future receiving the result of summarization.
+    """
+
+    article: ArticleSummarizer.PreparedArticle
+    config: SummaryGenerationConfig
+    timer: StageTimer
+    future: Future
+
+
+class MicroBatcher:
+    """Groups summarization requests submitted concurrently into batched `generate` calls.
+
+    Articles are extracted and cleaned by the submitting threads, while a single worker
+    thread owns the model: once a request arrives, it waits up to `max_wait` seconds
+    for more requests (or until `max_batch_size` of them are queued) and summarizes
+    requests with the same generation config together.
+
+    Usage:
+        with MicroBatcher(summarizer) as batcher:
+            result = batcher.summarize("article.pdf")
+
+    Attributes:
+        summarizer (ArticleSummarizer): Instance of ArticleSummarizer class used for generation.
+        max_batch_size (int): Maximum number of requests in a batch.
+        max_wait (float): Maximum time in seconds the first request of a batch waits for others.
+        stats (BatcherStatistics): Statistics of processed requests.
+    """
+
+    def __init__(
+        self,
+        summarizer: ArticleSummarizer,
+        max_batch_size: int = 8,
+        max_wait: float = 0.01,
+    ):
+        """Initializes a MicroBatcher instance.
+
+        Args:
+            summarizer (ArticleSummarizer): Instance of ArticleSummarizer class used for generation.
+            max_batch_size (int, optional): Maximum number of requests in a batch. Defaults to 8.
+            max_wait (float, optional): Maximum time in seconds the first request of a batch waits for others. Defaults to 0.01.
+
+        Raises:
+            ValueError: Exception raised if `max_batch_size` is not positive or `max_wait` is negative.
+        """
+        if max_batch_size < 1:
+            raise ValueError("Batch size should be a positive integer.")
+        if max_wait < 0:
+            raise ValueError("Waiting time should be non-negative.")
+
+        self.summarizer = summarizer
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.stats = BatcherStatistics()
+        self._queue: "queue.Queue[Optional[_Request]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+        ensure_nltk_resource(resource_id="tokenizers/punkt")
+        ensure_nltk_resource(resource_id="tokenizers/punkt_tab")
+
+    def start(self) -> None:
+        """Starts the worker thread running generation."""
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run, name="micro-batcher", daemon=True
+            )
+            self._worker.start()
+
+    def close(self) -> None:
+        """Summarizes the queued requests and stops the worker thread."""
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+
+    def __enter__(self) -> "MicroBatcher":
+        """Starts the worker thread."""
+        self.start()
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stops the worker thread."""
+        self.close()
+
+    def submit(
+        self,
+        pdf_path: PDFSource,
+        config: Optional[SummaryGenerationConfig] = None,
+    ) -> Future:
+        """Prepares an article in the calling thread and queues it for generation.
+
+        Args:
+            pdf_path (PDFSource): Path to an article to be summarized or its content held in memory.
+            config (Optional[SummaryGenerationConfig], optional): Configuration settings for summarization task. Defaults to None.
+
+        Raises:
+            RuntimeError: Exception raised if the worker thread is not running.
+
+        Returns:
+            Future: Future receiving the SummarizationResult of the article.
+        """
+        if self._worker is None:
+            raise RuntimeError("Micro-batcher is not running.")
+
+        timer = StageTimer()
+        article = self.summarizer._prepare_article(
+            pdf_path=pdf_path, timer=timer
+        )
+        future = Future()
+        self._queue.put(
+            _Request(
+                article=article,
+                config=config or SummaryGenerationConfig(),
+                timer=timer,
+                future=future,
+            )
+        )
+
+        return future
+
+    def summarize(
+        self,
+        pdf_path: PDFSource,
+        config: Optional[SummaryGenerationConfig] = None,
+    ) -> ArticleSummarizer.SummarizationResult:
+        """Summarizes an article together with requests submitted concurrently.
+
+        Args:
+            pdf_path (PDFSource): Path to an article to be summarized or its content held in memory.
+            config (Optional[SummaryGenerationConfig], optional): Configuration settings for summarization task. Defaults to None.
+
+        Returns:
+            SummarizationResult: Summary and statistics of the article.
+        """
+        return self.submit(pdf_path=pdf_path, config=config).result()
+
+    def _collect_batch(self, first: _Request) -> tuple[list[_Request], bool]:
+        """Collects requests arriving shortly after the first one.
+
+        Args:
+            first (_Request): Request starting the batch.
+
+        Returns:
+            tuple[list[_Request], bool]: Collected requests and flag showing that the batcher is closed.
+        """
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            try:
+                request = self._queue.get(
+                    timeout=max(deadline - time.perf_counter(), 0)
+                )
+            except queue.Empty:
+                break
+            if request is None:
+                return batch, True
+            batch.append(request)
+
+        return batch, False
+
+    def _generate(self, requests: list[_Request]) -> None:
+        """Summarizes requests with the same generation config in a single batch.
+
+        Args:
+            requests (list[_Request]): Requests to be summarized together.
+        """
+        timer = StageTimer()
+        try:
+            results = self.summarizer._generate_summaries(
+                articles=[request.article for request in requests],
+                config=requests[0].config,
+                timer=timer,
+            )
+        except Exception as e:
+            for request in requests:
+                request.future.set_exception(e)
+            return
+
+        self.stats.requests += len(requests)
+        self.stats.batches += 1
+        self.stats.max_batch_size = max(
+            self.stats.max_batch_size, len(requests)
+        )
+        for request, result in zip(requests, results):
+            # Combining timings of the preparation and of the shared batch
+            result.stats.stage_timings = {
+                **request.timer.timings,
+                **result.stats.stage_timings,
+            }
+            request.future.set_result(result)
+
+    def _run(self) -> None:
+        """Summarizes queued requests in batches until the batcher is closed."""
+        closed = False
+        while not closed:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch, closed = self._collect_batch(first)
+
+            # Grouping requests by generation config preserving the arrival order
+            groups: dict[tuple, list[_Request]] = {}
+            for request in batch:
+                key = tuple(asdict(request.config).items())
+                groups.setdefault(key, []).append(request)
+            for requests in groups.values():
+                self._generate(requests)
@@ -0,0 +1,234 @@
+"""Measurement of generation speed and memory usage of summarization models."""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import torch
+from transformers import LogitsProcessor
+
+
+def current_rss_mb() -> Optional[float]:
+    """Looks up the current resident set size of the process.
+
+    Returns:
+        Optional[float]: Current RSS in megabytes (None if not supported by the platform).
+    """
+    try:
+        with open("/proc/self/statm", "rb") as file:
+            resident_pages = int(file.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        # Statistics of the process are only available on Linux
+        return None
+
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / 1024**2
+
+
+@dataclass
+class GenerationMetrics:
+    """Speed and memory usage of `generate` calls.
+
+    Attributes:
+        generate_calls (int): Number of measured `generate` calls.
+        encoder_time (float): Seconds spent in the encoder.
+        decode_time (float): Seconds spent in `generate` after the encoder.
+        time_to_first_token (float): Mean seconds from the start of `generate` until the first token is chosen.
+        output_token_count (int): Number of generated tokens without padding.
+        decode_tokens_per_sec (float): Generated tokens per second of decoding.
+        rss_growth_mb (Optional[float]): Largest growth of resident memory of the process during a `generate` call in megabytes, sampled at every decoding step (None if not supported). Memory allocated meanwhile by other threads of the process is included.
+        peak_cuda_memory_mb (Optional[float]): Peak memory allocated by PyTorch on CUDA device in megabytes (None on other devices).
+    """
+
+    generate_calls: int = 0
+    encoder_time: float = 0.0
+    decode_time: float = 0.0
+    time_to_first_token: float = 0.0
+    output_token_count: int = 0
+    decode_tokens_per_sec: float = 0.0
+    rss_growth_mb: Optional[float] = None
+    peak_cuda_memory_mb: Optional[float] = None
+
+    def add(self, other: "GenerationMetrics") -> None:
+        """Aggregates metrics of other `generate` calls into this object.
+
+        Args:
+            other (GenerationMetrics): Metrics to add.
+        """
+        calls = self.generate_calls + other.generate_calls
+        if calls == 0:
+            return
+
+        self.time_to_first_token = (
+            self.time_to_first_token * self.generate_calls
+            + other.time_to_first_token * other.generate_calls
+        ) / calls
+        self.generate_calls = calls
+        self.encoder_time += other.encoder_time
+        self.decode_time += other.decode_time
+        self.output_token_count += other.output_token_count
+        self.decode_tokens_per_sec = (
+            self.output_token_count / self.decode_time
+            if self.decode_time > 0
+            else 0.0
+        )
+        self.rss_growth_mb = _max_optional(
+            self.rss_growth_mb, other.rss_growth_mb
+        )
+        self.peak_cuda_memory_mb = _max_optional(
+            self.peak_cuda_memory_mb, other.peak_cuda_memory_mb
+        )
+
+
+def _max_optional(
+    first: Optional[float], second: Optional[float]
+) -> Optional[float]:
+    """Computes the maximum of two values that may be missing."""
+    values = [value for value in (first, second) if value is not None]
+
+    return max(values) if values else None
+
+
+class GenerationMonitor(LogitsProcessor):
+    """Measures a single `generate` call of a seq2seq model.
+
+    The encoder is timed by forward hooks, while the time to first token is taken when
+    the monitor is called as a logits processor for the first time. Resident memory of
+    the process is sampled at every call of the logits processor. Hooks only measure
+    calls made from the thread that has entered the monitor, so that `generate` calls
+    running concurrently on the same model do not affect each other.
+
+    Usage:
+        with GenerationMonitor(model) as monitor:
+            output_ids = model.generate(**inputs, logits_processor=[monitor])
+        metrics = monitor.metrics(output_token_count)
+    """
+
+    def __init__(self, model: torch.nn.Module):
+        """Initializes a GenerationMonitor instance.
+
+        Args:
+            model (torch.nn.Module): Model whose `generate` call is measured.
+        """
+        self.model = model
+        self.device: torch.device = model.device
+        self._thread_id: Optional[int] = None
+        self._hooks = []
+        self._encoder_start: Optional[float] = None
+        self._encoder_time = 0.0
+        self._start = 0.0
+        self._end = 0.0
+        self._first_token: Optional[float] = None
+        self._rss_start: Optional[float] = None
+        self._rss_max: Optional[float] = None
+
+    def _sample_rss(self) -> None:
+        """Updates the largest resident memory seen during the call."""
+        rss = current_rss_mb()
+        if rss is not None and self._rss_max is not None:
+            self._rss_max = max(self._rss_max, rss)
+
+    def _pre_encoder_hook(self, *args) -> None:
+        """Remembers the time when the encoder starts."""
+        if threading.get_ident() == self._thread_id:
+            self._encoder_start = time.perf_counter()
+
+    def _post_encoder_hook(self, *args) -> None:
+        """Adds the time spent in the encoder."""
+        if (
+            threading.get_ident() == self._thread_id
+            and self._encoder_start is not None
+        ):
+            self._encoder_time += time.perf_counter() - self._encoder_start
+            self._encoder_start = None
+
+    def __call__(
+        self, input_ids: torch.LongTensor, scores: torch.FloatTensor
+    ) -> torch.FloatTensor:
+        """Remembers the time when the first token is chosen leaving scores intact."""
+        if self._first_token is None:
+            self._first_token = time.perf_counter()
+        self._sample_rss()
+
+        return scores
+
+    def __enter__(self) -> "GenerationMonitor":
+        """Installs encoder hooks and starts measuring."""
+        self._thread_id = threading.get_ident()
+        get_encoder = getattr(self.model, "get_encoder", None)
+        if get_encoder is not None:
+            encoder = get_encoder()
+            self._hooks = [
+                encoder.register_forward_pre_hook(self._pre_encoder_hook),
+                encoder.register_forward_hook(self._post_encoder_hook),
+            ]
+        if self.device.type == "cuda":
+            torch.cuda.reset_peak_memory_stats(self.device)
+        self._rss_start = self._rss_max = current_rss_mb()
+        self._start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stops measuring and removes encoder hooks."""
+        self._end = time.perf_counter()
+        self._sample_rss()
+        for hook in self._hooks:
+            hook.remove()
+        self._hooks = []
+
+    def metrics(self, output_token_count: int) -> GenerationMetrics:
+        """Collects metrics of the measured `generate` call.
+
+        Args:
+            output_token_count (int): Number of generated tokens without padding.
+
+        Returns:
+            GenerationMetrics: Metrics of a single `generate` call.
+        """
+        decode_time = self._end - self._start - self._encoder_time
+        first_token = self._first_token or self._end
+
+        return GenerationMetrics(
+            generate_calls=1,
+            encoder_time=self._encoder_time,
+            decode_time=decode_time,
+            time_to_first_token=first_token - self._start,
+            output_token_count=output_token_count,
+            decode_tokens_per_sec=(
+                output_token_count / decode_time if decode_time > 0 else 0.0
+            ),
+            rss_growth_mb=(
+                self._rss_max - self._rss_start
+                if self._rss_start is not None
+                else None
+            ),
+            peak_cuda_memory_mb=(
+                torch.cuda.max_memory_allocated(self.device) / 1024**2
+                if self.device.type == "cuda"
+                else None
+            ),
+        )
+
+
+def format_generation_metrics(metrics: GenerationMetrics) -> str:
+    """Formats the main generation metrics in a single line.
+
+    Args:
+        metrics (GenerationMetrics): Metrics of `generate` calls.
+
+    Returns:
+        str: Comma-separated metrics with their units.
+    """
+    parts = [
+        f"{metrics.decode_tokens_per_sec:.1f} tokens/sec",
+        f"time to first token: {metrics.time_to_first_token:.3f} s",
+        f"encoder: {metrics.encoder_time:.3f} s",
+    ]
+    if metrics.rss_growth_mb is not None:
+        parts.append(f"RSS growth: {metrics.rss_growth_mb:.1f} MB")
+    if metrics.peak_cuda_memory_mb is not None:
+        parts.append(f"peak CUDA memory: {metrics.peak_cuda_memory_mb:.1f} MB")
+
+    return ", ".join(parts)
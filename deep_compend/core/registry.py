@@ -0,0 +1,238 @@
+"""Process-wide cache of loaded models and tokenizers."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import torch
+from peft import PeftModel
+from transformers import (
+    AutoModelForSeq2SeqLM,
+    AutoTokenizer,
+    PreTrainedModel,
+    PreTrainedTokenizerBase,
+)
+
+# Key of a cached model: (model_path, tokenizer_path, lora_adapters_path, device, dtype)
+ModelKey = tuple[str, str, Optional[str], str, Optional[str]]
+
+
+def load_model_and_tokenizer(
+    model_path: str,
+    tokenizer_path: str,
+    lora_adapters_path: Optional[str],
+    device: str,
+    dtype: Optional[str],
+) -> tuple[PreTrainedModel, PreTrainedTokenizerBase]:
+    """Loads a seq2seq model with optional LoRA adapters and its tokenizer.
+
+    Args:
+        model_path (str): Path to the Transformer model.
+        tokenizer_path (str): Path to Transformer tokenizer.
+        lora_adapters_path (Optional[str]): Path to LoRA adapters to attach.
+        device (str): Device to move the model to.
+        dtype (Optional[str]): Name of torch data type to cast the model to (e.g. "float16").
+
+    Returns:
+        tuple[PreTrainedModel, PreTrainedTokenizerBase]: Loaded model and tokenizer.
+    """
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_path)
+    if dtype is not None:
+        model = model.to(dtype=getattr(torch, dtype))
+    model = model.to(device)
+    # Attaching LoRA adapters to a freshly loaded model since they modify it in place
+    if lora_adapters_path is not None:
+        model = PeftModel.from_pretrained(model, lora_adapters_path)
+    tokenizer = AutoTokenizer.from_pretrained(tokenizer_path)
+
+    return model, tokenizer
+
+
+def estimate_model_memory(model: torch.nn.Module) -> int:
+    """Estimates the memory occupied by model parameters and buffers.
+
+    Args:
+        model (torch.nn.Module): Model to be measured.
+
+    Returns:
+        int: Number of bytes.
+    """
+    tensors = list(model.parameters()) + list(model.buffers())
+    return sum(t.numel() * t.element_size() for t in tensors)
+
+
+@dataclass
+class RegistryStatistics:
+    """Counters of the model registry.
+
+    Attributes:
+        hits (int): Number of requests served with an already loaded model.
+        misses (int): Number of requests that required loading a model.
+        evictions (int): Number of models removed from the registry.
+        load_time (float): Total time spent on loading models (in seconds).
+        cached_models (int): Number of models currently held in the registry.
+        memory_bytes (int): Estimated memory of models currently held in the registry.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    load_time: float
+    cached_models: int
+    memory_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of requests served with an already loaded model."""
+        requests = self.hits + self.misses
+        return self.hits / requests if requests != 0 else 0.0
+
+
+class ModelRegistry:
+    """Thread-safe LRU cache of loaded models and tokenizers.
+
+    Attributes:
+        max_models (Optional[int]): Maximum number of models to keep loaded.
+        max_memory_bytes (Optional[int]): Maximum estimated memory of models to keep loaded.
+        loader (Callable[..., tuple[PreTrainedModel, PreTrainedTokenizerBase]]): Function loading a model and tokenizer.
+    """
+
+    def __init__(
+        self,
+        max_models: Optional[int] = 2,
+        max_memory_bytes: Optional[int] = None,
+        loader: Callable[
+            ..., tuple[PreTrainedModel, PreTrainedTokenizerBase]
+        ] = load_model_and_tokenizer,
+    ):
+        """Initializes a ModelRegistry instance.
+
+        Args:
+            max_models (Optional[int], optional): Maximum number of models to keep loaded (no limit if None). Defaults to 2.
+            max_memory_bytes (Optional[int], optional): Maximum estimated memory of models to keep loaded (no limit if None). Defaults to None.
+            loader (Callable[..., tuple[PreTrainedModel, PreTrainedTokenizerBase]], optional): Function loading a model and tokenizer. Defaults to load_model_and_tokenizer.
+        """
+        self.max_models = max_models
+        self.max_memory_bytes = max_memory_bytes
+        self.loader = loader
+        self._entries: OrderedDict[
+            ModelKey, tuple[PreTrainedModel, PreTrainedTokenizerBase, int]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._load_time = 0.0
+
+    def get(
+        self,
+        model_path: str,
+        tokenizer_path: Optional[str] = None,
+        lora_adapters_path: Optional[str] = None,
+        device: str = "cpu",
+        dtype: Optional[str] = None,
+    ) -> tuple[PreTrainedModel, PreTrainedTokenizerBase]:
+        """Returns a loaded model and tokenizer, loading them on first request.
+
+        Args:
+            model_path (str): Path to the Transformer model.
+            tokenizer_path (Optional[str], optional): Path to Transformer tokenizer (model path if None). Defaults to None.
+            lora_adapters_path (Optional[str], optional): Path to LoRA adapters to attach. Defaults to None.
+            device (str, optional): Device to run the model on. Defaults to "cpu".
+            dtype (Optional[str], optional): Name of torch data type to cast the model to. Defaults to None.
+
+        Returns:
+            tuple[PreTrainedModel, PreTrainedTokenizerBase]: Loaded model and tokenizer.
+        """
+        key: ModelKey = (
+            model_path,
+            tokenizer_path or model_path,
+            lora_adapters_path,
+            str(device),
+            dtype,
+        )
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                model, tokenizer, _ = self._entries[key]
+                return model, tokenizer
+
+            self._misses += 1
+            start = time.perf_counter()
+            model, tokenizer = self.loader(*key)
+            self._load_time += time.perf_counter() - start
+
+            self._entries[key] = (
+                model,
+                tokenizer,
+                estimate_model_memory(model),
+            )
+            self._evict()
+
+            return model, tokenizer
+
+    def _evict(self) -> None:
+        """Removes least recently used models while the limits are exceeded."""
+        # The most recently used model is always kept even if it exceeds the limits
+        while len(self._entries) > 1 and (
+            (
+                self.max_models is not None
+                and len(self._entries) > self.max_models
+            )
+            or (
+                self.max_memory_bytes is not None
+                and self._memory_bytes() > self.max_memory_bytes
+            )
+        ):
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _memory_bytes(self) -> int:
+        """Computes estimated memory of models held in the registry."""
+        return sum(memory for _, _, memory in self._entries.values())
+
+    def configure(
+        self,
+        max_models: Optional[int] = None,
+        max_memory_bytes: Optional[int] = None,
+    ) -> None:
+        """Changes the limits of the registry and evicts models exceeding them.
+
+        Args:
+            max_models (Optional[int], optional): Maximum number of models to keep loaded (no limit if None). Defaults to None.
+            max_memory_bytes (Optional[int], optional): Maximum estimated memory of models to keep loaded (no limit if None). Defaults to None.
+        """
+        with self._lock:
+            self.max_models = max_models
+            self.max_memory_bytes = max_memory_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        """Removes all models from the registry."""
+        with self._lock:
+            self._evictions += len(self._entries)
+            self._entries.clear()
+
+    @property
+    def stats(self) -> RegistryStatistics:
+        """Counters of hits, misses, evictions and loading time."""
+        with self._lock:
+            return RegistryStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                load_time=self._load_time,
+                cached_models=len(self._entries),
+                memory_bytes=self._memory_bytes(),
+            )
+
+    def __len__(self) -> int:
+        """Number of models currently held in the registry."""
+        return len(self._entries)
+
+
+# Registry shared by all summarizers in the process
+model_registry = ModelRegistry()
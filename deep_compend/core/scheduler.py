@@ -0,0 +1,245 @@
+"""Length-bucketed dynamic batching of articles for summary generation."""
+
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from ..extractors import PDFSource
+from ..utils.downloads import ensure_nltk_resource
+from ..utils.timing import StageTimer
+from .configs import SummaryGenerationConfig
+from .summarizer import ArticleSummarizer
+
+
+@dataclass
+class BatchStatistics:
+    """Statistics of a single batch sent to generation.
+
+    Attributes:
+        batch_size (int): Number of articles in the batch.
+        input_token_count (int): Number of input tokens without padding.
+        padded_token_count (int): Number of input tokens including padding.
+        output_token_count (int): Number of generated tokens without padding.
+        latency (float): Time spent on summarizing the batch (in seconds).
+    """
+
+    batch_size: int
+    input_token_count: int
+    padded_token_count: int
+    output_token_count: int
+    latency: float
+
+
+@dataclass
+class SchedulerReport:
+    """Statistics of all batches processed during a scheduler run.
+
+    Attributes:
+        token_budget (int): Token budget used for building the batches.
+        batches (list[BatchStatistics]): Statistics of each processed batch.
+    """
+
+    token_budget: int
+    batches: list[BatchStatistics] = field(default_factory=list)
+
+    @property
+    def padding_efficiency(self) -> float:
+        """Share of real tokens among all input tokens sent to the model."""
+        padded = sum(b.padded_token_count for b in self.batches)
+        real = sum(b.input_token_count for b in self.batches)
+        return real / padded if padded != 0 else 0.0
+
+    @property
+    def total_latency(self) -> float:
+        """Total time spent on summarizing all batches (in seconds)."""
+        return sum(b.latency for b in self.batches)
+
+    @property
+    def input_tokens_per_sec(self) -> float:
+        """Number of processed input tokens per second."""
+        tokens = sum(b.input_token_count for b in self.batches)
+        latency = self.total_latency
+        return tokens / latency if latency != 0 else 0.0
+
+    @property
+    def output_tokens_per_sec(self) -> float:
+        """Number of generated tokens per second."""
+        tokens = sum(b.output_token_count for b in self.batches)
+        latency = self.total_latency
+        return tokens / latency if latency != 0 else 0.0
+
+    def __str__(self) -> str:
+        """Formats the report for displaying."""
+        lines = [
+            f"Token budget: {self.token_budget}",
+            f"Batches: {len(self.batches)}",
+            f"Padding efficiency: {self.padding_efficiency:.2%}",
+            f"Input tokens/sec: {self.input_tokens_per_sec:.2f}",
+            f"Output tokens/sec: {self.output_tokens_per_sec:.2f}",
+        ]
+        for i, batch in enumerate(self.batches):
+            lines.append(
+                f"Batch {i}: size={batch.batch_size}, "
+                f"padded_tokens={batch.padded_token_count}, "
+                f"latency={batch.latency:.3f}s"
+            )
+
+        return "\n".join(lines)
+
+
+class LengthBucketedScheduler:
+    """Groups queued articles of similar tokenized length into batches for generation.
+
+    Batches are built under a token budget instead of a fixed number of articles:
+    the cost of a batch is the number of padded input tokens multiplied by the number of beams.
+
+    Attributes:
+        summarizer (ArticleSummarizer): Instance of ArticleSummarizer class used for generation.
+        token_budget (int): Maximum cost of a single batch.
+        max_batch_size (Optional[int]): Maximum number of articles in a batch.
+        report (Optional[SchedulerReport]): Statistics of the latest run.
+    """
+
+    def __init__(
+        self,
+        summarizer: ArticleSummarizer,
+        token_budget: int = 16384,
+        max_batch_size: Optional[int] = None,
+    ):
+        """Initializes a LengthBucketedScheduler instance.
+
+        Args:
+            summarizer (ArticleSummarizer): Instance of ArticleSummarizer class used for generation.
+            token_budget (int, optional): Maximum cost of a single batch. Defaults to 16384.
+            max_batch_size (Optional[int], optional): Maximum number of articles in a batch. Defaults to None.
+
+        Raises:
+            ValueError: Exception raised if `token_budget` is not positive.
+        """
+        if token_budget < 1:
+            raise ValueError("Token budget should be a positive integer.")
+
+        self.summarizer = summarizer
+        self.token_budget = token_budget
+        self.max_batch_size = max_batch_size
+        self.report: Optional[SchedulerReport] = None
+        self._queue: list[ArticleSummarizer.PreparedArticle] = []
+        self._lengths: list[int] = []
+
+        ensure_nltk_resource(resource_id="tokenizers/punkt")
+        ensure_nltk_resource(resource_id="tokenizers/punkt_tab")
+
+    def submit(self, pdf_path: PDFSource) -> None:
+        """Extracts and tokenizes the text of an article and adds it to the queue.
+
+        Args:
+            pdf_path (PDFSource): Path to an article to be summarized or its content held in memory.
+        """
+        # Tokenizing in advance, so that the input length is known after truncation to the context window
+        article = self.summarizer._prepare_article(
+            pdf_path=pdf_path, tokenize=True
+        )
+        self._queue.append(article)
+        self._lengths.append(len(article.input_ids))
+
+    def _plan_batches(self, num_beams: int) -> list[list[int]]:
+        """Splits queued articles into batches of similar length under the token budget.
+
+        Args:
+            num_beams (int): Number of beams used during generation.
+
+        Returns:
+            list[list[int]]: Queue indices of articles in each batch.
+        """
+        # Sorting articles by length so that each batch needs little padding
+        order = sorted(
+            range(len(self._lengths)), key=lambda i: -self._lengths[i]
+        )
+
+        batches: list[list[int]] = []
+        batch: list[int] = []
+        for i in order:
+            # The longest article of a batch comes first and sets padded length
+            padded_length = (
+                self._lengths[batch[0]] if batch else self._lengths[i]
+            )
+            cost = (len(batch) + 1) * padded_length * num_beams
+            batch_is_full = (
+                self.max_batch_size is not None
+                and len(batch) >= self.max_batch_size
+            )
+            if batch and (cost > self.token_budget or batch_is_full):
+                batches.append(batch)
+                batch = []
+            batch.append(i)
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    def run(
+        self, config: Optional[SummaryGenerationConfig] = None
+    ) -> list[ArticleSummarizer.SummarizationResult]:
+        """Summarizes all queued articles and empties the queue.
+
+        Args:
+            config (Optional[SummaryGenerationConfig], optional): Configuration settings for summarization task. Defaults to None.
+
+        Returns:
+            list[SummarizationResult]: Results in the order articles were submitted.
+        """
+        config = config or SummaryGenerationConfig()
+        report = SchedulerReport(token_budget=self.token_budget)
+        results: list[Optional[ArticleSummarizer.SummarizationResult]] = [
+            None
+        ] * len(self._queue)
+
+        for batch in self._plan_batches(num_beams=config.num_beams):
+            start = time.perf_counter()
+            timer = StageTimer()
+            batch_results = self.summarizer._generate_summaries(
+                articles=[self._queue[i] for i in batch],
+                config=config,
+                timer=timer,
+            )
+            latency = time.perf_counter() - start
+            self.summarizer._notify_timings(timer.timings)
+
+            for i, result in zip(batch, batch_results):
+                results[i] = result
+            report.batches.append(
+                BatchStatistics(
+                    batch_size=len(batch),
+                    input_token_count=sum(self._lengths[i] for i in batch),
+                    padded_token_count=len(batch)
+                    * max(self._lengths[i] for i in batch),
+                    output_token_count=sum(
+                        r.stats.output_token_count for r in batch_results
+                    ),
+                    latency=latency,
+                )
+            )
+
+        self._queue, self._lengths = [], []
+        self.report = report
+
+        return results
+
+    def summarize(
+        self,
+        pdf_paths: list[PDFSource],
+        config: Optional[SummaryGenerationConfig] = None,
+    ) -> list[ArticleSummarizer.SummarizationResult]:
+        """Queues several articles and summarizes them.
+
+        Args:
+            pdf_paths (list[PDFSource]): Paths to articles to be summarized or their contents held in memory.
+            config (Optional[SummaryGenerationConfig], optional): Configuration settings for summarization task. Defaults to None.
+
+        Returns:
+            list[SummarizationResult]: Results in the order of `pdf_paths`.
+        """
+        for pdf_path in pdf_paths:
+            self.submit(pdf_path=pdf_path)
+
+        return self.run(config=config)
@@ -1,34 +1,52 @@
 """Text retrieval and summary generation logic."""
 
+import asyncio
 import textwrap
+import threading
 import uuid
 import warnings
-from dataclasses import asdict, dataclass
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from time import gmtime, strftime
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
 
 import nltk
 import torch
-from peft import PeftModel
 from transformers import (
-    AutoModelForSeq2SeqLM,
-    AutoTokenizer,
+    LogitsProcessorList,
     PretrainedConfig,
     PreTrainedModel,
     PreTrainedTokenizerBase,
     logging,
 )
 
-from ..extractors import KeywordsExtractor, PDFExtractor
-from ..text_preprocessing import prettify_summary
+from ..extractors import (
+    CorpusIndex,
+    KeywordsExtractor,
+    PDFExtractor,
+    PDFSource,
+    TextCache,
+)
+from ..text_preprocessing import pack_sentences, prettify_summary
 from ..utils.downloads import ensure_nltk_resource
 from ..utils.metrics import compression_ratio
+from ..utils.profiling import Profiler
+from ..utils.timing import StageTimer, StageTiming, TimingCallback
 from .configs import SummaryGenerationConfig
+from .generation_metrics import GenerationMetrics, GenerationMonitor
+from .registry import load_model_and_tokenizer, model_registry
+from .summary_cache import SummaryCache, path_fingerprint
+
+if TYPE_CHECKING:
+    from .async_pipeline import AsyncSummarizationPipeline
 
 warnings.filterwarnings("ignore")
 logging.set_verbosity_error()
 
+T = TypeVar("T")
+
 
 class ArticleSummarizer:
     """Generates a summary of an input PDF-article.
@@ -52,6 +70,13 @@ class ArticleSummarizer:
         context_window (int): Maximum context window allowed for the model.
         summary (str): Text of the generated summary.
         summarization_config (dict[str, Any]): Config of summary generation params.
+        summary_cache (Optional[SummaryCache]): Persistent cache of generated summaries.
+        text_cache (Optional[TextCache]): Persistent cache of texts extracted from PDF-files.
+        extraction_workers (int): Number of processes extracting page texts of large PDF-files.
+        timing_callback (Optional[TimingCallback]): Function receiving timings of stages after each summarization and report.
+        profiler (Optional[Profiler]): Profiler recording PyTorch traces of `generate` calls.
+        stage_timings (dict[str, StageTiming]): Time spent in stages of the latest summarization and report.
+        run_metrics (GenerationMetrics): Generation speed and memory usage aggregated over all `generate` calls of the instance.
     """
 
     def __init__(
@@ -59,6 +84,14 @@ class ArticleSummarizer:
         model_path: str,
         tokenizer_path: Optional[str] = None,
         run_on: str = "auto",
+        lora_adapters_path: Optional[str] = None,
+        dtype: Optional[str] = None,
+        use_registry: bool = True,
+        summary_cache: Optional[SummaryCache] = None,
+        text_cache: Optional[TextCache] = None,
+        extraction_workers: int = 1,
+        timing_callback: Optional[TimingCallback] = None,
+        profiler: Optional[Profiler] = None,
     ):
         """Initializes an ArticleSummarizer instance.
 
@@ -66,6 +99,14 @@ class ArticleSummarizer:
             model_path (str): Path to the Transformer model.
             tokenizer_path (Optional[str], optional): Path to Transformer tokenizer. Defaults to None.
             run_on (str): Type of device to run summarization model on. Defaults to "auto".
+            lora_adapters_path (Optional[str], optional): Path to LoRA adapters to attach. Defaults to None.
+            dtype (Optional[str], optional): Name of torch data type to cast the model to (e.g. "float16"). Defaults to None.
+            use_registry (bool, optional): Flag to reuse models already loaded in the process-wide registry. Defaults to True.
+            summary_cache (Optional[SummaryCache], optional): Persistent cache of generated summaries. Defaults to None.
+            text_cache (Optional[TextCache], optional): Persistent cache of texts extracted from PDF-files. Defaults to None.
+            extraction_workers (int, optional): Number of processes extracting page texts of large PDF-files. Defaults to 1.
+            timing_callback (Optional[TimingCallback], optional): Function receiving timings of stages after each summarization (per batch for `summarize_many`) and report. Defaults to None.
+            profiler (Optional[Profiler], optional): Profiler recording PyTorch traces of `generate` calls (if enabled in the profiler). Defaults to None.
         """
         # Defining the device to run summarization model on
         self.device: torch.device = (
@@ -74,21 +115,55 @@ class ArticleSummarizer:
             else torch.device(run_on)
         )
         self.model_path = model_path
-        self.model: PreTrainedModel = AutoModelForSeq2SeqLM.from_pretrained(
-            self.model_path
-        ).to(self.device)
-        self.config: PretrainedConfig = self.model.config
+        self.dtype = dtype
+        self.use_registry = use_registry
+        self.summary_cache = summary_cache
+        self.text_cache = text_cache
+        self.extraction_workers = extraction_workers
+        self.timing_callback = timing_callback
+        self.profiler = profiler
+        self.stage_timings: dict[str, StageTiming] = {}
+        self.generation_metrics: Optional[GenerationMetrics] = None
+        self.run_metrics = GenerationMetrics()
+        self._metrics_lock = threading.Lock()
+        # Fast tokenizers fail when called from several threads with different settings
+        self._tokenizer_lock = threading.Lock()
+        self._generation_executor: Optional[ThreadPoolExecutor] = None
+        # Pipelines of `asummarize` keyed by the ID of their event loop
+        self._async_pipelines: dict[int, "AsyncSummarizationPipeline"] = {}
         # If tokenizer path is not specified, loading specified model's tokenizer
         self.tokenizer_path = (
             self.model_path if not tokenizer_path else tokenizer_path
         )
-        self.tokenizer: PreTrainedTokenizerBase = (
-            AutoTokenizer.from_pretrained(self.tokenizer_path)
+        self.lora_adapters_path = lora_adapters_path
+        self._load_model()
+
+    def _load_model(self) -> None:
+        """Loads the model and tokenizer or takes them from the model registry."""
+        load = (
+            model_registry.get
+            if self.use_registry
+            else load_model_and_tokenizer
         )
+        self.model: PreTrainedModel
+        self.tokenizer: PreTrainedTokenizerBase
+        self.model, self.tokenizer = load(
+            model_path=self.model_path,
+            tokenizer_path=self.tokenizer_path,
+            lora_adapters_path=self.lora_adapters_path,
+            device=str(self.device),
+            dtype=self.dtype,
+        )
+        self.config: PretrainedConfig = self.model.config
         # Computes maximum context window for the used model
         self.context_window = self._get_max_context_window()
-
-        self.lora_adapters_path: Optional[str] = None
+        # Fingerprinting local files or hub revision, so that retrained models miss the summary cache
+        self._model_fingerprint = {
+            "model": path_fingerprint(self.model_path)
+            or getattr(self.config, "_commit_hash", None),
+            "tokenizer": path_fingerprint(self.tokenizer_path),
+            "lora_adapters": path_fingerprint(self.lora_adapters_path),
+        }
 
     def load_lora_adapters(self, lora_adapters_path: str) -> None:
         """Attaches LoRA adapters to the model.
@@ -97,7 +172,7 @@ class ArticleSummarizer:
             lora_adapters_path (str): Path to LoRA adapters.
         """
         self.lora_adapters_path = lora_adapters_path
-        self.model = PeftModel.from_pretrained(self.model, lora_adapters_path)
+        self._load_model()
 
     def _get_max_context_window(self, safe_default_value: int = 1024) -> int:
         """Retrieves the maximum context window that a model can use without truncation.
@@ -125,13 +200,488 @@ class ArticleSummarizer:
             else safe_default_value
         )
 
+    def _extract_text(
+        self, pdf_path: PDFSource, timer: StageTimer
+    ) -> tuple[str, str]:
+        """Retrieves and cleans the text of an article.
+
+        Args:
+            pdf_path (PDFSource): Path to an article to be summarized or its content held in memory.
+            timer (StageTimer): Timer of summarization stages.
+
+        Returns:
+            tuple[str, str]: Path to the article (or name of its in-memory source) and its cleaned text.
+        """
+        pdf_extractor = PDFExtractor(
+            pdf_path=pdf_path,
+            text_cache=self.text_cache,
+            num_workers=self.extraction_workers,
+            timer=timer,
+        )
+        text = pdf_extractor.retrieve_processed_text()
+
+        return pdf_extractor.name, text
+
+    @staticmethod
+    def _count_words_and_sentences(text: str) -> tuple[int, int]:
+        """Counts words and sentences of a text.
+
+        Args:
+            text (str): Text to be analyzed.
+
+        Returns:
+            tuple[int, int]: Numbers of words and sentences.
+        """
+        return (
+            len(nltk.tokenize.word_tokenize(text)),
+            len(nltk.tokenize.sent_tokenize(text)),
+        )
+
+    def _prepare_article(
+        self,
+        pdf_path: PDFSource,
+        timer: Optional[StageTimer] = None,
+        tokenize: bool = False,
+    ) -> "PreparedArticle":
+        """Retrieves and cleans the text of an article and computes its statistics.
+
+        Args:
+            pdf_path (PDFSource): Path to an article to be summarized or its content held in memory.
+            timer (Optional[StageTimer], optional): Timer of summarization stages (new timer if None). Defaults to None.
+            tokenize (bool, optional): Flag to tokenize the text in advance instead of together with other articles of a batch. Defaults to False.
+
+        Returns:
+            PreparedArticle: Cleaned article text ready to be tokenized (or already tokenized).
+        """
+        timer = timer or StageTimer()
+        # Retrieving and cleaning article text from PDF
+        pdf_name, text = self._extract_text(pdf_path=pdf_path, timer=timer)
+        with timer.measure("stats"):
+            (
+                word_count_full,
+                sentence_count_full,
+            ) = self._count_words_and_sentences(text)
+
+        article = self.PreparedArticle(
+            pdf_path=pdf_name,
+            clean_text=text,
+            model_input=self._add_task_prefix(text),
+            word_count_full=word_count_full,
+            sentence_count_full=sentence_count_full,
+        )
+        if tokenize:
+            with timer.measure("tokenize"):
+                article.input_ids = self._tokenize(article.model_input)
+
+        return article
+
+    def _tokenize(self, model_input: str) -> list[int]:
+        """Tokenizes a single input text truncating it to the context window.
+
+        Args:
+            model_input (str): Text to be passed to the model.
+
+        Returns:
+            list[int]: Token IDs without padding.
+        """
+        with self._tokenizer_lock:
+            return self.tokenizer(
+                model_input, truncation=True, max_length=self.context_window
+            )["input_ids"]
+
+    def _add_task_prefix(self, text: str) -> str:
+        """Adds a task prefix to an input text if the model requires one.
+
+        Args:
+            text (str): Cleaned text of an article.
+
+        Returns:
+            str: Text to be passed to the tokenizer.
+        """
+        # Adding a prefix in case of T5-models
+        if "t5" in self.model_path or self.tokenizer_path:
+            text = "summarize: " + text
+
+        return text
+
+    def _count_output_tokens(self, summary_ids: torch.Tensor) -> int:
+        """Computes the number of generated tokens ignoring the trailing padding.
+
+        Args:
+            summary_ids (torch.Tensor): Generated token IDs of a single summary.
+
+        Returns:
+            int: Number of tokens in the generated summary.
+        """
+        pad_token_id = self.tokenizer.pad_token_id
+        if pad_token_id is None:
+            return len(summary_ids)
+
+        # Shorter sequences in a batch are right-padded up to the longest one
+        non_pad_positions = (summary_ids != pad_token_id).nonzero()
+        if len(non_pad_positions) == 0:
+            return len(summary_ids)
+
+        return int(non_pad_positions[-1]) + 1
+
+    def _generate(
+        self,
+        model_inputs: list[str],
+        config: SummaryGenerationConfig,
+        timer: Optional[StageTimer] = None,
+        metrics: Optional[GenerationMetrics] = None,
+        input_ids: Optional[list[list[int]]] = None,
+    ) -> tuple[list[str], list[int], list[int]]:
+        """Generates raw summaries for a batch of input texts with a single `generate` call.
+
+        Speed and memory usage of the call are added to `run_metrics`.
+
+        Args:
+            model_inputs (list[str]): Texts to be tokenized and passed to the model.
+            config (SummaryGenerationConfig): Configuration settings for summarization task.
+            timer (Optional[StageTimer], optional): Timer of "tokenize", "generate" and "decode" stages (new timer if None). Defaults to None.
+            metrics (Optional[GenerationMetrics], optional): Metrics of the current operation to which metrics of the call are added. Defaults to None.
+            input_ids (Optional[list[list[int]]], optional): Token IDs of `model_inputs` tokenized in advance, which are only padded. Defaults to None.
+
+        Returns:
+            tuple[list[str], list[int], list[int]]: Decoded summaries, numbers of input tokens and numbers of generated tokens.
+        """
+        timer = timer or StageTimer()
+        # Tokenizing input sequences in accordance with max context window
+        with timer.measure("tokenize"), self._tokenizer_lock:
+            if input_ids is None:
+                inputs = self.tokenizer(
+                    model_inputs,
+                    return_tensors="pt",
+                    padding=True,
+                    truncation=True,
+                    max_length=self.context_window,
+                )
+            else:
+                inputs = self.tokenizer.pad(
+                    {"input_ids": input_ids}, return_tensors="pt"
+                )
+            inputs = inputs.to(self.device)
+
+            # Computing number of tokens for each input sequence without padding
+            input_token_counts = inputs["attention_mask"].sum(dim=1).tolist()
+
+        # Generating tokens as output
+        profiling = (
+            self.profiler.generation() if self.profiler else nullcontext()
+        )
+        with timer.measure("generate"), profiling, torch.no_grad():
+            with GenerationMonitor(self.model) as monitor:
+                summary_ids = self.model.generate(
+                    **inputs,
+                    **asdict(config),
+                    logits_processor=LogitsProcessorList([monitor]),
+                )
+
+        with timer.measure("decode"), self._tokenizer_lock:
+            # Computing number of tokens in each generated summary
+            output_token_counts = [
+                self._count_output_tokens(ids) for ids in summary_ids
+            ]
+
+            # Decoding tokens
+            summaries = self.tokenizer.batch_decode(
+                summary_ids, skip_special_tokens=True
+            )
+
+        call_metrics = monitor.metrics(sum(output_token_counts))
+        with self._metrics_lock:
+            self.run_metrics.add(call_metrics)
+            if metrics is not None:
+                metrics.add(call_metrics)
+
+        return summaries, input_token_counts, output_token_counts
+
+    def _generate_summaries(
+        self,
+        articles: list["PreparedArticle"],
+        config: SummaryGenerationConfig,
+        timer: Optional[StageTimer] = None,
+    ) -> list["SummarizationResult"]:
+        """Summarizes a batch of prepared articles with a single `generate` call.
+
+        Articles found in the summary cache are not passed to the model.
+        Timings of the batch stages and metrics of the batch generation are attached to statistics of each article.
+
+        Args:
+            articles (list[PreparedArticle]): Articles to be summarized together.
+            config (SummaryGenerationConfig): Configuration settings for summarization task.
+            timer (Optional[StageTimer], optional): Timer of summarization stages (new timer if None). Defaults to None.
+
+        Returns:
+            list[SummarizationResult]: Results in the order of input articles.
+        """
+        timer = timer or StageTimer()
+        metrics = GenerationMetrics()
+        results = [
+            self._get_cached_result(
+                pdf_path=article.pdf_path,
+                clean_text=article.clean_text,
+                config=config,
+            )
+            for article in articles
+        ]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            (
+                summaries,
+                input_token_counts,
+                output_token_counts,
+            ) = self._generate(
+                model_inputs=[articles[i].model_input for i in missing],
+                config=config,
+                timer=timer,
+                metrics=metrics,
+                input_ids=(
+                    [articles[i].input_ids for i in missing]
+                    if all(articles[i].input_ids is not None for i in missing)
+                    else None
+                ),
+            )
+            for i, summary, input_token_count, output_token_count in zip(
+                missing, summaries, input_token_counts, output_token_counts
+            ):
+                with timer.measure("prettify"):
+                    summary = prettify_summary(summary)
+                with timer.measure("stats"):
+                    results[i] = self._build_result(
+                        article=articles[i],
+                        summary=summary,
+                        input_token_count=input_token_count,
+                        output_token_count=output_token_count,
+                    )
+                results[i].stats.generation_metrics = metrics
+                self._cache_result(result=results[i], config=config)
+
+        for result in results:
+            result.stats.stage_timings = dict(timer.timings)
+
+        return results
+
+    def _cache_key(
+        self, clean_text: str, config: SummaryGenerationConfig, mode: str
+    ) -> str:
+        """Computes the summary cache key for an article text summarized by this model.
+
+        Args:
+            clean_text (str): Cleaned text of an article.
+            config (SummaryGenerationConfig): Configuration settings for summarization task.
+            mode (str): Summarization mode ("article" or "long").
+
+        Returns:
+            str: Cache key.
+        """
+        return SummaryCache.make_key(
+            clean_text=clean_text,
+            model_identity={
+                "model_path": self.model_path,
+                "tokenizer_path": self.tokenizer_path,
+                "lora_adapters_path": self.lora_adapters_path,
+                "dtype": self.dtype,
+                "fingerprint": self._model_fingerprint,
+                "mode": mode,
+            },
+            config=asdict(config),
+        )
+
+    def _get_cached_result(
+        self,
+        pdf_path: str,
+        clean_text: str,
+        config: SummaryGenerationConfig,
+        mode: str = "article",
+    ) -> Optional["SummarizationResult"]:
+        """Looks up the summary of an article in the summary cache.
+
+        Args:
+            pdf_path (str): Path to the article or name of its in-memory source.
+            clean_text (str): Cleaned text of the article.
+            config (SummaryGenerationConfig): Configuration settings for summarization task.
+            mode (str, optional): Summarization mode ("article" or "long"). Defaults to "article".
+
+        Returns:
+            Optional[SummarizationResult]: Cached summary and statistics or None if not cached.
+        """
+        if self.summary_cache is None:
+            return None
+
+        cached = self.summary_cache.get(
+            self._cache_key(clean_text, config, mode)
+        )
+        if cached is None:
+            return None
+
+        summary, stats = cached
+        return self.SummarizationResult(
+            pdf_path=pdf_path,
+            clean_text=clean_text,
+            summary=summary,
+            stats=self.SummaryStatisticsConfig(**stats),
+        )
+
+    def _cache_result(
+        self,
+        result: "SummarizationResult",
+        config: SummaryGenerationConfig,
+        mode: str = "article",
+    ) -> None:
+        """Stores the summary of an article in the summary cache.
+
+        Args:
+            result (SummarizationResult): Summary and statistics of an article.
+            config (SummaryGenerationConfig): Configuration settings for summarization task.
+            mode (str, optional): Summarization mode ("article" or "long"). Defaults to "article".
+        """
+        if self.summary_cache is None:
+            return
+
+        # Timings and generation metrics are specific to the run and not cached
+        stats = asdict(result.stats)
+        del stats["stage_timings"]
+        del stats["generation_metrics"]
+        self.summary_cache.put(
+            key=self._cache_key(result.clean_text, config, mode),
+            summary=result.summary,
+            stats=stats,
+        )
+
+    def _build_result(
+        self,
+        article: "PreparedArticle",
+        summary: str,
+        input_token_count: int,
+        output_token_count: int,
+    ) -> "SummarizationResult":
+        """Collects the summary of an article together with its statistics.
+
+        Args:
+            article (PreparedArticle): Summarized article.
+            summary (str): Prettified summary of the article.
+            input_token_count (int): Number of tokens passed to the model.
+            output_token_count (int): Number of tokens in the generated summary.
+
+        Returns:
+            SummarizationResult: Summary and statistics of the article.
+        """
+        stats = self.SummaryStatisticsConfig(
+            word_count_summary=len(nltk.tokenize.word_tokenize(summary)),
+            word_count_full=article.word_count_full,
+            sentence_count_summary=len(nltk.tokenize.sent_tokenize(summary)),
+            sentence_count_full=article.sentence_count_full,
+            input_token_count=input_token_count,
+            output_token_count=output_token_count,
+            compression_rate=f"{compression_ratio(summary, article.clean_text):.2%}",
+        )
+
+        return self.SummarizationResult(
+            pdf_path=article.pdf_path,
+            clean_text=article.clean_text,
+            summary=summary,
+            stats=stats,
+        )
+
+    def _split_into_chunks(self, text: str) -> list[str]:
+        """Splits a text into sentence-aligned chunks fitting into the context window.
+
+        Args:
+            text (str): Text to be split.
+
+        Returns:
+            list[str]: Chunks of the text.
+        """
+        sentences = nltk.tokenize.sent_tokenize(text)
+        if not sentences:
+            return [text]
+
+        # Leaving room for the task prefix and special tokens
+        prefix_length = len(
+            self.tokenizer(self._add_task_prefix(""))["input_ids"]
+        )
+        sentence_lengths = [
+            len(ids)
+            for ids in self.tokenizer(sentences, add_special_tokens=False)[
+                "input_ids"
+            ]
+        ]
+
+        return pack_sentences(
+            sentences=sentences,
+            lengths=sentence_lengths,
+            max_length=self.context_window - prefix_length,
+        )
+
+    def _summarize_chunks(
+        self,
+        chunks: list[str],
+        config: SummaryGenerationConfig,
+        batch_size: Optional[int],
+        num_workers: int,
+        timer: StageTimer,
+        metrics: GenerationMetrics,
+    ) -> tuple[list[str], list[int], list[int]]:
+        """Summarizes chunks of a text in batches, optionally running batches in parallel.
+
+        Args:
+            chunks (list[str]): Chunks of a text to be summarized.
+            config (SummaryGenerationConfig): Configuration settings for summarization task.
+            batch_size (Optional[int]): Number of chunks per `generate` call (all chunks at once if None).
+            num_workers (int): Number of threads running `generate` calls concurrently.
+            timer (StageTimer): Timer of summarization stages (summed up over batches).
+            metrics (GenerationMetrics): Generation metrics aggregated over batches.
+
+        Returns:
+            tuple[list[str], list[int], list[int]]: Decoded summaries, numbers of input tokens and numbers of generated tokens.
+        """
+        batch_size = batch_size or len(chunks)
+        batches = [
+            [
+                self._add_task_prefix(chunk)
+                for chunk in chunks[i : i + batch_size]
+            ]
+            for i in range(0, len(chunks), batch_size)
+        ]
+
+        if num_workers > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                outputs = list(
+                    executor.map(
+                        self._profiled(
+                            lambda batch: self._generate(
+                                batch, config, timer, metrics
+                            )
+                        ),
+                        batches,
+                    )
+                )
+        else:
+            outputs = [
+                self._generate(batch, config, timer, metrics)
+                for batch in batches
+            ]
+
+        # Flattening the outputs of batches preserving the order of chunks
+        summaries, input_token_counts, output_token_counts = [], [], []
+        for batch_summaries, batch_inputs, batch_outputs in outputs:
+            summaries.extend(batch_summaries)
+            input_token_counts.extend(batch_inputs)
+            output_token_counts.extend(batch_outputs)
+
+        return summaries, input_token_counts, output_token_counts
+
     def summarize(
-        self, pdf_path: str, config: Optional[SummaryGenerationConfig] = None
+        self,
+        pdf_path: PDFSource,
+        config: Optional[SummaryGenerationConfig] = None,
     ) -> str:
         """Summarizes the text from PDF-article.
 
         Args:
-            pdf_path (str): Path to an article to be summarized.
+            pdf_path (PDFSource): Path to an article to be summarized or its content held in memory.
             config (SummaryGenerationConfig): Configuration settings for summarization task.
 
         Returns:
@@ -144,52 +694,495 @@ class ArticleSummarizer:
         config = config or SummaryGenerationConfig()
         self.summarization_config: dict[str, Any] = asdict(config)
 
-        # Retrieving and cleaning article text from PDF
-        self.pdf_path = pdf_path
-        pdf_extractor = PDFExtractor(pdf_path=pdf_path)
-        text = pdf_extractor.retrieve_processed_text()
-        self.clean_text = text
+        timer = StageTimer()
+        article = self._prepare_article(pdf_path=pdf_path, timer=timer)
+        result = self._generate_summaries(
+            articles=[article], config=config, timer=timer
+        )[0]
+        self._store_result(result)
+        self._notify_timings(timer.timings)
 
-        # Computing the number of word and sentences in an article text
-        self.word_count_full = len(nltk.tokenize.word_tokenize(text))
-        self.sentence_count_full = len(nltk.tokenize.sent_tokenize(text))
+        return result.summary
 
-        # Adding a prefix in case of T5-models
-        if "t5" in self.model_path or self.tokenizer_path:
-            text = "summarize: " + text
+    def summarize_many(
+        self,
+        pdf_paths: list[PDFSource],
+        config: Optional[SummaryGenerationConfig] = None,
+        batch_size: int = 8,
+    ) -> list["SummarizationResult"]:
+        """Summarizes several PDF-articles using batched generation.
 
-        # Tokenizing input sequence in accordance with max context window
-        inputs = self.tokenizer(
-            text,
-            return_tensors="pt",
-            truncation=True,
-            max_length=self.context_window,
-        ).to(self.device)
+        Articles are cleaned one by one and then tokenized together with padding,
+        so that each batch of `batch_size` articles is summarized with a single `generate` call.
 
-        # Computing number of tokens for the input tokenized sequence
-        self.input_token_count = len(inputs["input_ids"][0])
+        Args:
+            pdf_paths (list[PDFSource]): Paths to articles to be summarized or their contents held in memory.
+            config (Optional[SummaryGenerationConfig], optional): Configuration settings for summarization task. Defaults to None.
+            batch_size (int, optional): Number of articles to summarize in one `generate` call. Defaults to 8.
 
-        # Generating tokens as output
-        with torch.no_grad():
-            summary_ids = self.model.generate(
-                **inputs, **self.summarization_config
+        Raises:
+            ValueError: Exception raised if `batch_size` is not positive.
+
+        Returns:
+            list[SummarizationResult]: Summaries and statistics in the order of `pdf_paths` (stage timings are shared by articles of a batch).
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size should be a positive integer.")
+
+        ensure_nltk_resource(resource_id="tokenizers/punkt")
+        ensure_nltk_resource(resource_id="tokenizers/punkt_tab")
+
+        # Setting generation config to default params if config not specified
+        config = config or SummaryGenerationConfig()
+        self.summarization_config = asdict(config)
+
+        results = []
+        for start in range(0, len(pdf_paths), batch_size):
+            timer = StageTimer()
+            articles = [
+                self._prepare_article(pdf_path=pdf_path, timer=timer)
+                for pdf_path in pdf_paths[start : start + batch_size]
+            ]
+            results.extend(
+                self._generate_summaries(
+                    articles=articles, config=config, timer=timer
+                )
+            )
+            self._notify_timings(timer.timings)
+
+        return results
+
+    def _profiled(self, function: Callable[..., T]) -> Callable[..., T]:
+        """Wraps a function run by another thread to be covered by the profiler (if any).
+
+        Args:
+            function (Callable[..., T]): Function submitted to another thread.
+
+        Returns:
+            Callable[..., T]: Wrapped function or the function itself without profiler.
+        """
+        return self.profiler.wrap(function) if self.profiler else function
+
+    def _get_generation_executor(self) -> ThreadPoolExecutor:
+        """Returns the thread running `generate` calls of asynchronous methods (created once)."""
+        if self._generation_executor is None:
+            self._generation_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="generation"
+            )
+
+        return self._generation_executor
+
+    async def asummarize(
+        self,
+        pdf_path: PDFSource,
+        config: Optional[SummaryGenerationConfig] = None,
+    ) -> str:
+        """Summarizes the text from PDF-article without blocking the event loop.
+
+        Articles summarized concurrently in the same event loop are prepared in its default
+        executor and share batched `generate` calls running in a separate thread.
+
+        Args:
+            pdf_path (PDFSource): Path to an article to be summarized or its content held in memory.
+            config (Optional[SummaryGenerationConfig], optional): Configuration settings for summarization task. Defaults to None.
+
+        Returns:
+            str: Generated formatted summary of an article.
+        """
+        # Importing here since the pipeline refers to this class
+        from .async_pipeline import AsyncSummarizationPipeline
+
+        # Setting generation config to default params if config not specified
+        config = config or SummaryGenerationConfig()
+        self.summarization_config = asdict(config)
+
+        # Dropping pipelines of closed event loops, whose IDs may be reused
+        for loop_id, pipeline in list(self._async_pipelines.items()):
+            if pipeline.loop is not None and pipeline.loop.is_closed():
+                del self._async_pipelines[loop_id]
+        loop_id = id(asyncio.get_running_loop())
+        if loop_id not in self._async_pipelines:
+            self._async_pipelines[loop_id] = AsyncSummarizationPipeline(self)
+        result = await self._async_pipelines[loop_id].summarize(
+            pdf_path=pdf_path, config=config
+        )
+        self._store_result(result)
+
+        return result.summary
+
+    async def aclose(self) -> None:
+        """Stops the pipeline of `asummarize` in the running event loop and the generation thread.
+
+        Articles already awaited are summarized first. Asynchronous methods can still be used afterwards.
+        """
+        pipeline = self._async_pipelines.pop(
+            id(asyncio.get_running_loop()), None
+        )
+        if pipeline is not None:
+            await pipeline.aclose()
+        # Keeping the thread while pipelines of other event loops use it
+        if not self._async_pipelines and self._generation_executor is not None:
+            self._generation_executor.shutdown()
+            self._generation_executor = None
+
+    async def __aenter__(self) -> "ArticleSummarizer":
+        """Returns the summarizer to be closed when leaving the context."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Stops the pipeline of `asummarize` and the generation thread."""
+        await self.aclose()
+
+    async def asummarize_many(
+        self,
+        pdf_paths: list[PDFSource],
+        config: Optional[SummaryGenerationConfig] = None,
+        batch_size: int = 8,
+        max_pending: int = 16,
+        executor: Optional[Executor] = None,
+    ) -> list["SummarizationResult"]:
+        """Summarizes several PDF-articles without blocking the event loop.
+
+        Articles are extracted, cleaned and tokenized in `executor` while previously prepared
+        ones are summarized by batched `generate` calls in a separate thread.
+
+        Args:
+            pdf_paths (list[PDFSource]): Paths to articles to be summarized or their contents held in memory.
+            config (Optional[SummaryGenerationConfig], optional): Configuration settings for summarization task. Defaults to None.
+            batch_size (int, optional): Maximum number of articles to summarize in one `generate` call. Defaults to 8.
+            max_pending (int, optional): Maximum number of articles being prepared or waiting for generation. Defaults to 16.
+            executor (Optional[Executor], optional): Thread or process executor running extraction and cleaning (default executor of the event loop if None). Defaults to None.
+
+        Returns:
+            list[SummarizationResult]: Summaries and statistics in the order of `pdf_paths`.
+        """
+        from .async_pipeline import AsyncSummarizationPipeline
+
+        # Setting generation config to default params if config not specified
+        config = config or SummaryGenerationConfig()
+        self.summarization_config = asdict(config)
+
+        async with AsyncSummarizationPipeline(
+            self,
+            batch_size=batch_size,
+            max_pending=max_pending,
+            executor=executor,
+        ) as pipeline:
+            return list(
+                await asyncio.gather(
+                    *(
+                        pipeline.summarize(pdf_path=pdf_path, config=config)
+                        for pdf_path in pdf_paths
+                    )
+                )
             )
 
-        # Computing number of tokens in the generated summary
-        self.output_token_count = len(summary_ids[0])
+    def summarize_long(
+        self,
+        pdf_path: PDFSource,
+        config: Optional[SummaryGenerationConfig] = None,
+        batch_size: Optional[int] = None,
+        num_workers: int = 1,
+        max_reduce_rounds: int = 3,
+    ) -> str:
+        """Summarizes the full text of PDF-article exceeding the context window of the model.
+
+        The article text is split into sentence-aligned chunks fitting into the context window,
+        which are summarized together in batched `generate` calls (map step). Partial summaries
+        are then concatenated and summarized again, recursing while they do not fit into a single chunk (reduce step).
+
+        Args:
+            pdf_path (PDFSource): Path to an article to be summarized or its content held in memory.
+            config (Optional[SummaryGenerationConfig], optional): Configuration settings for summarization task. Defaults to None.
+            batch_size (Optional[int], optional): Number of chunks per `generate` call (all chunks at once if None). Defaults to None.
+            num_workers (int, optional): Number of threads running `generate` calls concurrently. Defaults to 1.
+            max_reduce_rounds (int, optional): Maximum number of reduce steps. Defaults to 3.
+
+        Returns:
+            str: Generated formatted summary of an article.
+        """
+        ensure_nltk_resource(resource_id="tokenizers/punkt")
+        ensure_nltk_resource(resource_id="tokenizers/punkt_tab")
+
+        # Setting generation config to default params if config not specified
+        config = config or SummaryGenerationConfig()
+        self.summarization_config = asdict(config)
+
+        timer = StageTimer()
+        article = self._prepare_article(pdf_path=pdf_path, timer=timer)
+        cached_result = self._get_cached_result(
+            pdf_path=article.pdf_path,
+            clean_text=article.clean_text,
+            config=config,
+            mode="long",
+        )
+        if cached_result is not None:
+            cached_result.stats.stage_timings = dict(timer.timings)
+            self._store_result(cached_result)
+            self._notify_timings(timer.timings)
+            return cached_result.summary
 
-        # Decoding tokens
-        summary = self.tokenizer.decode(
-            summary_ids[0], skip_special_tokens=True
+        metrics = GenerationMetrics()
+        # Summarizing all chunks of the article (map step)
+        (
+            summaries,
+            input_token_counts,
+            output_token_counts,
+        ) = self._summarize_chunks(
+            chunks=self._split_into_chunks(article.clean_text),
+            config=config,
+            batch_size=batch_size,
+            num_workers=num_workers,
+            timer=timer,
+            metrics=metrics,
         )
-        summary = prettify_summary(summary)
-        self.summary = summary
+        input_token_count = sum(input_token_counts)
+
+        # Summarizing concatenated partial summaries (reduce step)
+        for _ in range(max_reduce_rounds):
+            if len(summaries) == 1:
+                break
+            summaries, _, output_token_counts = self._summarize_chunks(
+                chunks=self._split_into_chunks(" ".join(summaries)),
+                config=config,
+                batch_size=batch_size,
+                num_workers=num_workers,
+                timer=timer,
+                metrics=metrics,
+            )
+
+        with timer.measure("prettify"):
+            summary = prettify_summary(" ".join(summaries))
+        with timer.measure("stats"):
+            result = self._build_result(
+                article=article,
+                summary=summary,
+                input_token_count=input_token_count,
+                output_token_count=sum(output_token_counts),
+            )
+        result.stats.stage_timings = dict(timer.timings)
+        result.stats.generation_metrics = metrics
+        self._cache_result(result=result, config=config, mode="long")
+        self._store_result(result)
+        self._notify_timings(timer.timings)
+
+        return result.summary
+
+    def _analyze_article(
+        self,
+        text: str,
+        timer: StageTimer,
+        keywords_extractor_params: dict[str, Any],
+        idf_index: Optional[CorpusIndex],
+    ) -> tuple[tuple[int, int], list[str]]:
+        """Counts words and sentences of an article text and extracts its keywords.
 
-        # Computing number of words and sentences in the generated summary
-        self.word_count_summary = len(nltk.tokenize.word_tokenize(summary))
-        self.sentence_count_summary = len(nltk.tokenize.sent_tokenize(summary))
+        Args:
+            text (str): Cleaned text of an article.
+            timer (StageTimer): Timer of summarization stages.
+            keywords_extractor_params (dict[str, Any]): Arguments of KeywordsExtractor.
+            idf_index (Optional[CorpusIndex]): Index of document frequencies used by "tfidf" engine.
+
+        Returns:
+            tuple[tuple[int, int], list[str]]: Numbers of words and sentences and extracted keywords.
+        """
+        with timer.measure("stats"):
+            counts = self._count_words_and_sentences(text)
+        with timer.measure("keywords"):
+            keywords_extractor = KeywordsExtractor(
+                idf_index=idf_index, **keywords_extractor_params
+            )
+            keywords = self._extract_keywords(text, keywords_extractor)
+
+        return counts, keywords
 
-        return summary
+    @staticmethod
+    def _extract_keywords(
+        text: str, keywords_extractor: KeywordsExtractor
+    ) -> list[str]:
+        """Extracts keywords of an article adding it to the corpus index of TF-IDF engine first.
+
+        Args:
+            text (str): Cleaned text of an article.
+            keywords_extractor (KeywordsExtractor): Instance of a KeywordsExtractor class.
+
+        Returns:
+            list[str]: Collection of extracted keywords.
+        """
+        if keywords_extractor.idf_index is not None:
+            keywords_extractor.idf_index.add(text)
+
+        return keywords_extractor.extract(text)
+
+    def summarize_with_report(
+        self,
+        pdf_path: PDFSource,
+        config: Optional[SummaryGenerationConfig] = None,
+        filename: Optional[str] = None,
+        save_folder: str = "summaries",
+        linewidth: int = 100,
+        kwrds_num: int = 5,
+        lm: str = "en_core_web_sm",
+        min_kwrd_length: int = 3,
+        most_common_elems: int = 20,
+        keyword_engine: str = "spacy",
+        idf_index: Optional[CorpusIndex] = None,
+    ) -> str:
+        """Summarizes the text from PDF-article and generates a summary report.
+
+        Once the article text is extracted, its words and sentences are counted and keywords are extracted
+        in a background thread while the model generates the summary. Time spent in each stage
+        is saved in `stage_timings` ("stats" and "keywords" stages overlap with "generate").
+
+        Args:
+            pdf_path (PDFSource): Path to an article to be summarized or its content held in memory.
+            config (Optional[SummaryGenerationConfig], optional): Configuration settings for summarization task. Defaults to None.
+            filename (Optional[str], optional): Report name. Defaults to None.
+            save_folder (str, optional): Folder where to save a report. Defaults to "summaries".
+            linewidth (int, optional): Max width of a line in a report. Defaults to 100.
+            kwrds_num (int, optional): Number of keywords to show in report. Defaults to 5.
+            lm (str, optional): Name of a language model to be used for keyword extraction. Defaults to "en_core_web_sm".
+            min_kwrds_length (int, optional): Minimal length of keyword to include. Defaults to 3.
+            most_common_elems (int, optional): Number of the most frequent words to consider. Defaults to 20.
+            keyword_engine (str, optional): Backend for keyword extraction ("spacy" or "tfidf"). Defaults to "spacy".
+            idf_index (Optional[CorpusIndex], optional): Index of document frequencies used by "tfidf" engine (the article is added to it). Defaults to None.
+
+        Raises:
+            ValueError: Exception raised if extension file in `filename` is not "txt".
+
+        Returns:
+            str: Generated formatted summary of an article.
+        """
+        # Validating the filename of a report
+        if (filename is not None) and (".txt" not in filename):
+            raise ValueError("Summary report should have 'txt' extension.")
+
+        ensure_nltk_resource(resource_id="tokenizers/punkt")
+        ensure_nltk_resource(resource_id="tokenizers/punkt_tab")
+
+        # Setting generation config to default params if config not specified
+        config = config or SummaryGenerationConfig()
+        self.summarization_config = asdict(config)
+
+        timer = StageTimer()
+        keywords_extractor_params = {
+            "lm": lm,
+            "min_kwrd_length": min_kwrd_length,
+            "most_common_elems": most_common_elems,
+            "engine": keyword_engine,
+        }
+        with timer.measure("total"):
+            pdf_name, text = self._extract_text(pdf_path=pdf_path, timer=timer)
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Post-processing the article text while the model generates the summary
+                analysis = executor.submit(
+                    self._profiled(self._analyze_article),
+                    text,
+                    timer,
+                    keywords_extractor_params,
+                    idf_index,
+                )
+                result = self._get_cached_result(
+                    pdf_path=pdf_name, clean_text=text, config=config
+                )
+                if result is None:
+                    metrics = GenerationMetrics()
+                    summaries, input_counts, output_counts = self._generate(
+                        model_inputs=[self._add_task_prefix(text)],
+                        config=config,
+                        timer=timer,
+                        metrics=metrics,
+                    )
+                    with timer.measure("prettify"):
+                        summary = prettify_summary(summaries[0])
+                with timer.measure("wait"):
+                    counts, kwrds = analysis.result()
+
+            if result is None:
+                word_count_full, sentence_count_full = counts
+                article = self.PreparedArticle(
+                    pdf_path=pdf_name,
+                    clean_text=text,
+                    model_input=self._add_task_prefix(text),
+                    word_count_full=word_count_full,
+                    sentence_count_full=sentence_count_full,
+                )
+                with timer.measure("stats"):
+                    result = self._build_result(
+                        article=article,
+                        summary=summary,
+                        input_token_count=input_counts[0],
+                        output_token_count=output_counts[0],
+                    )
+                result.stats.generation_metrics = metrics
+                self._cache_result(result=result, config=config)
+            result.stats.stage_timings = dict(timer.timings)
+            self._store_result(result)
+
+            report_generator = self.SummaryReportGenerator(
+                summarizer=self,
+                linewidth=linewidth,
+                kwrds_num=kwrds_num,
+                save_folder=save_folder,
+                idf_index=idf_index,
+                timer=timer,
+                **keywords_extractor_params,
+            )
+            report_generator.generate_txt_report(
+                filename=filename, keywords=kwrds
+            )
+        self._notify_timings(timer.timings)
+
+        return result.summary
+
+    def _store_result(self, result: "SummarizationResult") -> None:
+        """Saves the result of the latest summarization as instance attributes.
+
+        Args:
+            result (SummarizationResult): Result of summarizing an article.
+        """
+        self.pdf_path = result.pdf_path
+        self.clean_text = result.clean_text
+        self.summary = result.summary
+        self.word_count_full = result.stats.word_count_full
+        self.sentence_count_full = result.stats.sentence_count_full
+        self.word_count_summary = result.stats.word_count_summary
+        self.sentence_count_summary = result.stats.sentence_count_summary
+        self.input_token_count = result.stats.input_token_count
+        self.output_token_count = result.stats.output_token_count
+        self.stage_timings = result.stats.stage_timings
+        self.generation_metrics = result.stats.generation_metrics
+
+    def _notify_timings(self, timings: dict[str, StageTiming]) -> None:
+        """Saves timings of stages of the latest operation and passes them to the timing callback.
+
+        Args:
+            timings (dict[str, StageTiming]): Time spent in each stage.
+        """
+        self.stage_timings = dict(timings)
+        if self.timing_callback is not None:
+            self.timing_callback(self.stage_timings)
+
+    @dataclass
+    class PreparedArticle:
+        """Article text prepared for summary generation.
+
+        Attributes:
+            pdf_path (str): Path to an article to be summarized or name of its in-memory source.
+            clean_text (str): Article's relevant text that has been processed and cleaned.
+            model_input (str): Text to be tokenized and passed to the model.
+            word_count_full (int): Number of words in input article.
+            sentence_count_full (int): Number of sentences in input article.
+            input_ids (Optional[list[int]]): Token IDs of `model_input` if tokenized in advance.
+        """
+
+        pdf_path: str
+        clean_text: str
+        model_input: str
+        word_count_full: int
+        sentence_count_full: int
+        input_ids: Optional[list[int]] = None
 
     @dataclass
     class SummaryStatisticsConfig:
@@ -203,6 +1196,8 @@ class ArticleSummarizer:
             input_token_count (int): Number of tokens in input article text.
             output_token_count (int): Number of tokens in the generated summary.
             compression_rate (str): Value of compression rate between summary and article (in percent).
+            stage_timings (dict[str, StageTiming]): Time spent in stages of the summarization (not cached).
+            generation_metrics (Optional[GenerationMetrics]): Speed and memory usage of generation (None for cached summaries).
         """
 
         word_count_summary: int
@@ -212,6 +1207,28 @@ class ArticleSummarizer:
         input_token_count: int
         output_token_count: int
         compression_rate: str
+        stage_timings: dict[str, StageTiming] = field(
+            default_factory=dict, compare=False
+        )
+        generation_metrics: Optional[GenerationMetrics] = field(
+            default=None, compare=False
+        )
+
+    @dataclass
+    class SummarizationResult:
+        """Result of summarizing a single article.
+
+        Attributes:
+            pdf_path (str): Path to the summarized article or name of its in-memory source.
+            clean_text (str): Article's relevant text that has been processed and cleaned.
+            summary (str): Text of the generated summary.
+            stats (SummaryStatisticsConfig): Statistics of the summarization.
+        """
+
+        pdf_path: str
+        clean_text: str
+        summary: str
+        stats: "ArticleSummarizer.SummaryStatisticsConfig"
 
     def _get_stats(self) -> SummaryStatisticsConfig:
         """Collects statistics after summary generation.
@@ -231,6 +1248,8 @@ class ArticleSummarizer:
             input_token_count=self.input_token_count,
             output_token_count=self.output_token_count,
             compression_rate=f"{compression_ratio(self.summary, self.clean_text):.2%}",
+            stage_timings=self.stage_timings,
+            generation_metrics=self.generation_metrics,
         )
 
     class SummaryReportGenerator:
@@ -242,7 +1261,8 @@ class ArticleSummarizer:
             kwrds_num (int): Number of keywords to include into the report.
             linewidth (int): Max line width in the report.
             statistics (dict[str, Any]): Statistics to include into the report.
-            keywords_extractor (KeywordsExtractor): Instance of a KeywordsExtractor class.
+            keywords_extractor (KeywordsExtractor): Instance of a KeywordsExtractor class (language model is loaded only if keywords are not extracted in advance).
+            timer (StageTimer): Timer of "keywords" and "write" stages.
         """
 
         def __init__(
@@ -254,6 +1274,9 @@ class ArticleSummarizer:
             lm: str = "en_core_web_sm",
             min_kwrd_length: int = 3,
             most_common_elems: int = 20,
+            engine: str = "spacy",
+            idf_index: Optional[CorpusIndex] = None,
+            timer: Optional[StageTimer] = None,
         ):
             """Initializes a SummaryReportGenerator instance.
 
@@ -265,17 +1288,34 @@ class ArticleSummarizer:
                 lm (str, optional): Name of a language model to be used for keyword extraction. Defaults to "en_core_web_sm".
                 min_kwrds_length (int, optional): Minimal length of keyword to include. Defaults to 3.
                 most_common_elems (int, optional): Number of the most frequent words to consider. Defaults to 20.
+                engine (str, optional): Backend for keyword extraction ("spacy" or "tfidf"). Defaults to "spacy".
+                idf_index (Optional[CorpusIndex], optional): Index of document frequencies used by "tfidf" engine (the article is added to it). Defaults to None.
+                timer (Optional[StageTimer], optional): Timer of "keywords" and "write" stages (new timer if None). Defaults to None.
             """
             self.summarizer: ArticleSummarizer = summarizer
             self.save_folder = save_folder
             self.kwrds_num = kwrds_num
             self.linewidth = linewidth
             self.statistics: dict[str, Any] = asdict(summarizer._get_stats())
-            self.keywords_extractor = KeywordsExtractor(
-                lm=lm,
-                min_kwrd_length=min_kwrd_length,
-                most_common_elems=most_common_elems,
-            )
+            self._keywords_extractor_params = {
+                "lm": lm,
+                "min_kwrd_length": min_kwrd_length,
+                "most_common_elems": most_common_elems,
+                "engine": engine,
+                "idf_index": idf_index,
+            }
+            self._keywords_extractor: Optional[KeywordsExtractor] = None
+            self.timer = timer or StageTimer()
+
+        @property
+        def keywords_extractor(self) -> KeywordsExtractor:
+            """Instance of a KeywordsExtractor class created on first use (not needed for keywords extracted in advance)."""
+            if self._keywords_extractor is None:
+                self._keywords_extractor = KeywordsExtractor(
+                    **self._keywords_extractor_params
+                )
+
+            return self._keywords_extractor
 
         def _generate_filepath(self, filename: str) -> Path:
             """Creates a Path object to the file for the report.
@@ -298,16 +1338,39 @@ class ArticleSummarizer:
             Returns:
                 str: Formatted string with statistics.
             """
+            lines = []
+            for key, value in self.statistics.items():
+                if not isinstance(value, dict):
+                    lines.append(f"{key}: {value}")
+                    continue
+                # Listing nested statistics one per line
+                lines.append(f"{key}:")
+                if key == "stage_timings":
+                    lines.extend(
+                        f"  {stage}: {timing['wall_time']:.3f} s wall, "
+                        f"{timing['cpu_time']:.3f} s CPU"
+                        for stage, timing in value.items()
+                    )
+                else:
+                    lines.extend(
+                        f"  {name}: {metric:.3f}"
+                        if isinstance(metric, float)
+                        else f"  {name}: {metric}"
+                        for name, metric in value.items()
+                    )
 
-            return "\n".join(
-                [f"{key}: {value}" for key, value in self.statistics.items()]
-            )
+            return "\n".join(lines)
 
-        def generate_txt_report(self, filename: Optional[str] = None) -> None:
+        def generate_txt_report(
+            self,
+            filename: Optional[str] = None,
+            keywords: Optional[list[str]] = None,
+        ) -> None:
             """Generates a summary report in TXT-format.
 
             Args:
                 filename (Optional[str], optional): Name of file for the summary report. Defaults to None.
+                keywords (Optional[list[str]], optional): Keywords extracted in advance (extracted from the article text if None). Defaults to None.
             """
             # Generating Summarization Report ID
             report_id = uuid.uuid4().hex[:6]
@@ -316,10 +1379,22 @@ class ArticleSummarizer:
 
             # Creating a filepath for the summary report
             filepath = self._generate_filepath(filename=filename)
-            # Computing keywords for the input article
-            kwrds = self.keywords_extractor.extract(self.summarizer.clean_text)
+            # Computing keywords for the input article if not extracted in advance
+            kwrds = keywords
+            if kwrds is None:
+                with self.timer.measure("keywords"):
+                    kwrds = ArticleSummarizer._extract_keywords(
+                        self.summarizer.clean_text, self.keywords_extractor
+                    )
+            # Adding timings of the report stages measured so far
+            self.statistics["stage_timings"].update(
+                (stage, asdict(timing))
+                for stage, timing in self.timer.timings.items()
+            )
             # Writing to file with a report
-            with filepath.open("w", encoding="utf-8") as file:
+            with self.timer.measure("write"), filepath.open(
+                "w", encoding="utf-8"
+            ) as file:
                 file.write(
                     f"=== Summarization Report {report_id.upper()} ===\n\n"
                 )
@@ -360,6 +1435,8 @@ class ArticleSummarizer:
         lm: str = "en_core_web_sm",
         min_kwrd_length: int = 3,
         most_common_elems: int = 20,
+        keyword_engine: str = "spacy",
+        idf_index: Optional[CorpusIndex] = None,
     ) -> None:
         """Generates a summary report.
 
@@ -371,6 +1448,8 @@ class ArticleSummarizer:
             lm (str, optional): Name of a language model to be used for keyword extraction. Defaults to "en_core_web_sm".
             min_kwrds_length (int, optional): Minimal length of keyword to include. Defaults to 3.
             most_common_elems (int, optional): Number of the most frequent words to consider. Defaults to 20.
+            keyword_engine (str, optional): Backend for keyword extraction ("spacy" or "tfidf"). Defaults to "spacy".
+            idf_index (Optional[CorpusIndex], optional): Index of document frequencies used by "tfidf" engine (the article is added to it). Defaults to None.
 
         Raises:
             ValueError: Exception raised if extension file in `filename` is not "txt".
@@ -388,5 +1467,12 @@ class ArticleSummarizer:
             lm=lm,
             min_kwrd_length=min_kwrd_length,
             most_common_elems=most_common_elems,
+            engine=keyword_engine,
+            idf_index=idf_index,
         )
         report_generator.generate_txt_report(filename=filename)
+
+        # Adding timings of the report stages to those of the summarization
+        self._notify_timings(
+            {**self.stage_timings, **report_generator.timer.timings}
+        )
@@ -0,0 +1,256 @@
+"""Persistent content-addressed cache of generated summaries."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+
+@dataclass
+class CacheStatistics:
+    """Counters of the summary cache.
+
+    Attributes:
+        hits (int): Number of lookups that returned a cached summary.
+        misses (int): Number of lookups that found no cached summary.
+        entries (int): Number of summaries stored in the cache.
+        size_bytes (int): Total size of stored summaries and statistics.
+    """
+
+    hits: int
+    misses: int
+    entries: int
+    size_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups that returned a cached summary."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups != 0 else 0.0
+
+    def __str__(self) -> str:
+        """Formats the statistics for displaying."""
+        return (
+            f"{self.hits} hits, {self.misses} misses "
+            f"({self.hit_rate:.2%} hit rate), {self.entries} entries, "
+            f"{self.size_bytes / 1024**2:.2f} MB"
+        )
+
+
+def path_fingerprint(path: Optional[str]) -> Optional[str]:
+    """Computes a fingerprint of a local model, tokenizer or adapters folder from names, sizes and modification times of its files.
+
+    Args:
+        path (Optional[str]): Path to a local file or folder, or an ID of a hub repository.
+
+    Returns:
+        Optional[str]: Hexadecimal SHA-256 digest (None if `path` is not a local path).
+    """
+    if path is None or not os.path.exists(path):
+        return None
+
+    root = Path(path)
+    files = sorted(root.rglob("*")) if root.is_dir() else [root]
+    hasher = hashlib.sha256()
+    for file in files:
+        if not file.is_file():
+            continue
+        stat = file.stat()
+        fingerprint = (
+            f"{file.relative_to(root)}|{stat.st_size}|{stat.st_mtime_ns}\n"
+        )
+        hasher.update(fingerprint.encode("utf-8"))
+
+    return hasher.hexdigest()
+
+
+class SummaryCache:
+    """SQLite-based cache of summaries keyed by a hash of article text, model and generation config.
+
+    Attributes:
+        path (Path): Path to the SQLite database file.
+        max_size_bytes (Optional[int]): Maximum total size of stored entries.
+        max_age_seconds (Optional[float]): Maximum age of stored entries.
+        refresh (bool): Flag to ignore cached summaries while still storing new ones.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size_bytes: Optional[int] = 512 * 1024**2,
+        max_age_seconds: Optional[float] = None,
+        refresh: bool = False,
+    ):
+        """Initializes a SummaryCache instance.
+
+        Args:
+            path (str): Path to the SQLite database file (created if non-existent).
+            max_size_bytes (Optional[int], optional): Maximum total size of stored entries (no limit if None). Defaults to 512 MB.
+            max_age_seconds (Optional[float], optional): Maximum age of stored entries (no limit if None). Defaults to None.
+            refresh (bool, optional): Flag to ignore cached summaries while still storing new ones. Defaults to False.
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self.max_age_seconds = max_age_seconds
+        self.refresh = refresh
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self.path), check_same_thread=False
+        )
+        with self._connection:
+            # Allowing concurrent readers while another process writes
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                "key TEXT PRIMARY KEY, summary TEXT NOT NULL, "
+                "stats TEXT NOT NULL, size INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def make_key(
+        clean_text: str, model_identity: dict[str, Any], config: dict[str, Any]
+    ) -> str:
+        """Computes a cache key for an article summarized with a model and generation config.
+
+        Args:
+            clean_text (str): Cleaned text of an article.
+            model_identity (dict[str, Any]): Model, tokenizer, LoRA adapters and other settings affecting the summary.
+            config (dict[str, Any]): Summary generation parameters.
+
+        Returns:
+            str: Hexadecimal SHA-256 digest.
+        """
+        payload = json.dumps(
+            {
+                "text": hashlib.sha256(clean_text.encode("utf-8")).hexdigest(),
+                "model": model_identity,
+                "config": config,
+            },
+            sort_keys=True,
+        )
+
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[tuple[str, dict[str, Any]]]:
+        """Looks up a cached summary.
+
+        Args:
+            key (str): Cache key computed with `make_key`.
+
+        Returns:
+            Optional[tuple[str, dict[str, Any]]]: Summary and its statistics or None if not cached.
+        """
+        with self._lock:
+            row = None
+            if not self.refresh:
+                row = self._connection.execute(
+                    "SELECT summary, stats, created_at FROM summaries WHERE key = ?",
+                    (key,),
+                ).fetchone()
+            # Treating expired entries as missing
+            if row is not None and self._is_expired(row[2]):
+                row = None
+            if row is None:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE summaries SET accessed_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+
+            return row[0], json.loads(row[1])
+
+    def put(self, key: str, summary: str, stats: dict[str, Any]) -> None:
+        """Stores a summary with its statistics and evicts entries exceeding the limits.
+
+        Args:
+            key (str): Cache key computed with `make_key`.
+            summary (str): Generated summary.
+            stats (dict[str, Any]): Statistics of the summarization.
+        """
+        stats_json = json.dumps(stats)
+        size = len(summary.encode("utf-8")) + len(stats_json.encode("utf-8"))
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?, ?, ?)",
+                (key, summary, stats_json, size, now, now),
+            )
+            self._evict()
+
+    def _is_expired(self, created_at: float) -> bool:
+        """Checks if an entry is older than the maximum age."""
+        return (
+            self.max_age_seconds is not None
+            and time.time() - created_at > self.max_age_seconds
+        )
+
+    def _evict(self) -> None:
+        """Removes expired entries and least recently used entries exceeding the size limit."""
+        if self.max_age_seconds is not None:
+            self._connection.execute(
+                "DELETE FROM summaries WHERE created_at < ?",
+                (time.time() - self.max_age_seconds,),
+            )
+        if self.max_size_bytes is not None:
+            # Keeping the most recently used entries fitting into the size limit
+            self._connection.execute(
+                "DELETE FROM summaries WHERE key IN ("
+                "SELECT key FROM (SELECT key, SUM(size) OVER "
+                "(ORDER BY accessed_at DESC, key) AS total FROM summaries) "
+                "WHERE total > ?)",
+                (self.max_size_bytes,),
+            )
+
+    def evict(self) -> None:
+        """Removes entries exceeding the age and size limits."""
+        with self._lock, self._connection:
+            self._evict()
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM summaries")
+
+    @property
+    def stats(self) -> CacheStatistics:
+        """Counters of hits and misses together with the cache size."""
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM summaries"
+            ).fetchone()
+
+            return CacheStatistics(
+                hits=self._hits,
+                misses=self._misses,
+                entries=entries,
+                size_bytes=size,
+            )
+
+    def __reduce__(self) -> tuple:
+        """Pickles the cache settings so that another process opens its own connection."""
+        return (
+            type(self),
+            (
+                str(self.path),
+                self.max_size_bytes,
+                self.max_age_seconds,
+                self.refresh,
+            ),
+        )
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        self._connection.close()
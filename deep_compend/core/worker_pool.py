@@ -0,0 +1,506 @@
+"""Summarization by several processes sharing the CPU cores of a machine."""
+
+import multiprocessing
+import os
+import pickle
+import queue
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from ..extractors import TextCache
+from ..utils.timing import StageTimer
+from .configs import SummaryGenerationConfig
+from .summary_cache import SummaryCache
+
+if TYPE_CHECKING:
+    from .generation_metrics import GenerationMetrics
+    from .summarizer import ArticleSummarizer
+
+# Seconds between checks that the workers are still alive while waiting for results
+_POLL_INTERVAL = 1.0
+
+
+@dataclass
+class WorkerInfo:
+    """Description of a started worker process.
+
+    Attributes:
+        pid (int): Process ID of the worker.
+        cores (Optional[list[int]]): CPU cores the worker is pinned to (None if not pinned).
+        num_threads (int): Number of intra-op threads of PyTorch in the worker.
+        mapped_weights (Optional[float]): Measured share of model weights backed by memory-mapped safetensors files, whose pages may be shared between workers (None if unknown).
+        context_window (int): Maximum context window of the loaded model.
+    """
+
+    pid: int
+    cores: Optional[list[int]]
+    num_threads: int
+    mapped_weights: Optional[float]
+    context_window: int
+
+
+def available_cores() -> list[int]:
+    """Lists CPU cores the current process may run on.
+
+    Returns:
+        list[int]: Sorted IDs of CPU cores.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+
+    return list(range(os.cpu_count() or 1))
+
+
+def partition_cores(
+    num_workers: int,
+    threads_per_worker: Optional[int] = None,
+    cores: Optional[list[int]] = None,
+) -> list[list[int]]:
+    """Splits CPU cores into disjoint slices, one per worker.
+
+    Args:
+        num_workers (int): Number of workers.
+        threads_per_worker (Optional[int], optional): Number of cores per worker (cores split evenly between workers if None). Defaults to None.
+        cores (Optional[list[int]], optional): CPU cores to split (cores available to the process if None). Defaults to None.
+
+    Raises:
+        ValueError: Exception raised if `num_workers` or `threads_per_worker` is not positive or there are not enough cores.
+
+    Returns:
+        list[list[int]]: Cores of each worker.
+    """
+    if num_workers < 1:
+        raise ValueError("Number of workers should be a positive integer.")
+    if threads_per_worker is not None and threads_per_worker < 1:
+        raise ValueError(
+            "Number of threads per worker should be a positive integer."
+        )
+
+    cores = cores if cores is not None else available_cores()
+    threads_per_worker = threads_per_worker or max(
+        1, len(cores) // num_workers
+    )
+    if num_workers * threads_per_worker > len(cores):
+        raise ValueError(
+            f"Workers need {num_workers * threads_per_worker} cores "
+            f"but only {len(cores)} available cores were found."
+        )
+
+    return [
+        cores[i * threads_per_worker : (i + 1) * threads_per_worker]
+        for i in range(num_workers)
+    ]
+
+
+def _mapped_weights_share(model: Any) -> Optional[float]:
+    """Computes the share of model weights stored in memory-mapped safetensors files.
+
+    Args:
+        model (PreTrainedModel): Loaded model.
+
+    Returns:
+        Optional[float]: Share of parameter bytes backed by the files (None if memory maps cannot be inspected).
+    """
+    try:
+        with open("/proc/self/maps") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+
+    spans = []
+    for line in lines:
+        if line.endswith(".safetensors"):
+            start, end = line.split()[0].split("-")
+            spans.append((int(start, 16), int(end, 16)))
+    total, mapped = 0, 0
+    for parameter in model.parameters():
+        size = parameter.numel() * parameter.element_size()
+        total += size
+        address = parameter.data_ptr()
+        if any(start <= address < end for start, end in spans):
+            mapped += size
+
+    return mapped / total if total != 0 else None
+
+
+def _reportable_error(error: Exception) -> Exception:
+    """Returns the exception itself if it can be sent to another process or its description otherwise."""
+    try:
+        pickle.dumps(error)
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
+    return error
+
+
+def _worker_main(
+    worker_id: int,
+    cores: Optional[list[int]],
+    num_threads: int,
+    summarizer_params: dict[str, Any],
+    batch_size: int,
+    tasks: multiprocessing.Queue,
+    results: multiprocessing.Queue,
+) -> None:
+    """Loads the model once and summarizes batches of articles taken from the shared queue.
+
+    Args:
+        worker_id (int): Index of the worker.
+        cores (Optional[list[int]]): CPU cores to pin the worker to (not pinned if None).
+        num_threads (int): Number of intra-op threads of PyTorch.
+        summarizer_params (dict[str, Any]): Arguments of ArticleSummarizer.
+        batch_size (int): Maximum number of articles summarized in one `generate` call.
+        tasks (multiprocessing.Queue): Queue of (index, path to an article, config) tasks ended by None.
+        results (multiprocessing.Queue): Queue receiving the messages of the worker.
+    """
+    # Limiting OpenMP threads before PyTorch is imported
+    os.environ["OMP_NUM_THREADS"] = str(num_threads)
+    os.environ["MKL_NUM_THREADS"] = str(num_threads)
+    try:
+        if cores is not None and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cores)
+
+        import torch
+
+        from .summarizer import ArticleSummarizer
+
+        torch.set_num_threads(num_threads)
+        torch.set_num_interop_threads(1)
+        summarizer = ArticleSummarizer(**summarizer_params)
+    except Exception as e:
+        results.put(("failed", worker_id, _reportable_error(e)))
+        return
+    results.put(
+        (
+            "ready",
+            worker_id,
+            WorkerInfo(
+                pid=os.getpid(),
+                cores=cores,
+                num_threads=torch.get_num_threads(),
+                mapped_weights=_mapped_weights_share(summarizer.model),
+                context_window=summarizer.context_window,
+            ),
+        )
+    )
+
+    stopped = False
+    while not stopped:
+        task = tasks.get()
+        if task is None:
+            break
+        # Taking tasks queued meanwhile to summarize them together
+        batch = [task]
+        while len(batch) < batch_size:
+            try:
+                task = tasks.get_nowait()
+            except queue.Empty:
+                break
+            if task is None:
+                stopped = True
+                break
+            batch.append(task)
+
+        # Preparing articles one by one so that a broken article fails alone
+        groups: dict[tuple, list[tuple[int, Any, StageTimer]]] = {}
+        for index, pdf_path, config in batch:
+            timer = StageTimer()
+            try:
+                article = summarizer._prepare_article(
+                    pdf_path=pdf_path, timer=timer, tokenize=True
+                )
+            except Exception as e:
+                results.put(("result", index, None, _reportable_error(e)))
+                continue
+            key = tuple(asdict(config).items())
+            groups.setdefault(key, []).append((index, article, timer))
+
+        for key, items in groups.items():
+            timer = StageTimer()
+            try:
+                summaries = summarizer._generate_summaries(
+                    articles=[article for _, article, _ in items],
+                    config=SummaryGenerationConfig(**dict(key)),
+                    timer=timer,
+                )
+            except Exception as e:
+                error = _reportable_error(e)
+                for index, _, _ in items:
+                    results.put(("result", index, None, error))
+                continue
+            for (index, _, prepare_timer), result in zip(items, summaries):
+                # Combining timings of the preparation and of the shared batch
+                result.stats.stage_timings = {
+                    **prepare_timer.timings,
+                    **result.stats.stage_timings,
+                }
+                results.put(("result", index, result, None))
+
+    results.put(("stopped", worker_id, summarizer.run_metrics))
+
+
+class SummarizationWorkerPool:
+    """Summarizes articles in several processes, each with its own model and slice of CPU cores.
+
+    A single process running `generate` stops scaling beyond a moderate number of intra-op
+    threads, so large CPU machines are better used by several workers with fewer threads each.
+    Every worker is pinned to its own cores, loads the model once and takes articles from a
+    shared queue, summarizing the articles queued so far (up to `batch_size`) together.
+    Sharing of weights between workers is not enforced: it depends on whether the model
+    loader keeps safetensors checkpoints memory-mapped, so it is only measured and reported
+    per worker in `WorkerInfo.mapped_weights`.
+
+    Usage:
+        with SummarizationWorkerPool("google-t5/t5-small", num_workers=4) as pool:
+            results = pool.summarize_many(["article1.pdf", "article2.pdf"])
+
+    Attributes:
+        num_workers (int): Number of worker processes.
+        batch_size (int): Maximum number of articles summarized by a worker in one `generate` call.
+        threads_per_worker (int): Number of PyTorch threads of each worker.
+        worker_cores (list[Optional[list[int]]]): CPU cores each worker is pinned to (None if not pinned).
+        workers (list[WorkerInfo]): Descriptions of the started workers.
+        run_metrics (GenerationMetrics): Generation speed aggregated over the workers once the pool is closed.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        tokenizer_path: Optional[str] = None,
+        lora_adapters_path: Optional[str] = None,
+        dtype: Optional[str] = None,
+        num_workers: int = 2,
+        threads_per_worker: Optional[int] = None,
+        pin_workers: bool = True,
+        batch_size: int = 8,
+        summary_cache: Optional[SummaryCache] = None,
+        text_cache: Optional[TextCache] = None,
+        extraction_workers: int = 1,
+    ):
+        """Initializes a SummarizationWorkerPool instance.
+
+        Args:
+            model_path (str): Path to the Transformer model.
+            tokenizer_path (Optional[str], optional): Path to Transformer tokenizer. Defaults to None.
+            lora_adapters_path (Optional[str], optional): Path to LoRA adapters to attach. Defaults to None.
+            dtype (Optional[str], optional): Name of torch data type to cast the model to (weights are then copied instead of memory-mapped). Defaults to None.
+            num_workers (int, optional): Number of worker processes. Defaults to 2.
+            threads_per_worker (Optional[int], optional): Number of cores and PyTorch threads of each worker (cores split evenly if None). Defaults to None.
+            pin_workers (bool, optional): Flag to pin workers to disjoint slices of cores (workers may share cores if False). Defaults to True.
+            batch_size (int, optional): Maximum number of articles summarized by a worker in one `generate` call. Defaults to 8.
+            summary_cache (Optional[SummaryCache], optional): Persistent cache of generated summaries (reopened by each worker). Defaults to None.
+            text_cache (Optional[TextCache], optional): Persistent cache of texts extracted from PDF-files. Defaults to None.
+            extraction_workers (int, optional): Number of processes extracting page texts of large PDF-files. Defaults to 1.
+
+        Raises:
+            ValueError: Exception raised if `batch_size`, `num_workers` or `threads_per_worker` is not positive or there are not enough cores.
+        """
+        # Importing lazily since workers import this module before limiting their threads
+        from .generation_metrics import GenerationMetrics
+
+        if batch_size < 1:
+            raise ValueError("Batch size should be a positive integer.")
+
+        self.num_workers = num_workers
+        self.batch_size = batch_size
+        if pin_workers:
+            self.worker_cores = partition_cores(
+                num_workers, threads_per_worker
+            )
+            self.threads_per_worker = len(self.worker_cores[0])
+        else:
+            if num_workers < 1:
+                raise ValueError(
+                    "Number of workers should be a positive integer."
+                )
+            if threads_per_worker is not None and threads_per_worker < 1:
+                raise ValueError(
+                    "Number of threads per worker should be a positive integer."
+                )
+            # Letting the operating system schedule workers, which may share cores
+            self.worker_cores = [None] * num_workers
+            self.threads_per_worker = threads_per_worker or max(
+                1, len(available_cores()) // num_workers
+            )
+        self.workers: list[WorkerInfo] = []
+        self.run_metrics: "GenerationMetrics" = GenerationMetrics()
+        self._summarizer_params = {
+            "model_path": model_path,
+            "tokenizer_path": tokenizer_path,
+            "run_on": "cpu",
+            "lora_adapters_path": lora_adapters_path,
+            "dtype": dtype,
+            "summary_cache": summary_cache,
+            "text_cache": text_cache,
+            "extraction_workers": extraction_workers,
+        }
+        self._context = multiprocessing.get_context("spawn")
+        self._tasks: Optional[multiprocessing.Queue] = None
+        self._results: Optional[multiprocessing.Queue] = None
+        self._processes: list[multiprocessing.Process] = []
+
+    def start(self) -> None:
+        """Starts the workers and waits until all of them have loaded the model.
+
+        Raises:
+            RuntimeError: Exception raised if a worker failed to load the model.
+        """
+        if self._processes:
+            return
+
+        # Spawning fresh interpreters since forking a process using PyTorch threads is unsafe
+        self._tasks = self._context.Queue()
+        self._results = self._context.Queue()
+        for worker_id, cores in enumerate(self.worker_cores):
+            process = self._context.Process(
+                target=_worker_main,
+                args=(
+                    worker_id,
+                    cores,
+                    self.threads_per_worker,
+                    self._summarizer_params,
+                    self.batch_size,
+                    self._tasks,
+                    self._results,
+                ),
+                name=f"summarization-worker-{worker_id}",
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+
+        workers: dict[int, WorkerInfo] = {}
+        while len(workers) < self.num_workers:
+            kind, worker_id, payload = self._get_message()
+            if kind == "failed":
+                self.terminate()
+                raise RuntimeError(
+                    f"Summarization worker {worker_id} failed to start: {payload}"
+                )
+            workers[worker_id] = payload
+        self.workers = [workers[i] for i in range(self.num_workers)]
+
+    def _get_message(self) -> tuple:
+        """Waits for the next message of the workers.
+
+        Raises:
+            RuntimeError: Exception raised if a worker has exited.
+
+        Returns:
+            tuple: Kind of the message followed by its contents.
+        """
+        while True:
+            try:
+                return self._results.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                # Tasks taken by a crashed worker would never be finished
+                if not all(p.is_alive() for p in self._processes):
+                    raise RuntimeError(
+                        "Summarization workers exited unexpectedly."
+                    )
+
+    def close(self) -> None:
+        """Stops the workers once they have summarized the queued articles."""
+        if not self._processes:
+            return
+
+        for _ in self._processes:
+            self._tasks.put(None)
+        # Collecting metrics of the workers until all of them have exited
+        stopped = 0
+        while stopped < len(self._processes):
+            try:
+                kind, _, payload = self._results.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                if not any(p.is_alive() for p in self._processes):
+                    break
+                continue
+            if kind == "stopped":
+                self.run_metrics.add(payload)
+                stopped += 1
+        for process in self._processes:
+            process.join()
+        self._processes = []
+
+    def terminate(self) -> None:
+        """Stops the workers immediately."""
+        for process in self._processes:
+            process.terminate()
+            process.join()
+        self._processes = []
+
+    def __enter__(self) -> "SummarizationWorkerPool":
+        """Starts the workers."""
+        self.start()
+
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        """Stops the workers (immediately if an exception has been raised)."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+    def summarize_as_completed(
+        self,
+        articles: list[tuple[str, Optional[SummaryGenerationConfig]]],
+    ) -> Iterator[
+        tuple[
+            int,
+            Optional["ArticleSummarizer.SummarizationResult"],
+            Optional[Exception],
+        ]
+    ]:
+        """Summarizes articles yielding their results as soon as workers finish them.
+
+        Args:
+            articles (list[tuple[str, Optional[SummaryGenerationConfig]]]): Paths to articles with their configuration settings for summarization task.
+
+        Raises:
+            RuntimeError: Exception raised if a worker has exited before summarizing the articles.
+
+        Yields:
+            tuple[int, Optional[SummarizationResult], Optional[Exception]]: Index of an article in `articles` with its result or the exception raised while summarizing it.
+        """
+        self.start()
+        for index, (pdf_path, config) in enumerate(articles):
+            self._tasks.put(
+                (index, pdf_path, config or SummaryGenerationConfig())
+            )
+
+        remaining = len(articles)
+        while remaining > 0:
+            _, index, result, error = self._get_message()
+            remaining -= 1
+            yield index, result, error
+
+    def summarize_many(
+        self,
+        pdf_paths: list[str],
+        config: Optional[SummaryGenerationConfig] = None,
+    ) -> list["ArticleSummarizer.SummarizationResult"]:
+        """Summarizes several PDF-articles with all workers.
+
+        Args:
+            pdf_paths (list[str]): Paths to articles to be summarized.
+            config (Optional[SummaryGenerationConfig], optional): Configuration settings for summarization task. Defaults to None.
+
+        Raises:
+            Exception: The first exception raised while summarizing an article.
+
+        Returns:
+            list[SummarizationResult]: Summaries and statistics in the order of `pdf_paths`.
+        """
+        results: list[Any] = [None] * len(pdf_paths)
+        errors = []
+        for index, result, error in self.summarize_as_completed(
+            [(pdf_path, config) for pdf_path in pdf_paths]
+        ):
+            if error is not None:
+                errors.append((index, error))
+            results[index] = result
+        if errors:
+            raise min(errors, key=lambda item: item[0])[1]
+
+        return results
@@ -1,4 +1,6 @@
 # ruff: noqa: F401
 
 from .keywords_extractor import KeywordsExtractor
-from .pdf_extractor import PDFExtractor
+from .pdf_extractor import PDFExtractor, PDFSource
+from .text_cache import TextCache
+from .tfidf import CorpusIndex
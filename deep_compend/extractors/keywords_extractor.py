@@ -1,9 +1,61 @@
 """Extraction of keywords."""
 
+import re
 import sys
+import threading
 from collections import Counter
+from itertools import groupby
+from operator import itemgetter
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 
-import spacy
+from .tfidf import CorpusIndex, extract_tfidf_keywords
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+    from spacy.tokens import Doc
+
+# Pipeline components not needed for POS tags and named entities
+EXCLUDED_COMPONENTS = ["parser", "lemmatizer"]
+
+# Backends scoring keyword candidates
+KEYWORD_ENGINES = ("spacy", "tfidf")
+
+# Boundary between sentences of a cleaned text
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+# Language models loaded in the process and shared by all extractors
+_pipelines: dict[str, "Language"] = {}
+_pipelines_lock = threading.Lock()
+
+
+def load_spacy_pipeline(lm: str) -> "Language":
+    """
+    Loads a SpaCy language model once per process, downloading it if not present.
+
+    Args:
+        lm (str): Name of or path to a SpaCy language model.
+
+    Returns:
+        Language: Pipeline without components unused for keyword extraction.
+    """
+    with _pipelines_lock:
+        if lm not in _pipelines:
+            # Importing SpaCy only when a language model is needed
+            import spacy
+
+            try:
+                nlp = spacy.load(lm, exclude=EXCLUDED_COMPONENTS)
+            except OSError:
+                import subprocess
+
+                subprocess.run(
+                    [sys.executable, "-m", "spacy", "download", f"{lm}"],
+                    check=True,
+                )
+                nlp = spacy.load(lm, exclude=EXCLUDED_COMPONENTS)
+            _pipelines[lm] = nlp
+
+        return _pipelines[lm]
 
 
 class KeywordsExtractor:
@@ -14,6 +66,10 @@ class KeywordsExtractor:
         lm (str): Name of a language model to be used for extraction.
         min_kwrd_length (int): Minimal length of keyword to include.
         most_common_elems (int): Number of the most frequent words to consider.
+        chunk_length (int): Maximum number of characters processed by the language model at once.
+        engine (str): Backend scoring keyword candidates ("spacy" or "tfidf").
+        idf_index (Optional[CorpusIndex]): Index of document frequencies used by "tfidf" engine.
+        nlp (Optional[Language]): Loaded SpaCy language model shared across instances (None for "tfidf" engine).
     """
 
     def __init__(
@@ -21,6 +77,9 @@ class KeywordsExtractor:
         lm: str = "en_core_web_sm",
         min_kwrd_length: int = 3,
         most_common_elems: int = 20,
+        chunk_length: int = 100_000,
+        engine: str = "spacy",
+        idf_index: Optional[CorpusIndex] = None,
     ):
         """
         Initializes a KeywordsExtractor instance.
@@ -29,48 +88,92 @@ class KeywordsExtractor:
             lm (str, optional): Name of a language model to be used for extraction. Defaults to "en_core_web_sm".
             min_kwrd_length (int, optional): Minimal length of keyword to include. Defaults to 3.
             most_common_elems (int, optional): Number of the most frequent words to consider. Defaults to 20.
+            chunk_length (int, optional): Maximum number of characters processed by the language model at once (longer texts are split on sentence boundaries). Defaults to 100000.
+            engine (str, optional): Backend scoring keyword candidates: "spacy" counts nouns and named entities tagged by the language model, "tfidf" ranks words by TF-IDF without loading it. Defaults to "spacy".
+            idf_index (Optional[CorpusIndex], optional): Index of document frequencies used by "tfidf" engine (words are ranked by frequency in the text if None). Defaults to None.
+
+        Raises:
+            ValueError: Exception raised if `engine` is not supported.
         """
+        if engine not in KEYWORD_ENGINES:
+            raise ValueError(
+                f"Keyword engine should be one of: {', '.join(KEYWORD_ENGINES)}."
+            )
+
         self.lm = lm
         self.min_kwrd_length = min_kwrd_length
         self.most_common_elems = most_common_elems
+        self.chunk_length = chunk_length
+        self.engine = engine
+        self.idf_index = idf_index
+        # Loading a SpaCy language model only needed by "spacy" engine (downloading it if not present)
+        self.nlp = load_spacy_pipeline(self.lm) if engine == "spacy" else None
 
-        # Downloading a SpaCy language model if not present
-        try:
-            spacy.load(self.lm)
-        except OSError:
-            import subprocess
+    def _iter_chunks(self, text: str) -> Iterator[str]:
+        """
+        Splits a text exceeding the chunk length into chunks ending at sentence boundaries.
 
-            subprocess.run(
-                [sys.executable, "-m", "spacy", "download", f"{self.lm}"],
-                check=True,
-            )
+        Chunks are produced lazily and never exceed the maximum text length allowed by the language model.
+        A sentence longer than the chunk length is split on whitespace.
 
-    def extract(self, text: str) -> list[str]:
+        Args:
+            text (str): Text from which to extract keywords.
+
+        Yields:
+            Iterator[str]: Chunks of the text.
         """
-        Extracts keywords from an input text.
+        chunk_length = min(self.chunk_length, self.nlp.max_length)
+        start = 0
+        while len(text) - start > chunk_length:
+            end = start + chunk_length
+            # Cutting at the last sentence boundary or whitespace within the chunk length
+            boundary = None
+            for boundary in SENTENCE_BOUNDARY.finditer(text, start, end + 1):
+                pass
+            if boundary is not None and boundary.start() > start:
+                cut, next_start = boundary.start(), boundary.end()
+            else:
+                cut = text.rfind(" ", start + 1, end + 1)
+                cut = cut if cut != -1 else end
+                next_start = cut
+            yield text[start:cut]
+            start = next_start
+
+        yield text[start:]
+
+    @staticmethod
+    def _count_candidates(doc: "Doc") -> tuple[Counter, Counter]:
+        """
+        Counts noun-based keyword candidates and named entities of a processed text.
 
         Args:
-            text (str): Text from which to extract keywords.
+            doc (Doc): Text processed by the language model.
 
         Returns:
-            list[str]: Collection of extracted keywords.
+            tuple[Counter, Counter]: Occurrences of nouns and named entities.
         """
-        # Loading the language model and using it on input text
-        nlp = spacy.load(self.lm)
-        doc = nlp(text)
-
-        # Extracting noun-based keywords
-        candidates = [
+        nouns = Counter(
             token.text.lower()
             for token in doc
             if token.pos_ in {"NOUN", "PROPN"} and not token.is_stop
-        ]
+        )
+        entities = Counter(ent.text.lower() for ent in doc.ents)
 
-        # Extending the keywords candidates with named entities
-        candidates.extend([ent.text.lower() for ent in doc.ents])
+        return nouns, entities
 
-        # Counting the occurrences
-        word_freq = Counter(candidates)
+    def _select_keywords(self, nouns: Counter, entities: Counter) -> list[str]:
+        """
+        Selects the most frequent nouns and named entities of a text.
+
+        Args:
+            nouns (Counter): Occurrences of noun-based keyword candidates.
+            entities (Counter): Occurrences of named entities.
+
+        Returns:
+            list[str]: Collection of extracted keywords.
+        """
+        # Counting entities after nouns keeps the order of equally frequent candidates
+        word_freq = nouns + entities
         top_keywords = [
             word
             for word, _ in word_freq.most_common(self.most_common_elems)
@@ -78,3 +181,74 @@ class KeywordsExtractor:
         ]
 
         return top_keywords
+
+    def extract(self, text: str) -> list[str]:
+        """
+        Extracts keywords from an input text.
+
+        Args:
+            text (str): Text from which to extract keywords.
+
+        Returns:
+            list[str]: Collection of extracted keywords.
+        """
+        return self.extract_many([text])[0]
+
+    def extract_many(
+        self, texts: Iterable[str], batch_size: int = 32, n_process: int = 1
+    ) -> list[list[str]]:
+        """
+        Extracts keywords from several texts streamed through the language model in batches.
+
+        Texts longer than the chunk length are processed in chunks, and occurrences of candidates are merged across chunks.
+        Texts are scored one by one in the current process by "tfidf" engine.
+
+        Args:
+            texts (Iterable[str]): Texts from which to extract keywords.
+            batch_size (int, optional): Number of texts or chunks processed by the language model at once. Defaults to 32.
+            n_process (int, optional): Number of processes running the language model. Defaults to 1.
+
+        Raises:
+            ValueError: Exception raised if `batch_size` or `n_process` is not positive.
+
+        Returns:
+            list[list[str]]: Collections of extracted keywords in the order of `texts`.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size should be a positive integer.")
+        if n_process < 1:
+            raise ValueError(
+                "Number of processes should be a positive integer."
+            )
+
+        if self.engine == "tfidf":
+            return [
+                extract_tfidf_keywords(
+                    text,
+                    num_keywords=self.most_common_elems,
+                    min_length=self.min_kwrd_length,
+                    index=self.idf_index,
+                )
+                for text in texts
+            ]
+
+        # Streaming chunks of all texts labelled with the index of their text
+        chunks = (
+            (chunk, i)
+            for i, text in enumerate(texts)
+            for chunk in self._iter_chunks(text)
+        )
+        docs = self.nlp.pipe(
+            chunks, as_tuples=True, batch_size=batch_size, n_process=n_process
+        )
+
+        keywords = []
+        for _, text_docs in groupby(docs, key=itemgetter(1)):
+            nouns, entities = Counter(), Counter()
+            for doc, _ in text_docs:
+                doc_nouns, doc_entities = self._count_candidates(doc)
+                nouns.update(doc_nouns)
+                entities.update(doc_entities)
+            keywords.append(self._select_keywords(nouns, entities))
+
+        return keywords
@@ -1,11 +1,70 @@
 """Extraction and processing of PDF-text."""
 
+import hashlib
+import io
+import mmap
+import os
 import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from re import Pattern
+from typing import BinaryIO, Iterator, Optional, Union
 
 import fitz
 
-from ..text_preprocessing import clean_text
+from ..text_preprocessing import TextCleaner
+from ..text_preprocessing.cleaning import CLEANING_FINGERPRINT
+from ..utils.timing import StageTimer
+from .text_cache import TextCache
+
+# Maximum number of pages extracted by a worker process in one task
+PAGES_PER_TASK = 32
+
+# Path to a PDF-file or its content held in memory
+PDFSource = Union[
+    str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap, BinaryIO
+]
+
+
+def _as_buffer(source: PDFSource) -> Optional[Union[bytes, memoryview]]:
+    """
+    Represents PDF-file content held in memory as a buffer accepted by PyMuPDF.
+
+    Buffers are wrapped in memoryview without copying, and only file-like objects
+    other than io.BytesIO are read into memory.
+
+    Args:
+        source (PDFSource): Path to a PDF-file or its content.
+
+    Returns:
+        Optional[Union[bytes, memoryview]]: Buffer with PDF-file content or None for paths.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return None
+    if isinstance(source, (bytes, memoryview)):
+        return source
+    if isinstance(source, (bytearray, mmap.mmap)):
+        return memoryview(source)
+    if isinstance(source, io.BytesIO):
+        return source.getbuffer()
+
+    return source.read()
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> list[str]:
+    """
+    Extracts raw texts of a range of pages in a worker process.
+
+    Args:
+        pdf_path (str): Path to the PDF-file.
+        start (int): Index of the first page.
+        stop (int): Index of the page after the last one.
+
+    Returns:
+        list[str]: Raw texts of pages each followed by a newline.
+    """
+    with fitz.open(pdf_path) as doc:
+        return [doc[i].get_text("text") + "\n" for i in range(start, stop)]
 
 
 class PDFExtractor:
@@ -13,23 +72,55 @@ class PDFExtractor:
     Extractor and processor of relevant PDF-article text.
 
     Attributes:
-        pdf_path (str): Path to the PDF-file.
+        pdf_path (PDFSource): Path to the PDF-file or its content held in memory.
+        name (str): Path to the PDF-file or name of the in-memory source for reports.
         intro_pattern (Pattern[str]): RegEx pattern for searching the beginning of Introduction-like section.
         references_pattern (Pattern[str]): RegEx pattern for searching the beginning of References-like section.
+        text_cache (Optional[TextCache]): Persistent cache of processed texts.
+        num_workers (int): Number of processes extracting page texts.
+        parallel_threshold (int): Minimum number of pages for extracting page texts in worker processes.
+        timer (StageTimer): Timer of "extract", "body-detect" and "clean" stages.
     """
 
-    def __init__(self, pdf_path: str):
+    def __init__(
+        self,
+        pdf_path: PDFSource,
+        text_cache: Optional[TextCache] = None,
+        num_workers: int = 1,
+        parallel_threshold: int = 64,
+        timer: Optional[StageTimer] = None,
+    ):
         """
         Initializes a PDFExtractor instances.
 
         Args:
-            pdf_path (str): Path to the PDF-file.
+            pdf_path (PDFSource): Path to the PDF-file or its content as bytes, memoryview, file-like or memory-mapped object.
+            text_cache (Optional[TextCache], optional): Persistent cache of processed texts. Defaults to None.
+            num_workers (int, optional): Number of processes extracting page texts (in-process extraction if 1). Defaults to 1.
+            parallel_threshold (int, optional): Minimum number of pages for extracting page texts in worker processes. Defaults to 64.
+            timer (Optional[StageTimer], optional): Timer of "extract" (reading pages or cached text), "body-detect" and "clean" stages (new timer if None). Defaults to None.
+
+        Raises:
+            ValueError: Exception raised if `num_workers` is not positive.
 
         Additional Attributes:
             intro_pattern (Pattern[str]): RegEx pattern for searching the beginning of Introduction-like section.
             references_pattern (Pattern[str]): RegEx pattern for searching the beginning of References-like section.
         """
+        if num_workers < 1:
+            raise ValueError("Number of workers should be a positive integer.")
+
         self.pdf_path = pdf_path
+        self._buffer = _as_buffer(pdf_path)
+        self.name = (
+            os.fspath(pdf_path)
+            if self._buffer is None
+            else getattr(pdf_path, "name", "<in-memory PDF>")
+        )
+        self.text_cache = text_cache
+        self.num_workers = num_workers
+        self.parallel_threshold = parallel_threshold
+        self.timer = timer or StageTimer()
         # Pattern for searching Introduction-like section
         self.intro_pattern: Pattern[str] = re.compile(
             r"(?:^|\n)\s*(?:\d+\.?\s*)?(Introduction|Background|Overview|Intro|The Trends)\b.*?\n",
@@ -41,6 +132,90 @@ class PDFExtractor:
             re.IGNORECASE,
         )
 
+    def _iter_page_texts(self) -> Iterator[str]:
+        """
+        Reads the pages of the PDF-file of an article one by one.
+
+        Raises:
+            ValueError: Exception raised if an input file has extension other than PDF.
+
+        Yields:
+            Iterator[str]: Raw text of a page followed by a newline.
+        """
+        # Validating the input file
+        if self._buffer is None and ".pdf" not in self.name:
+            raise ValueError("Input file should have 'pdf' extension.")
+
+        # Retrieving the article text page by page
+        with self.timer.measure("extract"):
+            doc = (
+                fitz.open(self.name)
+                if self._buffer is None
+                else fitz.open(stream=self._buffer, filetype="pdf")
+            )
+        with doc:
+            page_count = doc.page_count
+            # Worker processes open the document by path on their own
+            if (
+                self._buffer is not None
+                or self.num_workers == 1
+                or page_count < self.parallel_threshold
+            ):
+                for page in doc:
+                    with self.timer.measure("extract"):
+                        page_text = page.get_text("text") + "\n"
+                    yield page_text
+                return
+
+        yield from self._iter_page_texts_parallel(page_count)
+
+    def _iter_page_texts_parallel(self, page_count: int) -> Iterator[str]:
+        """
+        Reads the pages of the PDF-file in ranges extracted by worker processes.
+
+        Each worker opens the document independently, and ranges are yielded in the order of pages.
+        Only a few ranges are submitted in advance so that no more pages are read once reading stops.
+
+        Args:
+            page_count (int): Number of pages in the PDF-file.
+
+        Yields:
+            Iterator[str]: Raw text of a page followed by a newline.
+        """
+        pages_per_task = min(
+            PAGES_PER_TASK, -(-page_count // self.num_workers)
+        )
+        page_ranges = iter(
+            (start, min(start + pages_per_task, page_count))
+            for start in range(0, page_count, pages_per_task)
+        )
+
+        with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+            futures: deque[Future[list[str]]] = deque()
+
+            def submit_next() -> None:
+                """Submits extraction of the next page range if any is left."""
+                page_range = next(page_ranges, None)
+                if page_range is not None:
+                    futures.append(
+                        executor.submit(
+                            _extract_page_range, self.name, *page_range
+                        )
+                    )
+
+            for _ in range(2 * self.num_workers):
+                submit_next()
+            try:
+                while futures:
+                    with self.timer.measure("extract"):
+                        page_texts = futures.popleft().result()
+                    submit_next()
+                    yield from page_texts
+            finally:
+                # Cancelling pending ranges if reading stops early
+                for future in futures:
+                    future.cancel()
+
     def _extract_raw_text_from_pdf(self) -> str:
         """
         Extracts the raw text from the PDF-file of an article.
@@ -51,17 +226,91 @@ class PDFExtractor:
         Returns:
             str: Retrieved article text in its raw form.
         """
-        # Validating the input file
-        if ".pdf" not in self.pdf_path:
-            raise ValueError("Input file should have 'pdf' extension.")
+        return "".join(self._iter_page_texts())
 
-        # Retrieving the article text
-        doc = fitz.open(self.pdf_path)
-        text = ""
-        for page in doc:
-            text += page.get_text("text") + "\n"
+    def _stream_body_pages(self) -> list[str]:
+        """
+        Selects the pages between the beginning of Introduction and References section reading pages lazily.
 
-        return text
+        Section headings are searched in a window of the previous and the current page,
+        only pages of the selected text are kept and no more pages are read once References section
+        is found after the Introduction. References-like headings preceding the Introduction
+        (e.g. in a table of contents) are skipped, and documents without Introduction are searched
+        for References as a whole.
+
+        Returns:
+            list[str]: Texts of selected pages cut at the section headings.
+        """
+        pages: list[str] = []  # Pages read since the document or body start
+        pages_start = 0  # Offset of the first kept page in the document
+        page_start = 0  # Offset of the current page in the document
+        start_index: Optional[int] = None
+        end_index: Optional[int] = None
+        previous_page = ""
+        for page_num, page in enumerate(self._iter_page_texts()):
+            with self.timer.measure("body-detect"):
+                # Newline ending the page before the previous one lets headings match at the window start
+                lead = "\n" if page_num >= 2 else ""
+                window = lead + previous_page + page
+                window_start = page_start - len(previous_page) - len(lead)
+                pages.append(page)
+
+                # Searching for the Introduction-like section until it is found
+                if start_index is None:
+                    intro_match = self.intro_pattern.search(window)
+                    if intro_match:
+                        start_index = window_start + intro_match.start()
+                        # Dropping pages preceding the Introduction-like section
+                        while pages_start + len(pages[0]) <= start_index:
+                            pages_start += len(pages.pop(0))
+
+                # Searching for the References-like section after the Introduction and stopping reading pages
+                page_start += len(page)
+                if start_index is not None:
+                    references_match = self.references_pattern.search(
+                        window, max(start_index - window_start, 0)
+                    )
+                    if references_match:
+                        end_index = window_start + references_match.start()
+                        break
+                previous_page = page
+
+        # Searching for the References-like section in the whole document without Introduction
+        if start_index is None:
+            with self.timer.measure("body-detect"):
+                references_match = self.references_pattern.search(
+                    "".join(pages)
+                )
+                if references_match:
+                    end_index = references_match.start()
+
+        # Cutting kept pages at the beginning and end of main content
+        start_index = max(start_index or 0, pages_start) - pages_start
+        end_index = (
+            end_index - pages_start
+            if end_index is not None
+            else sum(len(page) for page in pages)
+        )
+        body_pages: list[str] = []
+        offset = 0
+        for page in pages:
+            if offset >= end_index:
+                break
+            body_pages.append(
+                page[max(start_index - offset, 0) : end_index - offset]
+            )
+            offset += len(page)
+
+        return body_pages
+
+    def _stream_body_text(self) -> str:
+        """
+        Selects the text between the beginning of Introduction and References section reading pages lazily.
+
+        Returns:
+            str: Text selected between Introduction and References.
+        """
+        return "".join(self._stream_body_pages()).strip()
 
     def _extract_body_text(self, text: str) -> str:
         """
@@ -86,18 +335,58 @@ class PDFExtractor:
 
         return main_text
 
+    def _get_version(self) -> str:
+        """
+        Computes a fingerprint of patterns and cleaning code used for retrieving the processed text.
+
+        Returns:
+            str: Hexadecimal SHA-256 digest invalidating cached texts when patterns or cleaning change.
+        """
+        parts = [
+            f"{self.intro_pattern.pattern}|{self.intro_pattern.flags}",
+            f"{self.references_pattern.pattern}|{self.references_pattern.flags}",
+            CLEANING_FINGERPRINT,
+        ]
+
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
     def retrieve_processed_text(self) -> str:
         """
         Retrieves the processed and cleaned text.
 
+        Cached text is returned if a text cache is used and the file has not changed.
+
         Returns:
             str: Processed and cleaned text.
         """
-        # Extracting the raw text from PDF
-        text = self._extract_raw_text_from_pdf()
-        # Extracting the relevant article part
-        text = self._extract_body_text(text)
-        # Cleaning the text
-        text = clean_text(text)
+        if self.text_cache is None:
+            return self._process_text()
+
+        with self.timer.measure("extract"):
+            key = self.text_cache.make_key(
+                self.name if self._buffer is None else self._buffer,
+                self._get_version(),
+            )
+            text = self.text_cache.get(key)
+        if text is None:
+            text = self._process_text()
+            self.text_cache.put(key, text)
 
         return text
+
+    def _process_text(self) -> str:
+        """
+        Extracts, selects and cleans the relevant text of an article.
+
+        Returns:
+            str: Processed and cleaned text.
+        """
+        # Extracting the relevant article part while reading PDF pages
+        body_pages = self._stream_body_pages()
+        # Cleaning the text page by page without joining the raw pages
+        with self.timer.measure("clean"):
+            cleaner = TextCleaner()
+            cleaned_pages = [cleaner.feed(page) for page in body_pages]
+            cleaned_pages.append(cleaner.finish())
+
+        return "".join(cleaned_pages)
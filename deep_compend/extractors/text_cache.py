@@ -0,0 +1,101 @@
+"""Persistent cache of texts extracted from PDF-files."""
+
+import gzip
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Union
+
+
+class TextCache:
+    """Sharded directory of compressed cleaned texts keyed on a PDF-file fingerprint.
+
+    Attributes:
+        cache_dir (Path): Directory where cached texts are stored.
+        hash_content (bool): Flag to fingerprint files by hashing their content instead of path, size and modification time.
+    """
+
+    def __init__(self, cache_dir: str, hash_content: bool = False):
+        """Initializes a TextCache instance.
+
+        Args:
+            cache_dir (str): Directory where cached texts are stored (created if non-existent).
+            hash_content (bool, optional): Flag to fingerprint files by hashing their content instead of path, size and modification time. Defaults to False.
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hash_content = hash_content
+
+    def make_key(
+        self, pdf_path: Union[str, bytes, memoryview], version: str
+    ) -> str:
+        """Computes a cache key for a PDF-file processed by a specific version of extraction.
+
+        Content held in memory is always hashed since it has no path or modification time.
+
+        Args:
+            pdf_path (Union[str, bytes, memoryview]): Path to the PDF-file or its content.
+            version (str): Fingerprint of patterns and rules used for extraction and cleaning.
+
+        Returns:
+            str: Hexadecimal SHA-256 digest.
+        """
+        hasher = hashlib.sha256(version.encode("utf-8"))
+        if not isinstance(pdf_path, str):
+            hasher.update(pdf_path)
+        elif self.hash_content:
+            with open(pdf_path, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    hasher.update(block)
+        else:
+            stat = os.stat(pdf_path)
+            fingerprint = (
+                f"{Path(pdf_path).resolve()}|{stat.st_size}|{stat.st_mtime_ns}"
+            )
+            hasher.update(fingerprint.encode("utf-8"))
+
+        return hasher.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Returns the path of a cached text sharded by the first key characters."""
+        return self.cache_dir / key[:2] / f"{key}.txt.gz"
+
+    def get(self, key: str) -> Optional[str]:
+        """Looks up a cached text.
+
+        Args:
+            key (str): Cache key computed with `make_key`.
+
+        Returns:
+            Optional[str]: Cached text or None if not cached.
+        """
+        try:
+            with gzip.open(self._entry_path(key), "rt", encoding="utf-8") as f:
+                return f.read()
+        except (FileNotFoundError, OSError, EOFError):
+            return None
+
+    def put(self, key: str, text: str) -> None:
+        """Stores a text in the cache.
+
+        Args:
+            key (str): Cache key computed with `make_key`.
+            text (str): Text to be stored.
+        """
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(exist_ok=True)
+        # Writing to a temporary file first so that readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(text.encode("utf-8"), compresslevel=6))
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def clear(self) -> None:
+        """Removes all cached texts."""
+        for entry_path in self.cache_dir.glob("*/*.txt.gz"):
+            entry_path.unlink()
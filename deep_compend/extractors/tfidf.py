@@ -0,0 +1,265 @@
+"""Extraction of keywords by TF-IDF scores without a language model."""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from re import Pattern
+from typing import Iterable, Optional
+
+import numpy as np
+
+# Common English words carrying no topical information
+STOP_WORDS = frozenset(
+    """
+    a about above across after afterwards again against all almost alone along
+    already also although always am among amongst an and another any anyhow
+    anyone anything anyway anywhere are around as at back be became because
+    become becomes becoming been before beforehand behind being below beside
+    besides between beyond both but by can cannot could did do does doing done
+    down due during each either else elsewhere enough etc even ever every
+    everyone everything everywhere except few first for former formerly from
+    further get give given gives had has have having he hence her here
+    hereafter hereby herein hers herself him himself his how however i ie if
+    in indeed into is it its itself just keep last latter latterly least less
+    made make many may me meanwhile might more moreover most mostly much must
+    my myself namely neither never nevertheless next no nobody none nor not
+    nothing now nowhere of off often on once one only onto or other others
+    otherwise our ours ourselves out over own per perhaps please put quite
+    rather really same say see seem seemed seeming seems several she should
+    show since so some somehow someone something sometime sometimes somewhere
+    still such than that the their theirs them themselves then thence there
+    thereafter thereby therefore therein thereupon these they this those
+    though through throughout thru thus to together too toward towards under
+    until up upon us used using various very via was we well were what
+    whatever when whence whenever where whereafter whereas whereby wherein
+    whereupon wherever whether which while whither who whoever whole whom
+    whose why will with within without would yet you your yours yourself
+    yourselves
+    """.split()
+)
+
+
+@lru_cache(maxsize=None)
+def _word_pattern(min_length: int) -> Pattern[str]:
+    """Compiles a pattern matching alphabetic words (of any script) of a minimal length."""
+    return re.compile(rf"[^\W\d_]{{{max(min_length, 1)},}}")
+
+
+def count_words(text: str, min_length: int = 1) -> Counter:
+    """
+    Counts lowercase words of a text excluding stop words.
+
+    Args:
+        text (str): Text to split into words.
+        min_length (int, optional): Minimal length of a word to count. Defaults to 1.
+
+    Returns:
+        Counter: Occurrences of words in the order of their first occurrence.
+    """
+    # Filtering unique words after counting is cheaper than filtering every occurrence
+    counts = Counter(_word_pattern(min_length).findall(text.lower()))
+    for word in STOP_WORDS.intersection(counts):
+        del counts[word]
+
+    return counts
+
+
+class CorpusIndex:
+    """
+    Document frequencies of words across a corpus persisted in a directory.
+
+    Frequencies are stored in a NumPy array which is memory-mapped on loading, while the vocabulary
+    and fingerprints of indexed documents are stored in a JSON file pointing to the current array.
+    Documents are added incrementally and written on `save`.
+
+    Attributes:
+        index_dir (Path): Directory where the index is stored.
+        num_docs (int): Number of indexed documents.
+    """
+
+    META_FILE = "index.json"
+
+    def __init__(self, index_dir: str):
+        """
+        Initializes a CorpusIndex instance loading the index if present.
+
+        Args:
+            index_dir (str): Directory where the index is stored (created if non-existent).
+        """
+        self.index_dir = Path(index_dir).expanduser()
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+
+        meta = {"df_file": None, "vocabulary": [], "documents": []}
+        meta_path = self.index_dir / self.META_FILE
+        if meta_path.exists():
+            with meta_path.open(encoding="utf-8") as f:
+                meta = json.load(f)
+
+        self._df_file: Optional[str] = meta["df_file"]
+        self._vocabulary = {
+            word: i for i, word in enumerate(meta["vocabulary"])
+        }
+        self._documents = set(meta["documents"])
+        self.num_docs = len(self._documents)
+        # Saved frequencies are read lazily from disk
+        self._df = (
+            np.load(self.index_dir / self._df_file, mmap_mode="r")
+            if self._df_file
+            else np.zeros(0, dtype=np.int64)
+        )
+        # Frequencies of documents added since loading (indexed by word ids)
+        self._added = np.zeros(len(self._vocabulary), dtype=np.int64)
+
+    @staticmethod
+    def _fingerprint(text: str) -> str:
+        """Computes a fingerprint of a document to avoid indexing it twice."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def add(self, text: str) -> bool:
+        """
+        Adds a document to the index.
+
+        Args:
+            text (str): Text of the document.
+
+        Returns:
+            bool: False if the document has already been indexed.
+        """
+        fingerprint = self._fingerprint(text)
+        if fingerprint in self._documents:
+            return False
+
+        ids = [
+            self._vocabulary.setdefault(word, len(self._vocabulary))
+            for word in count_words(text)
+        ]
+        # Growing the array of added frequencies for new words
+        if len(self._vocabulary) > len(self._added):
+            added = np.zeros(
+                max(len(self._vocabulary), 2 * len(self._added)),
+                dtype=np.int64,
+            )
+            added[: len(self._added)] = self._added
+            self._added = added
+        self._added[ids] += 1
+        self._documents.add(fingerprint)
+        self.num_docs += 1
+
+        return True
+
+    def add_many(self, texts: Iterable[str]) -> int:
+        """
+        Adds several documents to the index.
+
+        Args:
+            texts (Iterable[str]): Texts of the documents.
+
+        Returns:
+            int: Number of documents that have not been indexed before.
+        """
+        return sum(self.add(text) for text in texts)
+
+    def document_frequencies(self, words: list[str]) -> np.ndarray:
+        """
+        Looks up numbers of indexed documents containing words.
+
+        Args:
+            words (list[str]): Words to look up.
+
+        Returns:
+            np.ndarray: Document frequencies of the words (zero for unknown ones).
+        """
+        ids = np.fromiter(
+            (self._vocabulary.get(word, -1) for word in words),
+            dtype=np.int64,
+            count=len(words),
+        )
+        df = np.zeros(len(words), dtype=np.int64)
+        known = ids >= 0
+        df[known] = self._added[ids[known]]
+        saved = known & (ids < len(self._df))
+        df[saved] += self._df[ids[saved]]
+
+        return df
+
+    def idf(self, words: list[str]) -> np.ndarray:
+        """
+        Computes smoothed inverse document frequencies of words.
+
+        Args:
+            words (list[str]): Words to compute IDF for.
+
+        Returns:
+            np.ndarray: IDF of the words (the highest for words absent from the index).
+        """
+        df = self.document_frequencies(words)
+
+        return np.log((1 + self.num_docs) / (1 + df)) + 1
+
+    def save(self) -> None:
+        """Writes documents added since loading to the index directory."""
+        vocabulary = list(self._vocabulary)
+        df = self._added[: len(vocabulary)].copy()
+        df[: len(self._df)] += self._df
+        # Releasing the memory-mapped array before replacing its file
+        self._df = df
+        self._added = np.zeros(len(vocabulary), dtype=np.int64)
+
+        # Writing a new array before the metadata pointing to it so that readers never see partial indexes
+        fd, df_path = tempfile.mkstemp(
+            dir=self.index_dir, prefix="df-", suffix=".npy"
+        )
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, df)
+        fd, meta_path = tempfile.mkstemp(dir=self.index_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "df_file": Path(df_path).name,
+                    "vocabulary": vocabulary,
+                    "documents": sorted(self._documents),
+                },
+                f,
+            )
+        os.replace(meta_path, self.index_dir / self.META_FILE)
+
+        # Removing the previous array
+        if self._df_file is not None:
+            (self.index_dir / self._df_file).unlink(missing_ok=True)
+        self._df_file = Path(df_path).name
+        self._df = np.load(df_path, mmap_mode="r")
+
+
+def extract_tfidf_keywords(
+    text: str,
+    num_keywords: int = 20,
+    min_length: int = 3,
+    index: Optional[CorpusIndex] = None,
+) -> list[str]:
+    """
+    Extracts words of a text with the highest TF-IDF scores.
+
+    Args:
+        text (str): Text from which to extract keywords.
+        num_keywords (int, optional): Maximum number of keywords to extract. Defaults to 20.
+        min_length (int, optional): Minimal length of keyword to include. Defaults to 3.
+        index (Optional[CorpusIndex], optional): Index of document frequencies (words are ranked by frequency in the text if None). Defaults to None.
+
+    Returns:
+        list[str]: Collection of extracted keywords.
+    """
+    counts = count_words(text, min_length=min_length)
+    words = list(counts)
+    scores = np.fromiter(counts.values(), dtype=np.float64, count=len(words))
+    if index is not None:
+        scores *= index.idf(words)
+
+    # Sorting stably so that equally scored words keep the order of occurrence
+    top = np.argsort(-scores, kind="stable")[:num_keywords]
+
+    return [words[i] for i in top]
@@ -1,4 +1,5 @@
 # ruff: noqa: F401
 
-from .cleaning import clean_text
+from .chunking import pack_sentences
+from .cleaning import TextCleaner, clean_text
 from .prettify import prettify_summary
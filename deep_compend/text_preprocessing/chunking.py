@@ -0,0 +1,30 @@
+def pack_sentences(
+    sentences: list[str], lengths: list[int], max_length: int
+) -> list[str]:
+    """
+    Packs consecutive sentences into chunks of bounded length.
+
+    Sentences are never split, so a single sentence longer than `max_length` forms a chunk of its own.
+
+    Args:
+        sentences (list[str]): Sentences of a text.
+        lengths (list[int]): Length of each sentence (e.g. number of tokens or characters).
+        max_length (int): Maximum total length of sentences in a chunk.
+
+    Returns:
+        list[str]: Chunks of the text with sentences joined by spaces.
+    """
+    chunks = []
+    chunk: list[str] = []
+    chunk_length = 0
+    for sentence, length in zip(sentences, lengths):
+        # Starting a new chunk if the sentence does not fit into the current one
+        if chunk and chunk_length + length > max_length:
+            chunks.append(" ".join(chunk))
+            chunk, chunk_length = [], 0
+        chunk.append(sentence)
+        chunk_length += length
+    if chunk:
+        chunks.append(" ".join(chunk))
+
+    return chunks
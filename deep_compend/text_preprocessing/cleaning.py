@@ -1,4 +1,54 @@
 import re
+from re import Pattern
+
+# Version of the cleaning code, to be bumped on any change of its behaviour
+CLEANING_VERSION = 1
+
+# Citation substitutions applied one after another before normalizing whitespace
+CLEANING_RULES: list[tuple[str, str]] = [
+    # Removing numeric citations: e.g. [4], [3,5,8]
+    (r"\[\d+(?:,\s*\d+)*\]", ""),
+    # Removing author-year citations: e.g (Doe et al., 2020)
+    (r"\(\s*[A-Z][a-z]+(?:\s+et al\.)?,\s*\d{4}\s*\)", ""),
+]
+
+# Citation rules are kept as separate passes since removing a numeric citation
+# can complete an author-year one: e.g. (Doe[1], 2020)
+_NUMERIC_CITATION = re.compile(CLEANING_RULES[0][0])
+_AUTHOR_YEAR_CITATION = re.compile(CLEANING_RULES[1][0])
+# Whitespace is normalized by collapsing whitespace runs and then removing
+# single spaces before punctuation
+_SPACE_BEFORE_PUNCTUATION = re.compile(r" ([.,!?])")
+
+# Fingerprint of the cleaning behaviour invalidating texts cleaned by other versions
+CLEANING_FINGERPRINT = "\n".join(
+    [
+        f"version {CLEANING_VERSION}",
+        *(f"{pattern}|{repl}" for pattern, repl in CLEANING_RULES),
+        _SPACE_BEFORE_PUNCTUATION.pattern,
+    ]
+)
+
+# Unfinished citations at the end of a chunk that may be completed by the next one
+_NUMERIC_CITATION_PREFIX = re.compile(r"\[[\d,\s]*")
+_AUTHOR_YEAR_CITATION_PREFIX = re.compile(
+    r"\(\s*(?:[A-Z](?:[a-z]+(?:\s+(?:e|et|et |et a|et al|et al\.)?)?"
+    r"|[a-z]+(?:\s+et al\.)?,\s*(?:\d{0,3}|\d{4}\s*))?)?"
+)
+_PUNCTUATION = ".,!?"
+
+
+def _normalize_whitespace(text: str) -> str:
+    """
+    Collapses whitespace runs, removes spaces before punctuation and strips a text.
+
+    Args:
+        text (str): Text with citations removed.
+
+    Returns:
+        str: Text with normalized whitespace.
+    """
+    return _SPACE_BEFORE_PUNCTUATION.sub(r"\1", " ".join(text.split()))
 
 
 def clean_text(text: str) -> str:
@@ -11,15 +61,111 @@ def clean_text(text: str) -> str:
     Returns:
         str: Cleaned text.
     """
-    # Removing numeric citations: e.g. [4], [3,5,8]
-    text = re.sub(r"\[\d+(?:,\s*\d+)*\]", "", text)
-    # Removing author-year citations: e.g (Doe et al., 2020)
-    text = re.sub(r"\(\s*[A-Z][a-z]+(?:\s+et al\.)?,\s*\d{4}\s*\)", "", text)
-    # Removing extra spaces left after cleanup
-    text = re.sub(r"\s{2,}", " ", text)
-    # Removing non-word characters
-    text = re.sub(r"\s+", " ", text)
-    # Removing spaces left before punctuation
-    text = re.sub(r"\s+([.,!?])", r"\1", text).strip()
-
-    return text
+    # Skipping citation passes for texts without brackets
+    if "[" in text:
+        text = _NUMERIC_CITATION.sub("", text)
+    if "(" in text:
+        text = _AUTHOR_YEAR_CITATION.sub("", text)
+
+    return _normalize_whitespace(text)
+
+
+def _split_unfinished(text: str, opening: str, prefix: Pattern[str]) -> int:
+    """
+    Finds where a citation that may continue in the next chunk starts.
+
+    Only the last opening bracket needs checking since unfinished citations contain no other brackets.
+
+    Args:
+        text (str): Text of the pending chunks.
+        opening (str): Opening bracket of the citation.
+        prefix (Pattern[str]): Pattern matching beginnings of the citation.
+
+    Returns:
+        int: Index of the unfinished citation or the text length.
+    """
+    index = text.rfind(opening)
+    if index != -1 and prefix.fullmatch(text, index):
+        return index
+
+    return len(text)
+
+
+class TextCleaner:
+    """
+    Incremental cleaner of a text arriving in chunks (e.g. pages of an article).
+
+    Joined outputs of `feed` and `finish` are identical to `clean_text` applied to the joined chunks,
+    since citations and whitespace runs that may continue in the next chunk are held back.
+    """
+
+    def __init__(self):
+        """Initializes a TextCleaner instance."""
+        self._raw = ""  # Text not yet checked for numeric citations
+        self._cited = ""  # Text not yet checked for author-year citations
+        self._spaced = ""  # Trailing whitespace not yet normalized
+        self._emitted = False
+
+    def feed(self, chunk: str) -> str:
+        """
+        Cleans the next chunk of a text.
+
+        Args:
+            chunk (str): Next chunk of a raw text.
+
+        Returns:
+            str: Cleaned text that can be emitted so far.
+        """
+        self._raw += chunk
+        end = _split_unfinished(self._raw, "[", _NUMERIC_CITATION_PREFIX)
+        text, self._raw = self._raw[:end], self._raw[end:]
+
+        self._cited += _NUMERIC_CITATION.sub("", text)
+        end = _split_unfinished(self._cited, "(", _AUTHOR_YEAR_CITATION_PREFIX)
+        text, self._cited = self._cited[:end], self._cited[end:]
+
+        return self._emit(_AUTHOR_YEAR_CITATION.sub("", text))
+
+    def finish(self) -> str:
+        """
+        Cleans the remaining text and resets the cleaner.
+
+        Returns:
+            str: Remaining cleaned text.
+        """
+        text = _AUTHOR_YEAR_CITATION.sub(
+            "", self._cited + _NUMERIC_CITATION.sub("", self._raw)
+        )
+        cleaned = self._emit(text)
+        self.__init__()
+
+        return cleaned
+
+    def _emit(self, text: str) -> str:
+        """
+        Normalizes whitespace of a text with citations removed.
+
+        Args:
+            text (str): Next part of a text with citations removed.
+
+        Returns:
+            str: Normalized text joined to the previously emitted one.
+        """
+        text = self._spaced + text
+        # Holding back the trailing whitespace that may precede punctuation
+        end = len(text.rstrip())
+        text, self._spaced = text[:end], text[end:]
+        if not text:
+            return ""
+
+        cleaned = _normalize_whitespace(text)
+        separator = ""
+        if (
+            self._emitted
+            and text[0].isspace()
+            and cleaned[0] not in _PUNCTUATION
+        ):
+            separator = " "
+        self._emitted = True
+
+        return separator + cleaned
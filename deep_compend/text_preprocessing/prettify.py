@@ -1,13 +1,7 @@
 import re
 
-import nltk
-
 from ..utils.downloads import ensure_nltk_resource
 
-# Checking the presence of auxiliary NLTK packages
-ensure_nltk_resource(resource_id="tokenizers/punkt")
-ensure_nltk_resource(resource_id="tokenizers/punkt_tab")
-
 
 def prettify_summary(summary: str) -> str:
     """
@@ -19,6 +13,12 @@ def prettify_summary(summary: str) -> str:
     Returns:
         str: Prettified text.
     """
+    # Importing NLTK and checking the presence of its auxiliary packages on first use
+    import nltk
+
+    ensure_nltk_resource(resource_id="tokenizers/punkt")
+    ensure_nltk_resource(resource_id="tokenizers/punkt_tab")
+
     # Splitting input into sentences and capitalizing each one
     sentences = nltk.tokenize.sent_tokenize(summary)
     prettified_summary = " ".join(s.capitalize() for s in sentences)
@@ -1,5 +1,8 @@
 """File downloading module."""
 
+# NLTK resources found in the current process
+_found_nltk_resources: set[str] = set()
+
 
 def download_arxiv_paper(
     arxiv_id: str, save_path: str, chunk_size: int = 8192
@@ -40,12 +43,18 @@ def download_arxiv_paper(
 def ensure_nltk_resource(resource_id: str) -> None:
     """Looks for NLTK resource and downloads it if not present.
 
+    Resources that have been found once are not looked for again.
+
     Args:
         resource_id (str): Name of NLTK resource.
     """
+    if resource_id in _found_nltk_resources:
+        return
+
     import nltk
 
     try:
         nltk.data.find(resource_id)
+        _found_nltk_resources.add(resource_id)
     except LookupError:
         nltk.download(resource_id.split("/")[1], quiet=True)
@@ -0,0 +1,218 @@
+"""Profiling of Python code and model generation."""
+
+import cProfile
+import functools
+import pstats
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, TypeVar
+
+if TYPE_CHECKING:
+    import torch
+
+T = TypeVar("T")
+
+
+class Profiler:
+    """Collects a cProfile dump of Python code and optional PyTorch traces of `generate` calls.
+
+    cProfile only profiles the thread that enables it, so functions run by other threads
+    are profiled when wrapped with `wrap` and their profiles are merged into the dump.
+    Stages run by other processes cannot be profiled and are listed in the summary
+    once recorded with `skip`.
+
+    Attributes:
+        output_dir (Path): Directory where profiling results are saved.
+        name (str): Prefix of the names of saved files.
+        top_n (int): Number of hotspots listed in the summary.
+        trace_generation (bool): Flag to record PyTorch traces of `generate` calls.
+        saved_files (list[Path]): Paths to saved profiling results.
+        skipped_stages (list[str]): Stages run by other processes, which are not profiled.
+    """
+
+    def __init__(
+        self,
+        output_dir: str = ".",
+        name: str = "profile",
+        top_n: int = 20,
+        trace_generation: bool = False,
+    ):
+        """Initializes a Profiler instance.
+
+        Args:
+            output_dir (str, optional): Directory where profiling results are saved (created if non-existent). Defaults to ".".
+            name (str, optional): Prefix of the names of saved files. Defaults to "profile".
+            top_n (int, optional): Number of hotspots listed in the summary. Defaults to 20.
+            trace_generation (bool, optional): Flag to record PyTorch traces of `generate` calls. Defaults to False.
+        """
+        self.output_dir = Path(output_dir)
+        self.name = name
+        self.top_n = top_n
+        self.trace_generation = trace_generation
+        self.saved_files: list[Path] = []
+        self.skipped_stages: list[str] = []
+        self._stats = None
+        self._profile: Optional[cProfile.Profile] = None
+        # Profile enabled in the current thread (if any)
+        self._local = threading.local()
+        self._thread_profiles: list[cProfile.Profile] = []
+        self._thread_profiles_lock = threading.Lock()
+        # Self CPU time of PyTorch operators in microseconds summed over traced calls
+        self._operator_times: dict[str, float] = defaultdict(float)
+        self._num_traces = 0
+        self._trace_lock = threading.Lock()
+
+    @contextmanager
+    def profile(self) -> Iterator[None]:
+        """Profiles Python code of the enclosed block and saves a pstats dump."""
+        profile = cProfile.Profile()
+        self._profile = self._local.profile = profile
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._profile = self._local.profile = None
+            # Merging profiles of functions run by other threads
+            stats = pstats.Stats(profile)
+            with self._thread_profiles_lock:
+                if self._thread_profiles:
+                    stats.add(*self._thread_profiles)
+                self._thread_profiles = []
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            path = self.output_dir / f"{self.name}.prof"
+            stats.dump_stats(str(path))
+            self.saved_files.append(path)
+            self._stats = stats
+
+    def wrap(self, function: Callable[..., T]) -> Callable[..., T]:
+        """Wraps a function to be profiled in the thread running it while Python code is profiled.
+
+        Args:
+            function (Callable[..., T]): Function submitted to another thread.
+
+        Returns:
+            Callable[..., T]: Function profiling its calls, merged into the dump of `profile`.
+        """
+
+        @functools.wraps(function)
+        def profiled(*args, **kwargs) -> T:
+            # Leaving calls made outside of profiling or from an already profiled thread as is
+            if (
+                self._profile is None
+                or getattr(self._local, "profile", None) is not None
+            ):
+                return function(*args, **kwargs)
+
+            profile = cProfile.Profile()
+            self._local.profile = profile
+            profile.enable()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                profile.disable()
+                self._local.profile = None
+                with self._thread_profiles_lock:
+                    self._thread_profiles.append(profile)
+
+        return profiled
+
+    def skip(self, stage: str) -> None:
+        """Records a stage run by other processes, which is not covered by the Python profile.
+
+        Args:
+            stage (str): Description of the stage listed in the summary.
+        """
+        if stage not in self.skipped_stages:
+            self.skipped_stages.append(stage)
+
+    @contextmanager
+    def generation(self) -> Iterator[None]:
+        """Records a PyTorch trace of the enclosed `generate` call if enabled.
+
+        Calls running concurrently with a traced one are not traced. Processing of the trace
+        is excluded from the Python profile.
+        """
+        if not self.trace_generation or not self._trace_lock.acquire(
+            blocking=False
+        ):
+            yield
+            return
+
+        from torch.cuda import is_available
+        from torch.profiler import ProfilerActivity, profile
+
+        activities = [ProfilerActivity.CPU]
+        if is_available():
+            activities.append(ProfilerActivity.CUDA)
+        prof = profile(activities=activities)
+        prof.start()
+        try:
+            yield
+        finally:
+            # Pausing the Python profile of the current thread
+            paused = getattr(self._local, "profile", None)
+            if paused is not None:
+                paused.disable()
+            try:
+                prof.stop()
+                self._save_trace(prof)
+            finally:
+                if paused is not None:
+                    paused.enable()
+                self._trace_lock.release()
+
+    def _save_trace(self, prof: "torch.profiler.profile") -> None:
+        """Saves a PyTorch trace in Chrome trace format and sums up self time of its operators.
+
+        Args:
+            prof (torch.profiler.profile): Finished PyTorch profiler.
+        """
+        self._num_traces += 1
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = (
+            self.output_dir / f"{self.name}-generate-{self._num_traces}.json"
+        )
+        prof.export_chrome_trace(str(path))
+        self.saved_files.append(path)
+        for event in prof.key_averages():
+            self._operator_times[event.key] += event.self_cpu_time_total
+
+    def summary(self) -> str:
+        """Lists saved files and the functions and PyTorch operators with the highest self time.
+
+        Returns:
+            str: Multiline summary of profiling results.
+        """
+        lines = [
+            f"Profiling results saved to: {', '.join(map(str, self.saved_files))}"
+        ]
+        if self._stats is not None:
+            lines.append(f"Top {self.top_n} functions by self time:")
+            # Entries are (primitive calls, calls, self time, cumulative time, callers)
+            entries = sorted(
+                self._stats.stats.items(), key=lambda item: -item[1][2]
+            )
+            for (filename, line, function), stat in entries[: self.top_n]:
+                lines.append(
+                    f"  {stat[2]:.3f} s self, {stat[3]:.3f} s cumulative, "
+                    f"{stat[1]} calls: {function} ({filename}:{line})"
+                )
+        if self._operator_times:
+            lines.append(
+                f"Top {self.top_n} PyTorch operators by self CPU time:"
+            )
+            operators = sorted(
+                self._operator_times.items(), key=lambda item: -item[1]
+            )
+            for operator, self_time in operators[: self.top_n]:
+                lines.append(f"  {self_time / 1000:.1f} ms: {operator}")
+        if self.skipped_stages:
+            lines.append(
+                "Not profiled (run by other processes): "
+                + ", ".join(self.skipped_stages)
+            )
+
+        return "\n".join(lines)
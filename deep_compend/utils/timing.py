@@ -0,0 +1,75 @@
+"""Measurement of time spent in stages of processing."""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+
+@dataclass
+class StageTiming:
+    """Time spent in a stage of processing.
+
+    Attributes:
+        wall_time (float): Elapsed wall-clock time in seconds.
+        cpu_time (float): CPU time of the process in seconds (shared by stages running concurrently).
+        calls (int): Number of measured blocks of code (e.g. pages for extraction stages).
+    """
+
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    calls: int = 0
+
+
+# Function receiving timings of stages once an operation is finished
+TimingCallback = Callable[[dict[str, StageTiming]], None]
+
+
+class StageTimer:
+    """Thread-safe accumulator of time spent in named stages.
+
+    Attributes:
+        timings (dict[str, StageTiming]): Time spent in each stage in the order of first measurement.
+    """
+
+    def __init__(self):
+        """Initializes a StageTimer instance."""
+        self.timings: dict[str, StageTiming] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Measures the time spent in the enclosed block of code.
+
+        Time of repeated stages is summed up.
+
+        Args:
+            stage (str): Name of the stage.
+        """
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.process_time() - cpu_start
+            with self._lock:
+                timing = self.timings.setdefault(stage, StageTiming())
+                timing.wall_time += wall_time
+                timing.cpu_time += cpu_time
+                timing.calls += 1
+
+
+def format_timings(timings: dict[str, StageTiming]) -> str:
+    """Formats wall-clock timings of stages in a single line.
+
+    Args:
+        timings (dict[str, StageTiming]): Time spent in each stage.
+
+    Returns:
+        str: Comma-separated stages with their timings in seconds.
+    """
+    return ", ".join(
+        f"{stage}: {timing.wall_time:.3f} s"
+        for stage, timing in timings.items()
+    )
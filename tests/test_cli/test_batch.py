@@ -0,0 +1,200 @@
+import json
+import shutil
+from dataclasses import asdict
+
+import pytest
+
+from deep_compend.cli.batch import collect_batch_jobs, load_manifest
+from deep_compend.cli.subcommands import run_batch_summarization
+from deep_compend.core import worker_pool
+from deep_compend.core.summarizer import ArticleSummarizer
+
+
+def test_collect_batch_jobs(tmp_path):
+    """Tests collecting jobs from directories, glob patterns, manifests and paths."""
+    (tmp_path / "sub").mkdir()
+    for name in ["b.pdf", "a.pdf", "notes.txt", "sub/c.pdf"]:
+        (tmp_path / name).touch()
+    manifest = tmp_path / "jobs.jsonl"
+    manifest.write_text(
+        '{"pdf": "a.pdf", "report_name": "a.txt", "overrides": {"num_beams": 2}}\n'
+        "\n"
+        '{"pdf": "/data/d.pdf"}\n'
+    )
+
+    jobs = collect_batch_jobs(
+        [
+            str(tmp_path),
+            str(tmp_path / "**" / "c*.pdf"),
+            str(manifest),
+            "e.pdf",
+        ]
+    )
+    assert [job.pdf_path for job in jobs] == [
+        str(tmp_path / "a.pdf"),
+        str(tmp_path / "b.pdf"),
+        str(tmp_path / "sub" / "c.pdf"),
+        str(tmp_path / "a.pdf"),
+        "/data/d.pdf",
+        "e.pdf",
+    ]
+    assert jobs[3].report_name == "a.txt"
+    assert jobs[3].overrides == {"num_beams": 2}
+    assert jobs[4].report_name is None
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "{not json",
+        '{"report_name": "a.txt"}',
+        '{"pdf": "a.pdf", "overrides": 3}',
+        '{"pdf": "a.pdf", "overrides": {"model_path": "facebook/bart-large-cnn"}}',
+    ],
+)
+def test_load_invalid_manifest(tmp_path, line):
+    """Tests loading a manifest with an invalid job."""
+    manifest = tmp_path / "jobs.jsonl"
+    manifest.write_text('{"pdf": "a.pdf"}\n' + line + "\n")
+    with pytest.raises(ValueError, match="Line 2 of manifest"):
+        load_manifest(str(manifest))
+
+
+def test_collect_no_batch_jobs(tmp_path):
+    """Tests collecting jobs from an empty directory."""
+    with pytest.raises(ValueError, match="No articles"):
+        collect_batch_jobs([str(tmp_path)])
+
+
+def test_duplicate_report_names(default_config, tmp_path):
+    """Tests that articles with the same name in different folders are not reported to the same file."""
+    for folder in ["a", "b"]:
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "article.pdf").touch()
+    default_config.save_folder = str(tmp_path / "reports")
+
+    with pytest.raises(ValueError, match="would both be saved to"):
+        run_batch_summarization(
+            inputs=[str(tmp_path / "**" / "*.pdf")],
+            config=asdict(default_config),
+            generate_report=True,
+        )
+
+
+def test_run_batch_summarization(default_config, test_pdf_path, tmp_path):
+    """Tests summarizing a directory and a manifest with per-article overrides and reports."""
+    articles = tmp_path / "articles"
+    articles.mkdir()
+    for name in ["first.pdf", "second.pdf"]:
+        shutil.copy(test_pdf_path, articles / name)
+    (articles / "broken.pdf").write_text("not a PDF-file")
+    manifest = tmp_path / "jobs.jsonl"
+    manifest.write_text(
+        json.dumps(
+            {
+                "pdf": "articles/first.pdf",
+                "report_name": "short.txt",
+                "overrides": {"max_output_tokens": 20, "min_output_tokens": 5},
+            }
+        )
+        + "\n"
+    )
+    default_config.save_folder = str(tmp_path / "reports")
+    config = {
+        **asdict(default_config),
+        "no_cache": True,
+        "batch_size": 2,
+        "prepare_workers": 1,
+        "keyword_engine": "tfidf",
+    }
+
+    stats = run_batch_summarization(
+        inputs=[str(articles), str(manifest)],
+        config=config,
+        generate_report=True,
+    )
+    assert stats.articles == 3
+    assert stats.failed == 1
+    assert stats.output_tokens > 0
+    assert sorted(p.name for p in (tmp_path / "reports").iterdir()) == [
+        "first.txt",
+        "second.txt",
+        "short.txt",
+    ]
+
+
+def test_resume_batch_summarization(
+    default_config, test_pdf_path, tmp_path, capsys
+):
+    """Tests that a rerun with a journal skips finished articles and retries failed ones."""
+    articles = tmp_path / "articles"
+    articles.mkdir()
+    shutil.copy(test_pdf_path, articles / "article.pdf")
+    (articles / "broken.pdf").write_text("not a PDF-file")
+    config = {
+        **asdict(default_config),
+        "no_cache": True,
+        "prepare_workers": 1,
+        "journal": str(tmp_path / "journal.jsonl"),
+        "max_attempts": 2,
+    }
+
+    stats = run_batch_summarization(inputs=[str(articles)], config=config)
+    assert (stats.articles, stats.failed, stats.skipped) == (1, 1, 0)
+    # Keeping only summaries in the standard output
+    output = capsys.readouterr()
+    [line] = output.out.splitlines()
+    assert line.startswith(f"{articles / 'article.pdf'}: ")
+    assert "Batch throughput" in output.err
+    # Retrying the failed article
+    stats = run_batch_summarization(inputs=[str(articles)], config=config)
+    assert (stats.articles, stats.failed, stats.skipped) == (0, 1, 1)
+    # Giving up on the article failed `max_attempts` times
+    stats = run_batch_summarization(inputs=[str(articles)], config=config)
+    assert (stats.articles, stats.failed, stats.skipped) == (0, 1, 1)
+    # Summarizing the article again with different parameters
+    config["num_beams"] = 2
+    stats = run_batch_summarization(inputs=[str(articles)], config=config)
+    assert (stats.articles, stats.failed, stats.skipped) == (1, 1, 0)
+
+
+def test_run_batch_summarization_with_workers(
+    default_config, test_pdf_path, tmp_path, monkeypatch
+):
+    """Tests summarizing articles with several worker processes writing reports."""
+    articles = tmp_path / "articles"
+    articles.mkdir()
+    for name in ["first.pdf", "second.pdf", "third.pdf"]:
+        shutil.copy(test_pdf_path, articles / name)
+    (articles / "broken.pdf").write_text("not a PDF-file")
+    default_config.save_folder = str(tmp_path / "reports")
+    config = {
+        **asdict(default_config),
+        "no_cache": True,
+        "batch_size": 2,
+        "num_workers": 2,
+        "threads_per_worker": 1,
+        "keyword_engine": "tfidf",
+    }
+    # Pinning both workers to the first core to run on machines with a single core
+    monkeypatch.setattr(worker_pool, "available_cores", lambda: [0, 0])
+
+    # Loading the model only in the workers, which are spawned without this patch
+    def load_in_parent(*args, **kwargs):
+        raise AssertionError("Model should not be loaded by the parent.")
+
+    monkeypatch.setattr(ArticleSummarizer, "__init__", load_in_parent)
+
+    stats = run_batch_summarization(
+        inputs=[str(articles)], config=config, generate_report=True
+    )
+    assert (stats.articles, stats.failed) == (3, 1)
+    assert stats.output_tokens > 0
+    assert sorted(p.name for p in (tmp_path / "reports").iterdir()) == [
+        "first.txt",
+        "second.txt",
+        "third.txt",
+    ]
+    report = (tmp_path / "reports" / "first.txt").read_text()
+    assert f"Model: {default_config.model_path}" in report
+    assert "Context window: None" not in report
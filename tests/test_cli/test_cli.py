@@ -1,4 +1,5 @@
 import os
+import subprocess
 import sys
 
 import pytest
@@ -13,6 +14,8 @@ from deep_compend.cli.cli import main
         (["deep-compend", "extract-text", "--help"], "usage"),
         (["deep-compend", "extract-keywords", "--help"], "usage"),
         (["deep-compend", "summarize", "--help"], "usage"),
+        (["deep-compend", "summarize-batch", "--help"], "usage"),
+        (["deep-compend", "serve", "--help"], "usage"),
     ],
 )
 def test_main_cli_help_message(
@@ -51,11 +54,27 @@ def test_main_cli_extract_text(monkeypatch, capsys, test_pdf_path, cli_args):
     assert "Extracted text" in captured.out
 
 
+def test_main_cli_profile(monkeypatch, capsys, test_pdf_path, tmp_path):
+    """Tests profiling a subcommand of the CLI."""
+    cli_args = ["deep-compend", "extract-text", str(test_pdf_path)]
+    cli_args += ["--no-cache", "--profile", "--profile-dir", str(tmp_path)]
+    monkeypatch.setattr(sys, "argv", cli_args + ["--profile-top", "3"])
+
+    exit_code = main()
+    captured = capsys.readouterr()
+
+    assert exit_code == 0
+    assert (tmp_path / "extract-text.prof").exists()
+    assert "Top 3 functions by self time" in captured.err
+    assert "Top 3 functions" not in captured.out
+
+
 @pytest.mark.parametrize(
     "cli_args",
     [
         ["deep-compend", "extract-keywords", "--max-keywords-num", "5"],
         ["deep-compend", "extract-keywords", "--min-keywords-length", "5"],
+        ["deep-compend", "extract-keywords", "--keyword-engine", "tfidf"],
     ],
 )
 def test_main_cli_extract_keywords(
@@ -164,3 +183,33 @@ def test_main_cli_summarize_report(
     assert "Summary saved to" in captured.out
     assert generated_report_path.exists()
     assert os.path.getsize(generated_report_path) > 0
+
+
+def test_cli_import_is_lazy():
+    """Tests that importing the CLI does not load heavy dependencies."""
+    # Importing in a fresh interpreter to avoid modules loaded by other tests
+    code = (
+        "import sys; import deep_compend.cli.cli; "
+        "print('loaded:', *(m for m in ('torch', 'transformers', 'peft', 'nltk', 'spacy') "
+        "if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    # Checking that no heavy module was loaded (libraries may print warnings)
+    assert output.splitlines()[-1].strip() == "loaded:"
+
+
+def test_lazy_package_attributes():
+    """Tests that lazily imported attributes of the package are resolved."""
+    import deep_compend
+    from deep_compend.core.summarizer import ArticleSummarizer
+
+    assert deep_compend.ArticleSummarizer is ArticleSummarizer
+    assert "ArticleSummarizer" in dir(deep_compend)
+    with pytest.raises(AttributeError):
+        deep_compend.MissingAttribute
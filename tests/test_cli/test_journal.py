@@ -0,0 +1,60 @@
+import os
+
+from deep_compend.cli.journal import BatchJournal
+
+
+def test_journal_key(tmp_path):
+    """Tests that keys depend on the PDF-file and parameters affecting the output."""
+    pdf_path = tmp_path / "article.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    config = {"num_beams": 4, "batch_size": 8, "profile": False}
+
+    key = BatchJournal.make_key(str(pdf_path), config)
+    # Parameters affecting only the execution of the run
+    assert key == BatchJournal.make_key(
+        str(pdf_path), {**config, "batch_size": 2, "profile": True}
+    )
+    # Parameters affecting the summary
+    assert key != BatchJournal.make_key(
+        str(pdf_path), {**config, "num_beams": 2}
+    )
+    # Modified article
+    os.utime(pdf_path, ns=(0, 0))
+    assert key != BatchJournal.make_key(str(pdf_path), config)
+
+
+def test_journal_resume(tmp_path):
+    """Tests that a reopened journal restores finished and failed jobs."""
+    journal_path = tmp_path / "journal.jsonl"
+    with BatchJournal(str(journal_path)) as journal:
+        journal.record_failure("a", "a.pdf", ValueError("broken"))
+        journal.record_failure("b", "b.pdf", ValueError("broken"))
+        journal.record_done("b", "b.pdf")
+        journal.record_failure("c", "c.pdf", ValueError("broken"))
+        journal.record_failure("c", "c.pdf", ValueError("still broken"))
+
+    with BatchJournal(str(journal_path)) as journal:
+        assert not journal.is_done("a")
+        assert journal.attempts("a") == 1
+        assert journal.is_done("b")
+        assert journal.attempts("c") == 2
+        assert journal.entries["c"].error == "ValueError: still broken"
+        assert not journal.is_done("d")
+        assert journal.attempts("d") == 0
+
+
+def test_journal_truncated_line(tmp_path):
+    """Tests reopening a journal whose last line was interrupted."""
+    journal_path = tmp_path / "journal.jsonl"
+    with BatchJournal(str(journal_path)) as journal:
+        journal.record_done("a", "a.pdf")
+    with journal_path.open("a") as f:
+        f.write('{"key": "b", "pdf_pa')
+
+    with BatchJournal(str(journal_path)) as journal:
+        assert journal.is_done("a")
+        assert not journal.is_done("b")
+        journal.record_done("c", "c.pdf")
+
+    with BatchJournal(str(journal_path)) as journal:
+        assert journal.is_done("c")
@@ -0,0 +1,118 @@
+import threading
+
+import pytest
+
+from deep_compend.cli.client import SummarizationClient, parse_server_address
+from deep_compend.cli.server import SummarizationService, make_server
+from deep_compend.core.summarizer import ArticleSummarizer
+
+GENERATION_CONFIG = {"min_length": 5, "max_length": 20, "num_beams": 2}
+
+
+@pytest.mark.parametrize(
+    "address,expected",
+    [
+        ("127.0.0.1:8765", ("tcp", ("127.0.0.1", 8765))),
+        ("http://localhost:80/", ("tcp", ("localhost", 80))),
+        ("unix:/tmp/server.sock", ("unix", "/tmp/server.sock")),
+        ("unix:///tmp/server.sock", ("unix", "/tmp/server.sock")),
+    ],
+)
+def test_parse_server_address(address, expected):
+    """Tests parsing of server addresses."""
+    assert parse_server_address(address) == expected
+
+
+@pytest.mark.parametrize("address", ["localhost", "host:port", "unix:"])
+def test_parse_invalid_server_address(address):
+    """Tests parsing of malformed server addresses."""
+    with pytest.raises(ValueError):
+        parse_server_address(address)
+
+
+def test_unix_server_replaces_only_sockets(tmp_path):
+    """Tests that a stale socket is replaced while other files are kept."""
+    stale_socket = tmp_path / "stale.sock"
+    server = make_server(service=None, address=f"unix:{stale_socket}")
+    # Leaving the socket behind as a crashed server would
+    server.socket.close()
+    server = make_server(service=None, address=f"unix:{stale_socket}")
+    server.server_close()
+    assert not stale_socket.exists()
+
+    regular_file = tmp_path / "notes.txt"
+    regular_file.write_text("not a socket")
+    with pytest.raises(FileExistsError, match="is not a Unix socket"):
+        make_server(service=None, address=f"unix:{regular_file}")
+    assert regular_file.read_text() == "not a socket"
+
+
+def test_unix_server_keeps_live_sockets(tmp_path):
+    """Tests that the socket of a running server is neither replaced nor removed by another one."""
+    path = tmp_path / "server.sock"
+    old_server = make_server(service=None, address=f"unix:{path}")
+    # Leaving the socket behind as a crashed server would
+    old_server.socket.close()
+    server = make_server(service=None, address=f"unix:{path}")
+    with pytest.raises(FileExistsError, match="already running"):
+        make_server(service=None, address=f"unix:{path}")
+
+    # Closing the crashed server keeps the socket of the running one
+    old_server.server_close()
+    assert path.exists()
+    server.server_close()
+    assert not path.exists()
+
+
+@pytest.fixture(scope="module")
+def service():
+    """Returns a summarization service with 't5-small' model."""
+    summarizer = ArticleSummarizer(model_path="google-t5/t5-small")
+    service = SummarizationService(summarizer, max_batch_size=4)
+    yield service
+    service.close()
+
+
+@pytest.mark.parametrize("family", ["tcp", "unix"])
+def test_server(service, test_pdf_path, tmp_path, family):
+    """Tests summarization and keyword extraction jobs sent to the server."""
+    address = "127.0.0.1:0" if family == "tcp" else f"unix:{tmp_path / 'sock'}"
+    server = make_server(service=service, address=address)
+    if family == "tcp":
+        # Using the free port picked by the system
+        address = f"127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = SummarizationClient(address=address)
+    try:
+        response = client.summarize(
+            str(test_pdf_path), config=GENERATION_CONFIG
+        )
+        assert response["summary"]
+        assert response["stats"]["output_token_count"] > 0
+
+        response = client.summarize(
+            str(test_pdf_path),
+            config=GENERATION_CONFIG,
+            report={"filename": "report.txt", "save_folder": str(tmp_path)},
+        )
+        assert (tmp_path / "report.txt").exists()
+
+        keywords = client.extract_keywords(str(test_pdf_path))
+        assert isinstance(keywords, list)
+
+        # Checking errors reported by the server
+        with pytest.raises(RuntimeError, match="Missing field"):
+            client._request("POST", "/summarize", {"config": {}})
+        with pytest.raises(RuntimeError, match="txt"):
+            client.summarize(
+                str(test_pdf_path),
+                config=GENERATION_CONFIG,
+                report={"filename": "report.md"},
+            )
+        assert client.health()["requests"] >= 2
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    with pytest.raises(ConnectionError, match="not reachable"):
+        client.health()
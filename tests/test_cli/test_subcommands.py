@@ -4,10 +4,13 @@ from dataclasses import asdict
 import pytest
 
 from deep_compend.cli.subcommands import (
+    collect_pdf_paths,
     run_keyword_extraction,
+    run_keyword_extraction_many,
     run_summarization,
     run_text_extraction,
 )
+from deep_compend.extractors import CorpusIndex
 
 
 def test_run_text_extraction(test_pdf_path):
@@ -42,6 +45,52 @@ def test_run_keyword_extraction(
     assert all(len(k) >= min_kwrd_length for k in extracted_keywords)
 
 
+def test_run_keyword_extraction_many(test_pdf_path):
+    """Tests keyword extraction for several articles passed to `extract-keywords` subcommand."""
+    extracted_keywords = run_keyword_extraction_many(
+        pdf_paths=[str(test_pdf_path)] * 3,
+        lm="en_core_web_sm",
+        min_kwrd_length=3,
+        max_keywords_num=5,
+        batch_size=2,
+    )
+    assert len(extracted_keywords) == 3
+    assert extracted_keywords[0] == run_keyword_extraction(
+        pdf_path=str(test_pdf_path),
+        lm="en_core_web_sm",
+        min_kwrd_length=3,
+        max_keywords_num=5,
+    )
+    assert all(kwrds == extracted_keywords[0] for kwrds in extracted_keywords)
+
+
+def test_run_keyword_extraction_tfidf(test_pdf_path, tmp_path):
+    """Tests keyword extraction with TF-IDF engine updating the corpus index."""
+    extracted_keywords = run_keyword_extraction_many(
+        pdf_paths=[str(test_pdf_path)] * 2,
+        lm="en_core_web_sm",
+        min_kwrd_length=3,
+        max_keywords_num=5,
+        cache_dir=str(tmp_path),
+        engine="tfidf",
+    )
+    assert len(extracted_keywords) == 2
+    assert 0 < len(extracted_keywords[0]) <= 5
+    # Identical articles are indexed once
+    assert CorpusIndex(str(tmp_path / "idf")).num_docs == 1
+
+
+def test_collect_pdf_paths(tmp_path):
+    """Tests expanding directories into paths to PDF-files."""
+    for name in ["b.pdf", "a.pdf", "notes.txt"]:
+        (tmp_path / name).touch()
+    assert collect_pdf_paths([str(tmp_path), "c.pdf"]) == [
+        str(tmp_path / "a.pdf"),
+        str(tmp_path / "b.pdf"),
+        "c.pdf",
+    ]
+
+
 def test_run_summarization_no_report(default_config, test_pdf_path):
     """Tests summary generation for `summarize` subcommand without report generation."""
     default_config.filepath = str(test_pdf_path)
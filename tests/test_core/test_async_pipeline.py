@@ -0,0 +1,154 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from deep_compend.core.async_pipeline import AsyncSummarizationPipeline
+from deep_compend.core.configs import SummaryGenerationConfig
+
+GENERATION_CONFIG = SummaryGenerationConfig(
+    min_length=5, max_length=20, num_beams=2
+)
+
+
+@pytest.mark.parametrize(
+    "batch_size,max_pending,error_message",
+    [
+        (0, 16, "Batch size should be"),
+        (8, 0, "Maximum number of pending articles should be"),
+    ],
+)
+def test_invalid_pipeline_parameters(batch_size, max_pending, error_message):
+    """Tests pipeline creation with incorrect parameters."""
+    with pytest.raises(ValueError, match=error_message):
+        AsyncSummarizationPipeline(
+            summarizer=None, batch_size=batch_size, max_pending=max_pending
+        )
+
+
+@pytest.mark.parametrize(
+    "executor_class", [None, ThreadPoolExecutor, ProcessPoolExecutor]
+)
+def test_asummarize_many(summarizer, test_pdf_path, executor_class):
+    """Tests that asynchronous summaries match the batched ones."""
+    pdf_paths = [str(test_pdf_path)] * 5
+    expected = summarizer.summarize_many(pdf_paths, config=GENERATION_CONFIG)
+
+    executor = executor_class(max_workers=2) if executor_class else None
+    results = asyncio.run(
+        summarizer.asummarize_many(
+            pdf_paths,
+            config=GENERATION_CONFIG,
+            batch_size=2,
+            max_pending=3,
+            executor=executor,
+        )
+    )
+    if executor is not None:
+        executor.shutdown()
+
+    assert [r.summary for r in results] == [r.summary for r in expected]
+    # Checking that timings of preparation and generation are combined
+    assert {"extract", "tokenize", "generate"} <= set(
+        results[0].stats.stage_timings
+    )
+
+
+def test_asummarize_does_not_block_loop(summarizer, test_pdf_path):
+    """Tests that the event loop keeps running while articles are summarized."""
+    expected = summarizer.summarize(
+        str(test_pdf_path), config=GENERATION_CONFIG
+    )
+
+    async def summarize_and_tick():
+        """Summarizes articles concurrently while counting event loop ticks."""
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.001)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        summaries = await asyncio.gather(
+            *(
+                summarizer.asummarize(
+                    str(test_pdf_path), config=GENERATION_CONFIG
+                )
+                for _ in range(3)
+            )
+        )
+        ticker.cancel()
+
+        return summaries, ticks
+
+    summaries, ticks = asyncio.run(summarize_and_tick())
+    assert summaries == [expected] * 3
+    assert ticks > 0
+    assert summarizer.summary == expected
+
+
+def test_asummarize_aclose(summarizer, test_pdf_path):
+    """Tests that closing the summarizer stops the pipeline of its event loop."""
+
+    async def summarize_and_close():
+        async with summarizer:
+            summary = await summarizer.asummarize(
+                str(test_pdf_path), config=GENERATION_CONFIG
+            )
+            assert len(summarizer._async_pipelines) == 1
+        assert not summarizer._async_pipelines
+        assert summarizer._generation_executor is None
+
+        return summary
+
+    first = asyncio.run(summarize_and_close())
+    # Summarizing again in another event loop after closing
+    assert asyncio.run(summarize_and_close()) == first
+
+
+def test_pipeline_aclose_waits_for_prepared_articles(
+    summarizer, test_pdf_path
+):
+    """Tests that articles being prepared when closing starts are still summarized."""
+
+    async def close_while_preparing():
+        pipeline = AsyncSummarizationPipeline(summarizer)
+        summary = asyncio.create_task(
+            pipeline.summarize(str(test_pdf_path), config=GENERATION_CONFIG)
+        )
+        # Letting the article start its preparation
+        await asyncio.sleep(0)
+        closing = asyncio.create_task(pipeline.aclose())
+        await asyncio.sleep(0)
+        with pytest.raises(RuntimeError, match="being closed"):
+            await pipeline.submit(str(test_pdf_path))
+        await asyncio.wait_for(closing, timeout=60)
+
+        return (await asyncio.wait_for(summary, timeout=60)).summary
+
+    assert asyncio.run(close_while_preparing()) == summarizer.summarize(
+        str(test_pdf_path), config=GENERATION_CONFIG
+    )
+
+
+def test_asummarize_drops_closed_loops(summarizer, test_pdf_path):
+    """Tests that pipelines of closed event loops are not kept."""
+    for _ in range(3):
+        asyncio.run(
+            summarizer.asummarize(str(test_pdf_path), config=GENERATION_CONFIG)
+        )
+    assert len(summarizer._async_pipelines) == 1
+
+
+def test_pipeline_failed_article(summarizer, tmp_path):
+    """Tests that a failed article is reported and does not hold a slot."""
+
+    async def summarize_missing():
+        async with AsyncSummarizationPipeline(summarizer) as pipeline:
+            with pytest.raises(Exception):
+                await pipeline.summarize(str(tmp_path / "missing.pdf"))
+            return pipeline._slots._value
+
+    assert asyncio.run(summarize_missing()) == 16
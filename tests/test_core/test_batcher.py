@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from deep_compend.core.batcher import BatcherStatistics, MicroBatcher
+from deep_compend.core.configs import SummaryGenerationConfig
+
+
+@pytest.mark.parametrize(
+    "max_batch_size,max_wait,error_message",
+    [
+        (0, 0.01, "Batch size should be"),
+        (4, -1.0, "Waiting time should be"),
+    ],
+)
+def test_invalid_batcher_parameters(max_batch_size, max_wait, error_message):
+    """Tests micro-batcher creation with incorrect parameters."""
+    with pytest.raises(ValueError, match=error_message):
+        MicroBatcher(
+            summarizer=None, max_batch_size=max_batch_size, max_wait=max_wait
+        )
+
+
+def test_batcher_statistics():
+    """Tests the mean batch size of processed requests."""
+    assert BatcherStatistics().mean_batch_size == 0.0
+    assert BatcherStatistics(requests=6, batches=4).mean_batch_size == 1.5
+
+
+def test_batcher_summarize(summarizer, test_pdf_path):
+    """Tests that concurrent requests are summarized in shared batches."""
+    config = SummaryGenerationConfig(min_length=5, max_length=20, num_beams=2)
+    pdf_paths = [str(test_pdf_path)] * 4
+    expected = summarizer.summarize_many(pdf_paths, config=config)
+
+    with MicroBatcher(summarizer, max_batch_size=4, max_wait=0.5) as batcher:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda pdf_path: batcher.summarize(pdf_path, config),
+                    pdf_paths,
+                )
+            )
+
+    # Checking that batching does not change summaries
+    assert [r.summary for r in results] == [r.summary for r in expected]
+    assert batcher.stats.requests == 4
+    assert batcher.stats.batches < 4
+    # Checking that timings of preparation and generation are combined
+    assert {"extract", "generate"} <= set(results[0].stats.stage_timings)
+
+    # Checking that requests are rejected after the batcher is closed
+    with pytest.raises(RuntimeError, match="not running"):
+        batcher.submit(str(test_pdf_path))
@@ -0,0 +1,74 @@
+import pytest
+import torch
+from transformers import T5Config, T5ForConditionalGeneration
+
+from deep_compend.core.generation_metrics import (
+    GenerationMetrics,
+    GenerationMonitor,
+    format_generation_metrics,
+)
+
+
+def test_generation_metrics_aggregation():
+    """Tests that metrics of several calls are summed up, averaged or maximized."""
+    metrics = GenerationMetrics()
+    metrics.add(
+        GenerationMetrics(
+            generate_calls=1,
+            encoder_time=0.1,
+            decode_time=1.0,
+            time_to_first_token=0.2,
+            output_token_count=100,
+            rss_growth_mb=50.0,
+        )
+    )
+    metrics.add(
+        GenerationMetrics(
+            generate_calls=3,
+            encoder_time=0.3,
+            decode_time=3.0,
+            time_to_first_token=0.4,
+            output_token_count=500,
+            rss_growth_mb=40.0,
+        )
+    )
+    assert metrics.generate_calls == 4
+    assert metrics.encoder_time == pytest.approx(0.4)
+    assert metrics.time_to_first_token == pytest.approx(0.35)
+    assert metrics.decode_tokens_per_sec == pytest.approx(150.0)
+    assert metrics.rss_growth_mb == 50.0
+    assert metrics.peak_cuda_memory_mb is None
+    assert format_generation_metrics(metrics).startswith("150.0 tokens/sec")
+
+
+def test_generation_monitor_measures_generate_call():
+    """Tests that the monitor times the encoder and the first token without changing the output."""
+    torch.manual_seed(0)
+    model = T5ForConditionalGeneration(
+        T5Config(
+            vocab_size=64,
+            d_model=16,
+            d_ff=32,
+            d_kv=8,
+            num_layers=1,
+            num_heads=2,
+            decoder_start_token_id=0,
+        )
+    ).eval()
+    input_ids = torch.randint(1, 64, (2, 12))
+    generation_params = {"min_length": 5, "max_length": 5, "num_beams": 2}
+    expected = model.generate(input_ids, **generation_params)
+
+    with GenerationMonitor(model) as monitor:
+        output_ids = model.generate(
+            input_ids, **generation_params, logits_processor=[monitor]
+        )
+    metrics = monitor.metrics(output_token_count=output_ids.numel())
+
+    assert torch.equal(output_ids, expected)
+    assert metrics.generate_calls == 1
+    assert 0 < metrics.encoder_time < metrics.time_to_first_token
+    assert metrics.decode_tokens_per_sec > 0
+    assert metrics.rss_growth_mb is None or metrics.rss_growth_mb >= 0
+    # Hooks are removed once the call is measured
+    assert not model.get_encoder()._forward_hooks
@@ -0,0 +1,73 @@
+import pytest
+import torch
+
+from deep_compend.core.registry import ModelRegistry
+
+
+def fake_loader(model_path, tokenizer_path, lora_adapters_path, device, dtype):
+    """Returns a small model with 8 float parameters instead of loading one."""
+    return torch.nn.Linear(3, 2, bias=True), f"tokenizer-{tokenizer_path}"
+
+
+@pytest.fixture
+def registry():
+    """Returns a registry with a fake loader keeping at most 2 models."""
+    return ModelRegistry(max_models=2, loader=fake_loader)
+
+
+def test_registry_reuses_loaded_models(registry):
+    """Tests that the same key returns the same model instance."""
+    model_a, tokenizer_a = registry.get("model-a")
+    model_b, tokenizer_b = registry.get("model-a")
+    assert model_a is model_b
+    assert tokenizer_a == tokenizer_b == "tokenizer-model-a"
+    stats = registry.stats
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.hit_rate == 0.5
+    assert stats.memory_bytes == 8 * 4
+
+
+@pytest.mark.parametrize(
+    "other_kwargs",
+    [
+        {"tokenizer_path": "other-tokenizer"},
+        {"lora_adapters_path": "adapters"},
+        {"device": "meta"},
+        {"dtype": "float16"},
+    ],
+)
+def test_registry_key_components(registry, other_kwargs):
+    """Tests that every component of the key leads to a separate model."""
+    model_a, _ = registry.get("model-a")
+    model_b, _ = registry.get("model-a", **other_kwargs)
+    assert model_a is not model_b
+    assert registry.stats.misses == 2
+
+
+def test_registry_lru_eviction(registry):
+    """Tests eviction of the least recently used model."""
+    model_a, _ = registry.get("model-a")
+    registry.get("model-b")
+    # Using model "a" so that model "b" becomes the least recently used one
+    registry.get("model-a")
+    registry.get("model-c")
+    assert len(registry) == 2
+    assert registry.stats.evictions == 1
+    assert registry.get("model-a")[0] is model_a
+    assert registry.stats.misses == 3
+
+
+def test_registry_memory_limit():
+    """Tests eviction when the memory limit is exceeded."""
+    registry = ModelRegistry(
+        max_models=None, max_memory_bytes=70, loader=fake_loader
+    )
+    for name in ["a", "b", "c"]:
+        registry.get(name)
+    assert len(registry) == 2
+    registry.configure(max_models=1)
+    assert len(registry) == 1
+    registry.clear()
+    assert len(registry) == 0
+    assert registry.stats.evictions == 3
@@ -0,0 +1,66 @@
+import pytest
+
+from deep_compend.core.scheduler import (
+    BatchStatistics,
+    LengthBucketedScheduler,
+    SchedulerReport,
+)
+
+
+@pytest.mark.parametrize(
+    "lengths,token_budget,num_beams,max_batch_size,expected",
+    [
+        ([80, 500, 90, 510], 2048, 2, None, [[3, 1], [2, 0]]),
+        ([80, 500, 90, 510], 512, 1, None, [[3], [1], [2, 0]]),
+        ([100, 100, 100, 100], 10_000, 4, 3, [[0, 1, 2], [3]]),
+        ([1000], 10, 4, None, [[0]]),
+        ([], 1024, 4, None, []),
+    ],
+)
+def test_plan_batches(
+    lengths, token_budget, num_beams, max_batch_size, expected
+):
+    """Tests grouping of articles by length under the token budget."""
+    scheduler = LengthBucketedScheduler(
+        summarizer=None,
+        token_budget=token_budget,
+        max_batch_size=max_batch_size,
+    )
+    scheduler._lengths = lengths
+    batches = scheduler._plan_batches(num_beams=num_beams)
+    assert batches == expected
+    # Verifying that every article is scheduled exactly once
+    assert sorted(i for batch in batches for i in batch) == list(
+        range(len(lengths))
+    )
+
+
+def test_invalid_token_budget():
+    """Tests scheduler creation with incorrect token budget."""
+    with pytest.raises(ValueError, match="Token budget should be"):
+        LengthBucketedScheduler(summarizer=None, token_budget=0)
+
+
+def test_scheduler_report():
+    """Tests aggregated statistics of the scheduler report."""
+    report = SchedulerReport(
+        token_budget=1024,
+        batches=[
+            BatchStatistics(2, 150, 200, 40, 1.0),
+            BatchStatistics(1, 50, 50, 20, 1.0),
+        ],
+    )
+    assert report.padding_efficiency == 0.8
+    assert report.total_latency == 2.0
+    assert report.input_tokens_per_sec == 100.0
+    assert report.output_tokens_per_sec == 30.0
+    assert "Padding efficiency: 80.00%" in str(report)
+
+
+def test_scheduler_summarize(summarizer, test_pdf_path):
+    """Tests that scheduled summarization keeps the order of inputs."""
+    scheduler = LengthBucketedScheduler(summarizer=summarizer)
+    results = scheduler.summarize(pdf_paths=[str(test_pdf_path)] * 2)
+    assert [r.pdf_path for r in results] == [str(test_pdf_path)] * 2
+    assert scheduler.report is not None
+    assert scheduler.report.padding_efficiency == 1.0
@@ -2,6 +2,9 @@ import os
 
 import pytest
 
+from deep_compend.core import summarizer as summarizer_module
+from deep_compend.core.summarizer import ArticleSummarizer
+
 
 def test_summarization_output(summarizer):
     """Tests the output of `summarize` method and class attributes."""
@@ -46,3 +49,139 @@ def test_max_context_window(summarizer):
     """Tests the maximum context window for the loaded model."""
     max_context_window = summarizer._get_max_context_window()
     assert max_context_window == 512
+
+
+def test_summarize_many_matches_single_runs(summarizer, test_pdf_path):
+    """Tests that batched summarization keeps input order and per-article stats."""
+    summary = summarizer.summarize(pdf_path=str(test_pdf_path))
+    stats = summarizer._get_stats()
+    results = summarizer.summarize_many(
+        pdf_paths=[str(test_pdf_path)] * 3, batch_size=2
+    )
+    assert len(results) == 3
+    for result in results:
+        assert result.pdf_path == str(test_pdf_path)
+        assert result.summary == summary
+        assert result.stats == stats
+
+
+def test_summarize_many_invalid_batch_size(summarizer, test_pdf_path):
+    """Tests batched summarization with incorrect batch size."""
+    with pytest.raises(ValueError, match="Batch size should be"):
+        summarizer.summarize_many(pdf_paths=[str(test_pdf_path)], batch_size=0)
+
+
+def test_summarize_long_covers_full_text(summarizer, test_pdf_path):
+    """Tests map-reduce summarization of the full article text."""
+    summary = summarizer.summarize_long(
+        pdf_path=str(test_pdf_path), batch_size=2, num_workers=2
+    )
+    stats = summarizer._get_stats()
+    assert isinstance(summary, str)
+    assert len(summary.split()) > 5
+    # Verifying that the input is not truncated to the context window
+    assert stats.input_token_count > summarizer.context_window
+
+
+def test_summarize_in_memory_pdf(summarizer, test_pdf_path):
+    """Tests that summarizing PDF content held in memory matches summarizing the file."""
+    summary = summarizer.summarize(pdf_path=str(test_pdf_path))
+    in_memory_summary = summarizer.summarize(
+        pdf_path=test_pdf_path.read_bytes()
+    )
+    assert in_memory_summary == summary
+    assert summarizer.pdf_path == "<in-memory PDF>"
+
+
+def test_summarize_with_report_matches_sequential(
+    summarizer, test_pdf_path, tmp_path
+):
+    """Tests that the pipelined report mode matches summarizing and reporting one after another."""
+    summary = summarizer.summarize(pdf_path=str(test_pdf_path))
+    stats = summarizer._get_stats()
+    summarizer.generate_summary_report(
+        filename="sequential.txt", save_folder=str(tmp_path)
+    )
+
+    pipelined_summary = summarizer.summarize_with_report(
+        pdf_path=str(test_pdf_path),
+        filename="pipelined.txt",
+        save_folder=str(tmp_path),
+    )
+    assert pipelined_summary == summary
+    assert summarizer._get_stats() == stats
+    # Reports differ only in their IDs, generation time and stage timings
+    sequential, pipelined = [
+        (tmp_path / name)
+        .read_text()
+        .split("stage_timings:")[0]
+        .splitlines()[2:]
+        for name in ["sequential.txt", "pipelined.txt"]
+    ]
+    assert [
+        line for line in sequential if not line.startswith("Gen time")
+    ] == [line for line in pipelined if not line.startswith("Gen time")]
+    assert {"extract", "generate", "stats", "keywords", "write"} <= set(
+        summarizer.stage_timings
+    )
+
+
+def test_summarize_with_report_extracts_keywords_once(
+    summarizer, test_pdf_path, tmp_path, monkeypatch
+):
+    """Tests that the report reuses keywords of the pipelined stage without loading another extractor."""
+    created = []
+
+    class CountingKeywordsExtractor(summarizer_module.KeywordsExtractor):
+        def __init__(self, *args, **kwargs):
+            created.append(kwargs)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(
+        summarizer_module, "KeywordsExtractor", CountingKeywordsExtractor
+    )
+    summarizer.summarize_with_report(
+        pdf_path=str(test_pdf_path), save_folder=str(tmp_path)
+    )
+    assert len(created) == 1
+
+
+def test_stage_timings_in_stats_and_report(test_pdf_path, tmp_path):
+    """Tests that timings of stages are attached to statistics, passed to the callback and reported."""
+    received = []
+    summarizer = ArticleSummarizer(
+        model_path="google-t5/t5-small", timing_callback=received.append
+    )
+    summarizer.summarize(pdf_path=str(test_pdf_path))
+    stages = {"extract", "body-detect", "clean", "stats", "tokenize"}
+    stages |= {"generate", "decode", "prettify"}
+    assert set(summarizer._get_stats().stage_timings) == stages
+    assert received == [summarizer.stage_timings]
+
+    summarizer.generate_summary_report(
+        filename="report.txt", save_folder=str(tmp_path)
+    )
+    assert set(received[-1]) == stages | {"keywords", "write"}
+    report = (tmp_path / "report.txt").read_text()
+    timing_lines = (
+        report.split("stage_timings:\n")[1]
+        .split("generation_metrics:")[0]
+        .splitlines()
+    )
+    assert [line.split(":")[0].strip() for line in timing_lines] == list(
+        received[-1]
+    )[:-1]
+    assert all(" s wall, " in line for line in timing_lines)
+
+
+def test_generation_metrics_in_stats(summarizer, test_pdf_path):
+    """Tests that generation metrics are attached to statistics and aggregated over the run."""
+    generate_calls = summarizer.run_metrics.generate_calls
+    summarizer.summarize(pdf_path=str(test_pdf_path))
+    metrics = summarizer._get_stats().generation_metrics
+    assert metrics.generate_calls == 1
+    assert metrics.output_token_count == summarizer.output_token_count
+    assert 0 < metrics.encoder_time < metrics.time_to_first_token
+    assert metrics.decode_tokens_per_sec > 0
+    assert metrics.rss_growth_mb is None or metrics.rss_growth_mb >= 0
+    assert summarizer.run_metrics.generate_calls == generate_calls + 1
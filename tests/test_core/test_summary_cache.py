@@ -0,0 +1,104 @@
+import time
+
+import pytest
+
+from deep_compend.core.summary_cache import SummaryCache, path_fingerprint
+
+MODEL = {"model_path": "google-t5/t5-small", "lora_adapters_path": None}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Returns an empty summary cache."""
+    summary_cache = SummaryCache(path=str(tmp_path / "summaries.sqlite"))
+    yield summary_cache
+    summary_cache.close()
+
+
+@pytest.mark.parametrize(
+    "text,model,config",
+    [
+        ("Other text.", MODEL, {"num_beams": 4}),
+        (
+            "Some text.",
+            {**MODEL, "lora_adapters_path": "lora"},
+            {"num_beams": 4},
+        ),
+        ("Some text.", MODEL, {"num_beams": 2}),
+    ],
+)
+def test_make_key(text, model, config):
+    """Tests that text, model identity and config all change the key."""
+    key = SummaryCache.make_key("Some text.", MODEL, {"num_beams": 4})
+    assert key == SummaryCache.make_key("Some text.", MODEL, {"num_beams": 4})
+    assert key != SummaryCache.make_key(text, model, config)
+
+
+def test_path_fingerprint(tmp_path):
+    """Tests that rewriting files of a local model changes its fingerprint."""
+    (tmp_path / "model.safetensors").write_bytes(b"weights")
+    fingerprint = path_fingerprint(str(tmp_path))
+    assert fingerprint == path_fingerprint(str(tmp_path))
+
+    # Retraining the model into the same folder
+    (tmp_path / "model.safetensors").write_bytes(b"new weights")
+    assert path_fingerprint(str(tmp_path)) != fingerprint
+    assert path_fingerprint("google-t5/t5-small") is None
+    assert path_fingerprint(None) is None
+
+
+def test_cache_hit_and_miss(cache):
+    """Tests storing and looking up a summary."""
+    key = SummaryCache.make_key("Some text.", MODEL, {})
+    assert cache.get(key) is None
+    cache.put(key, summary="Summary.", stats={"word_count_summary": 2})
+    assert cache.get(key) == ("Summary.", {"word_count_summary": 2})
+    stats = cache.stats
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.entries == 1
+    assert "50.00% hit rate" in str(stats)
+
+
+def test_cache_persists_across_instances(cache):
+    """Tests reading summaries stored by another cache instance."""
+    cache.put("key", summary="Summary.", stats={})
+    other_cache = SummaryCache(path=str(cache.path))
+    assert other_cache.get("key") == ("Summary.", {})
+    other_cache.close()
+
+
+def test_cache_refresh(cache):
+    """Tests ignoring cached summaries in refresh mode."""
+    cache.put("key", summary="Old.", stats={})
+    cache.refresh = True
+    assert cache.get("key") is None
+    cache.put("key", summary="New.", stats={})
+    cache.refresh = False
+    assert cache.get("key") == ("New.", {})
+
+
+def test_cache_eviction_by_size(tmp_path):
+    """Tests eviction of least recently used entries exceeding the size limit."""
+    cache = SummaryCache(path=str(tmp_path / "s.sqlite"), max_size_bytes=25)
+    cache.put("a", summary="x" * 10, stats={})
+    cache.put("b", summary="y" * 10, stats={})
+    time.sleep(0.01)
+    # Using entry "a" so that entry "b" becomes the least recently used one
+    cache.get("a")
+    cache.put("c", summary="z" * 10, stats={})
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    cache.close()
+
+
+def test_cache_eviction_by_age(tmp_path):
+    """Tests treating entries older than the maximum age as missing."""
+    cache = SummaryCache(path=str(tmp_path / "s.sqlite"), max_age_seconds=0.01)
+    cache.put("a", summary="Summary.", stats={})
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    cache.evict()
+    assert cache.stats.entries == 0
+    cache.close()
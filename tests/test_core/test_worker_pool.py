@@ -0,0 +1,78 @@
+import pytest
+
+from deep_compend.core.configs import SummaryGenerationConfig
+from deep_compend.core.worker_pool import (
+    SummarizationWorkerPool,
+    partition_cores,
+)
+
+GENERATION_CONFIG = SummaryGenerationConfig(
+    min_length=5, max_length=20, num_beams=2
+)
+
+
+@pytest.mark.parametrize(
+    "num_workers,threads_per_worker,expected",
+    [
+        (1, None, [[0, 1, 2, 3, 4, 5, 6, 7]]),
+        (2, None, [[0, 1, 2, 3], [4, 5, 6, 7]]),
+        (3, None, [[0, 1], [2, 3], [4, 5]]),
+        (2, 2, [[0, 1], [2, 3]]),
+        (16, None, None),
+        (3, 3, None),
+    ],
+)
+def test_partition_cores(num_workers, threads_per_worker, expected):
+    """Tests splitting CPU cores into disjoint slices of workers."""
+    cores = list(range(8))
+    if expected is None:
+        with pytest.raises(ValueError, match="available cores"):
+            partition_cores(num_workers, threads_per_worker, cores=cores)
+    else:
+        assert (
+            partition_cores(num_workers, threads_per_worker, cores=cores)
+            == expected
+        )
+
+
+@pytest.mark.parametrize(
+    "num_workers,threads_per_worker,error_message",
+    [
+        (0, None, "Number of workers should be"),
+        (2, 0, "Number of threads per worker should be"),
+    ],
+)
+def test_invalid_partition_parameters(
+    num_workers, threads_per_worker, error_message
+):
+    """Tests splitting CPU cores with incorrect parameters."""
+    with pytest.raises(ValueError, match=error_message):
+        partition_cores(num_workers, threads_per_worker, cores=[0, 1])
+
+
+def test_worker_pool_summarization(summarizer, test_pdf_path):
+    """Tests that summaries of worker processes match the ones of a single process."""
+    pdf_paths = [str(test_pdf_path)] * 3
+    expected = summarizer.summarize_many(pdf_paths, config=GENERATION_CONFIG)
+
+    # Sharing cores between workers to run on machines with a single core
+    with SummarizationWorkerPool(
+        model_path=summarizer.model_path,
+        num_workers=2,
+        threads_per_worker=1,
+        pin_workers=False,
+        batch_size=2,
+    ) as pool:
+        assert len(pool.workers) == 2
+        assert all(worker.num_threads == 1 for worker in pool.workers)
+        results = pool.summarize_many(pdf_paths, config=GENERATION_CONFIG)
+        # Reporting a failed article without stopping the workers
+        [(_, result, error)] = pool.summarize_as_completed(
+            [("missing.pdf", GENERATION_CONFIG)]
+        )
+        assert result is None
+        assert "missing.pdf" in str(error)
+    assert [result.summary for result in results] == [
+        result.summary for result in expected
+    ]
+    assert pool.run_metrics.generate_calls > 0
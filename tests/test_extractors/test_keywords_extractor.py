@@ -65,3 +65,53 @@ def test_result_is_sorted_by_frequency():
     keywords = extractor.extract(text)
     assert isinstance(keywords, list)
     assert keywords[0] in ["ai", "biology", "finance", "data"]
+
+
+def test_pipeline_is_shared_and_minimal():
+    """Tests that extractors share a loaded model without unused components."""
+    first, second = KeywordsExtractor(), KeywordsExtractor(min_kwrd_length=5)
+    assert first.nlp is second.nlp
+    assert "parser" not in first.nlp.pipe_names
+    assert "lemmatizer" not in first.nlp.pipe_names
+    assert "ner" in first.nlp.pipe_names
+
+
+def test_extract_many_matches_extract(sample_text):
+    """Tests that batched extraction keeps input order and per-text keywords."""
+    texts = [sample_text, "Elon Musk and OpenAI developed ChatGPT.", ""]
+    extractor = KeywordsExtractor()
+    assert extractor.extract_many(texts, batch_size=2) == [
+        extractor.extract(text) for text in texts
+    ]
+
+
+def test_extract_many_invalid_batch_size(sample_text):
+    """Tests that the batch size should be positive."""
+    with pytest.raises(ValueError):
+        KeywordsExtractor().extract_many([sample_text], batch_size=0)
+
+
+def test_chunked_extraction_matches_whole_text(sample_text):
+    """Tests that keywords of a text processed in chunks match the whole one."""
+    text = " ".join(sample_text.split()) * 20
+    extractor = KeywordsExtractor(chunk_length=len(text) + 1)
+    chunked = KeywordsExtractor(chunk_length=300)
+    assert len(list(chunked._iter_chunks(text))) > 1
+    assert chunked.extract(text) == extractor.extract(text)
+
+
+@pytest.mark.parametrize("chunk_length", [7, 50, 1000])
+def test_chunks_are_bounded(tmp_path, chunk_length):
+    """Tests that chunks respect the chunk length and cover the whole text."""
+    import spacy
+
+    spacy.blank("en").to_disk(tmp_path / "blank_en")
+    extractor = KeywordsExtractor(
+        lm=str(tmp_path / "blank_en"), chunk_length=chunk_length
+    )
+    text = "Short one. A considerably longer sentence goes here! " * 30
+    text = text.strip() + " unbrokenwordlongerthanseven"
+    chunks = list(extractor._iter_chunks(text))
+    assert all(len(chunk) <= chunk_length for chunk in chunks)
+    # Only whitespace between chunks is dropped
+    assert "".join("".join(chunks).split()) == "".join(text.split())
@@ -1,4 +1,11 @@
-from deep_compend.extractors import PDFExtractor
+import io
+import mmap
+
+import fitz
+import pytest
+
+from deep_compend.extractors import PDFExtractor, TextCache
+from deep_compend.utils.timing import StageTimer
 
 
 def test_pdf_extractor_returns_text(test_pdf_path):
@@ -8,3 +15,102 @@ def test_pdf_extractor_returns_text(test_pdf_path):
 
     assert isinstance(text, str)
     assert len(text) > 200
+
+
+@pytest.mark.parametrize(
+    "pages",
+    [
+        ["Title", "1 Introduction\nBody", "text", "References\n[1] Doe."],
+        ["Title\n2.", "Introduction\nBody", "References", "Appendix"],
+        ["No heading", "Body", "References\n[1] Doe.", "Appendix"],
+        ["Introduction\nBody", "", "text without references"],
+        [
+            "Contents\nReferences 3",
+            "1 Introduction\nBody text of the article.",
+            "References\n[1] Doe.",
+        ],
+    ],
+)
+def test_streaming_matches_whole_document(tmp_path, pages):
+    """Tests that streaming extraction selects the same text as reading all pages."""
+    pdf_path = tmp_path / "article.pdf"
+    doc = fitz.open()
+    for page_text in pages:
+        doc.new_page().insert_text((72, 72), page_text)
+    doc.save(str(pdf_path))
+    doc.close()
+
+    extractor = PDFExtractor(str(pdf_path))
+    expected = extractor._extract_body_text(
+        extractor._extract_raw_text_from_pdf()
+    )
+    assert extractor._stream_body_text() == expected
+
+
+def test_parallel_extraction_matches_in_process(tmp_path):
+    """Tests that page texts extracted by worker processes are put back in order."""
+    pdf_path = tmp_path / "article.pdf"
+    doc = fitz.open()
+    for i in range(40):
+        heading = "Introduction\n" if i == 3 else ""
+        heading = "References\n" if i == 30 else heading
+        doc.new_page().insert_text((72, 72), f"{heading}Page {i} text.")
+    doc.save(str(pdf_path))
+    doc.close()
+
+    expected = PDFExtractor(str(pdf_path)).retrieve_processed_text()
+    extractor = PDFExtractor(
+        str(pdf_path), num_workers=2, parallel_threshold=10
+    )
+    assert extractor._extract_raw_text_from_pdf().count("Page") == 40
+    assert extractor.retrieve_processed_text() == expected
+
+
+def test_extraction_stages_are_timed(tmp_path):
+    """Tests that extraction, body detection and cleaning are measured by the timer."""
+    pdf_path = tmp_path / "article.pdf"
+    doc = fitz.open()
+    for page_text in ["Title\nIntroduction\nBody", "More text", "References"]:
+        doc.new_page().insert_text((72, 72), page_text)
+    doc.save(str(pdf_path))
+    doc.close()
+
+    timer = StageTimer()
+    PDFExtractor(str(pdf_path), timer=timer).retrieve_processed_text()
+    assert set(timer.timings) == {"extract", "body-detect", "clean"}
+    # Page texts are extracted up to the references section
+    assert timer.timings["extract"].calls >= 3
+
+
+def test_invalid_num_workers():
+    """Tests that the number of workers should be positive."""
+    with pytest.raises(ValueError):
+        PDFExtractor("article.pdf", num_workers=0)
+
+
+@pytest.mark.parametrize(
+    "source_type",
+    ["bytes", "bytearray", "memoryview", "bytesio", "file", "mmap"],
+)
+def test_in_memory_sources(tmp_path, source_type):
+    """Tests that PDF content held in memory gives the same text as the file."""
+    pdf_path = tmp_path / "article.pdf"
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Title\nIntroduction\nBody text.")
+    doc.save(str(pdf_path))
+    doc.close()
+
+    expected = PDFExtractor(str(pdf_path)).retrieve_processed_text()
+    cache = TextCache(str(tmp_path / "texts"))
+    with open(pdf_path, "rb") as f:
+        source = {
+            "bytes": lambda: pdf_path.read_bytes(),
+            "bytearray": lambda: bytearray(pdf_path.read_bytes()),
+            "memoryview": lambda: memoryview(pdf_path.read_bytes()),
+            "bytesio": lambda: io.BytesIO(pdf_path.read_bytes()),
+            "file": lambda: f,
+            "mmap": lambda: mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ),
+        }[source_type]()
+        extractor = PDFExtractor(source, text_cache=cache)
+        assert extractor.retrieve_processed_text() == expected
+        assert extractor.retrieve_processed_text() == expected
@@ -0,0 +1,78 @@
+import os
+
+import fitz
+import pytest
+
+from deep_compend.extractors import PDFExtractor, TextCache, pdf_extractor
+
+ARTICLE = (
+    "Title\n1 Introduction\nDeep networks are hard to train [3].\n"
+    "Residual learning helps (Doe et al., 2020).\nReferences\n[1] Doe."
+)
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    """Creates a small PDF-article."""
+    path = tmp_path / "article.pdf"
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), ARTICLE)
+    doc.save(str(path))
+    doc.close()
+
+    return str(path)
+
+
+@pytest.mark.parametrize("hash_content", [False, True])
+def test_cached_text_matches_extracted(tmp_path, pdf_path, hash_content):
+    """Tests that a cached text is identical to a freshly extracted one."""
+    cache = TextCache(str(tmp_path / "texts"), hash_content=hash_content)
+    expected = PDFExtractor(pdf_path).retrieve_processed_text()
+
+    extractor = PDFExtractor(pdf_path, text_cache=cache)
+    assert extractor.retrieve_processed_text() == expected
+    assert len(list(cache.cache_dir.glob("*/*.txt.gz"))) == 1
+    assert extractor.retrieve_processed_text() == expected
+
+
+def test_cache_is_used(tmp_path, pdf_path, monkeypatch):
+    """Tests that the PDF-file is not parsed again on a cache hit."""
+    cache = TextCache(str(tmp_path / "texts"))
+    PDFExtractor(pdf_path, text_cache=cache).retrieve_processed_text()
+
+    monkeypatch.setattr(PDFExtractor, "_process_text", lambda self: "stale")
+    text = PDFExtractor(pdf_path, text_cache=cache).retrieve_processed_text()
+    assert text != "stale"
+
+
+def test_cache_invalidation(tmp_path, pdf_path, monkeypatch):
+    """Tests that modifying a file, extraction patterns or cleaning code changes the key."""
+    cache = TextCache(str(tmp_path / "texts"))
+    extractor = PDFExtractor(pdf_path, text_cache=cache)
+    key = cache.make_key(pdf_path, extractor._get_version())
+
+    extractor.references_pattern = extractor.intro_pattern
+    assert key != cache.make_key(pdf_path, extractor._get_version())
+
+    key = cache.make_key(pdf_path, extractor._get_version())
+    monkeypatch.setattr(
+        pdf_extractor, "CLEANING_FINGERPRINT", "version 0\nlegacy rules"
+    )
+    assert key != cache.make_key(pdf_path, extractor._get_version())
+
+    stat = os.stat(pdf_path)
+    os.utime(pdf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert key != cache.make_key(
+        pdf_path, PDFExtractor(pdf_path)._get_version()
+    )
+
+
+def test_clear(tmp_path):
+    """Tests removal of all cached texts."""
+    cache = TextCache(str(tmp_path / "texts"))
+    cache.put("ab" * 32, "Some text.")
+    assert cache.get("ab" * 32) == "Some text."
+
+    cache.clear()
+    assert cache.get("ab" * 32) is None
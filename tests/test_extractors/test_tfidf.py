@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from deep_compend.extractors import CorpusIndex, KeywordsExtractor
+from deep_compend.extractors.tfidf import count_words, extract_tfidf_keywords
+
+CORPUS = [
+    "Residual networks ease training of deep networks.",
+    "Attention networks replace recurrence in translation.",
+    "Diffusion networks generate images from noise.",
+]
+
+
+def test_count_words():
+    """Tests counting words without stop words, digits and short words."""
+    counts = count_words("The ResNet-50 model, the model and a café.", 3)
+    assert list(counts.items()) == [("resnet", 1), ("model", 2), ("café", 1)]
+
+
+def test_index_persistence(tmp_path):
+    """Tests that document frequencies survive saving and incremental updates."""
+    index = CorpusIndex(str(tmp_path / "idf"))
+    assert index.add_many(CORPUS) == 3
+    assert not index.add(CORPUS[0])
+    index.save()
+
+    index = CorpusIndex(str(tmp_path / "idf"))
+    assert index.num_docs == 3
+    assert isinstance(index._df, np.memmap)
+    assert index.document_frequencies(
+        ["networks", "residual", "gan"]
+    ).tolist() == [3, 1, 0]
+
+    index.add("Generative adversarial networks.")
+    assert index.document_frequencies(
+        ["networks", "adversarial"]
+    ).tolist() == [4, 1]
+    index.save()
+    assert len(list((tmp_path / "idf").glob("df-*.npy"))) == 1
+    assert CorpusIndex(str(tmp_path / "idf")).num_docs == 4
+
+
+def test_idf_demotes_common_words(tmp_path):
+    """Tests that words frequent across the corpus are ranked below specific ones."""
+    text = "Networks networks networks residual residual."
+    assert extract_tfidf_keywords(text) == ["networks", "residual"]
+
+    index = CorpusIndex(str(tmp_path / "idf"))
+    index.add_many(CORPUS)
+    assert extract_tfidf_keywords(text, index=index) == [
+        "residual",
+        "networks",
+    ]
+
+
+def test_tfidf_engine(tmp_path):
+    """Tests keyword extraction with TF-IDF engine without a language model."""
+    index = CorpusIndex(str(tmp_path / "idf"))
+    index.add_many(CORPUS)
+    extractor = KeywordsExtractor(
+        engine="tfidf", idf_index=index, min_kwrd_length=5, most_common_elems=2
+    )
+    assert extractor.nlp is None
+
+    keywords = extractor.extract_many(CORPUS + [""])
+    assert keywords == [extractor.extract(text) for text in CORPUS + [""]]
+    assert keywords[0] == ["networks", "residual"]
+    assert keywords[-1] == []
+
+
+def test_invalid_engine():
+    """Tests that only supported keyword engines are accepted."""
+    with pytest.raises(ValueError):
+        KeywordsExtractor(engine="rake")
@@ -0,0 +1,21 @@
+import pytest
+
+from deep_compend.text_preprocessing import pack_sentences
+
+
+@pytest.mark.parametrize(
+    "sentences,lengths,max_length,expected",
+    [
+        (["A.", "B.", "C."], [1, 1, 1], 2, ["A. B.", "C."]),
+        (["A.", "B.", "C."], [1, 1, 1], 10, ["A. B. C."]),
+        (["A.", "Long one.", "C."], [1, 5, 1], 3, ["A.", "Long one.", "C."]),
+        (["A.", "B."], [2, 2], 1, ["A.", "B."]),
+        ([], [], 5, []),
+    ],
+)
+def test_pack_sentences(sentences, lengths, max_length, expected):
+    """Tests packing sentences into chunks of bounded length."""
+    chunks = pack_sentences(
+        sentences=sentences, lengths=lengths, max_length=max_length
+    )
+    assert chunks == expected
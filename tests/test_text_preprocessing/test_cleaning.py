@@ -1,6 +1,10 @@
+import random
+import re
+
 import pytest
 
-from deep_compend.text_preprocessing import clean_text
+from deep_compend.text_preprocessing import TextCleaner, clean_text
+from deep_compend.text_preprocessing.cleaning import CLEANING_RULES
 
 
 @pytest.mark.parametrize(
@@ -35,3 +39,74 @@ def test_clean_text(input, output):
     """Tests the text cleaning function."""
     cleaned = clean_text(input)
     assert cleaned == output
+
+
+# Fragments of texts generated for comparing cleaning with the sequential rules
+FRAGMENTS = [
+    "[",
+    "]",
+    "(",
+    ")",
+    "1",
+    "23",
+    "2020",
+    ",",
+    ".",
+    "!",
+    "?",
+    ";",
+    " ",
+    "  ",
+    "\n",
+    "\t",
+    "\x0b",
+    " ",
+    "word",
+    "Doe",
+    "Smith",
+    " et al.",
+    "et al.",
+    "al.",
+    "X",
+    "é",
+]
+
+
+# Whitespace rules of the original implementation applied after the citation rules
+WHITESPACE_RULES = [(r"\s{2,}", " "), (r"\s+", " "), (r"\s+([.,!?])", r"\1")]
+
+
+def clean_text_sequentially(text: str) -> str:
+    """Cleans a text applying the cleaning rules one after another."""
+    for pattern, replacement in [*CLEANING_RULES, *WHITESPACE_RULES]:
+        text = re.sub(pattern, replacement, text)
+
+    return text.strip()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_clean_text_matches_sequential_rules(seed):
+    """Tests that cleaning random texts gives the same output as the sequential rules."""
+    rng = random.Random(seed)
+    for _ in range(500):
+        text = "".join(rng.choices(FRAGMENTS, k=rng.randint(0, 40)))
+        expected = clean_text_sequentially(text)
+        assert clean_text(text) == expected
+
+        # Splitting the text into chunks at random positions
+        cuts = sorted(rng.choices(range(len(text) + 1), k=rng.randint(0, 5)))
+        cleaner = TextCleaner()
+        cleaned = [
+            cleaner.feed(text[start:end])
+            for start, end in zip([0, *cuts], [*cuts, len(text)])
+        ]
+        cleaned.append(cleaner.finish())
+        assert "".join(cleaned) == expected
+
+
+def test_citation_split_across_chunks():
+    """Tests that citations split across chunks are removed."""
+    cleaner = TextCleaner()
+    chunks = ["Shown before [1,", " 2] and (Doe et", " al., 20", "20) .\n"]
+    cleaned = "".join(cleaner.feed(chunk) for chunk in chunks)
+    assert cleaned + cleaner.finish() == "Shown before and."
@@ -0,0 +1,62 @@
+import pstats
+from concurrent.futures import ThreadPoolExecutor
+
+import torch
+
+from deep_compend.utils.profiling import Profiler
+
+
+def test_profiler_saves_python_profile(tmp_path):
+    """Tests that the Python profile is saved and its hotspots are listed."""
+    profiler = Profiler(output_dir=str(tmp_path), name="run", top_n=5)
+    with profiler.profile():
+        sorted(range(100_000), key=lambda x: -x)
+
+    assert profiler.saved_files == [tmp_path / "run.prof"]
+    assert pstats.Stats(str(tmp_path / "run.prof")).total_calls > 0
+    summary = profiler.summary()
+    assert "Top 5 functions by self time:" in summary
+    assert "PyTorch operators" not in summary
+
+
+def _sort_descending():
+    """Sorts numbers in a thread other than the profiled one."""
+    return sorted(range(100_000), key=lambda x: -x)
+
+
+def test_profiler_merges_wrapped_threads(tmp_path):
+    """Tests that functions run by other threads are profiled once wrapped."""
+    profiler = Profiler(output_dir=str(tmp_path), name="run")
+    with profiler.profile(), ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(profiler.wrap(_sort_descending)).result()
+        profiler.skip("page extraction")
+
+    functions = {
+        function
+        for _, _, function in pstats.Stats(str(tmp_path / "run.prof")).stats
+    }
+    assert "_sort_descending" in functions
+    assert profiler.summary().endswith(
+        "Not profiled (run by other processes): page extraction"
+    )
+    # Calls made outside of profiling are not profiled
+    assert profiler.wrap(_sort_descending)()[0] == 99_999
+
+
+def test_profiler_traces_generation(tmp_path):
+    """Tests that PyTorch traces are saved only when enabled."""
+    matrix = torch.rand(64, 64)
+    profiler = Profiler(output_dir=str(tmp_path), name="run")
+    with profiler.generation():
+        matrix @ matrix
+    assert profiler.saved_files == []
+
+    profiler = Profiler(
+        output_dir=str(tmp_path), name="run", trace_generation=True
+    )
+    with profiler.profile():
+        for _ in range(2):
+            with profiler.generation():
+                matrix @ matrix
+    assert (tmp_path / "run-generate-2.json").exists()
+    assert "aten::mm" in profiler.summary()
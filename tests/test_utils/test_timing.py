@@ -0,0 +1,35 @@
+import threading
+
+from deep_compend.utils.timing import StageTimer, format_timings
+
+
+def test_stage_timer_accumulates_repeated_stages():
+    """Tests that time of repeated stages is summed up in the order of first measurement."""
+    timer = StageTimer()
+    for stage in ["extract", "clean", "extract"]:
+        with timer.measure(stage):
+            sum(range(10_000))
+    assert list(timer.timings) == ["extract", "clean"]
+    assert timer.timings["extract"].calls == 2
+    assert timer.timings["clean"].calls == 1
+    for timing in timer.timings.values():
+        assert timing.wall_time > 0
+        assert timing.cpu_time >= 0
+    assert format_timings(timer.timings).startswith("extract: ")
+
+
+def test_stage_timer_measures_concurrent_threads():
+    """Tests that stages measured from several threads are all counted."""
+    timer = StageTimer()
+
+    def measure():
+        for _ in range(100):
+            with timer.measure("keywords"):
+                pass
+
+    threads = [threading.Thread(target=measure) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert timer.timings["keywords"].calls == 400